@@ -0,0 +1,226 @@
+# backend/app/core/admin.py
+
+"""
+Router مدیریتی (/admin)
+
+مسئولیت این فایل:
+- endpoint های عیب‌یابی Worker در حال اجرا (پروفایلر، حافظه)
+- وضعیت و همگام‌سازی دستی Snapshot محلی
+- فقط برای کاربران ADMIN_USERS (require_admin)
+
+نکته:
+    هر Worker (Process) پروفایلر خودش را دارد؛
+    درخواست به هر Worker که برسد، همان Worker پروفایل می‌شود.
+"""
+
+import asyncio
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from app.core import memory, profiler, snapshot
+from app.core.auth import AuthenticatedUser, require_admin
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import TimedRoute
+
+logger = get_logger(__name__)
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_admin)],
+    route_class=TimedRoute
+)
+
+
+# ======================================================
+# Sampling Profiler
+# ======================================================
+
+@router.post("/profiler/start", status_code=202)
+def start_profiler(
+    seconds: float = Query(10, gt=0),
+    requests: Optional[int] = Query(None, gt=0),
+    route: Optional[str] = Query(None),
+    include_idle: bool = Query(False),
+    user: AuthenticatedUser = Depends(require_admin)
+):
+    """
+    شروع پروفایل
+
+    - فقط seconds: همه Thread ها برای N ثانیه
+    - requests (+ route): فقط N درخواست بعدی که مسیرشان با route شروع شود
+      (seconds حداکثر زمان انتظار است)
+
+    نتیجه: GET /admin/profiler/result
+    """
+    logger.info(
+        "User [%s] started profiler (seconds=%s, requests=%s, route=%s)",
+        user.username, seconds, requests, route
+    )
+
+    try:
+        return profiler.start_profile(
+            seconds=seconds,
+            requests=requests,
+            route=route,
+            include_idle=include_idle
+        )
+    except profiler.ProfilerError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+
+
+@router.get("/profiler/profile", response_class=PlainTextResponse)
+async def run_profiler(
+    seconds: float = Query(10, gt=0),
+    include_idle: bool = Query(False),
+    user: AuthenticatedUser = Depends(require_admin)
+):
+    """
+    پروفایل N ثانیه‌ای و برگرداندن مستقیم Collapsed Stack
+
+    استفاده:
+        curl ".../admin/profiler/profile?seconds=20" > hr.folded
+        flamegraph.pl hr.folded > hr.svg
+    """
+    logger.info(
+        "User [%s] profiled worker for %s seconds", user.username, seconds
+    )
+
+    try:
+        profiler.start_profile(seconds=seconds, include_idle=include_idle)
+    except profiler.ProfilerError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+
+    while not profiler.wait_profile(0):
+        await asyncio.sleep(0.2)
+
+    return PlainTextResponse(profiler.collapsed_stacks())
+
+
+@router.get("/profiler")
+def get_profiler_status():
+    """
+    وضعیت آخرین پروفایل
+    """
+    return {
+        "profile": profiler.profile_status(),
+    }
+
+
+@router.get("/profiler/result", response_class=PlainTextResponse)
+def get_profiler_result():
+    """
+    Collapsed Stack آخرین پروفایل (اگر هنوز در حال اجراست، نتیجه تا این لحظه)
+    """
+    if profiler.profile_status() is None:
+        raise HTTPException(status_code=404, detail="پروفایلی اجرا نشده است")
+
+    return PlainTextResponse(profiler.collapsed_stacks())
+
+
+@router.post("/profiler/stop")
+def stop_profiler():
+    """
+    توقف زودتر پروفایل جاری
+    """
+    status = profiler.stop_profile()
+    if status is None:
+        raise HTTPException(status_code=404, detail="پروفایلی اجرا نشده است")
+    return status
+
+
+# ======================================================
+# Memory
+# ======================================================
+
+@router.get("/memory")
+def get_memory_report(
+    top: int = Query(20, gt=0, le=200),
+    group_by: Literal["lineno", "filename"] = Query("lineno")
+):
+    """
+    گزارش حافظه این Worker
+
+    - caches: حافظه تقریبی هر Cache (همیشه)
+    - routes: Peak حافظه درخواست‌ها به ازای هر Route (با tracemalloc)
+    - top_sites: پرمصرف‌ترین محل‌های تخصیص (با tracemalloc)
+    - growth_since_baseline: رشد نسبت به Baseline (POST /admin/memory/baseline)
+    """
+    return memory.memory_report(top=top, group_by=group_by)
+
+
+@router.post("/memory/tracing")
+def set_memory_tracing(
+    enable: bool = Query(...),
+    user: AuthenticatedUser = Depends(require_admin)
+):
+    """
+    روشن / خاموش کردن tracemalloc در زمان اجرا
+    """
+    logger.info("User [%s] set memory tracing to %s", user.username, enable)
+
+    if enable:
+        memory.start_tracing()
+    else:
+        memory.stop_tracing()
+        memory.reset_route_memory_stats()
+
+    return {"tracing": memory.is_tracing()}
+
+
+@router.post("/memory/baseline")
+def set_memory_baseline():
+    """
+    ذخیره وضعیت فعلی حافظه برای مقایسه (growth_since_baseline)
+    """
+    if not memory.is_tracing():
+        raise HTTPException(
+            status_code=409,
+            detail="ردیابی حافظه خاموش است (POST /admin/memory/tracing)"
+        )
+
+    memory.set_baseline()
+    return {"baseline": True}
+
+
+# ======================================================
+# Snapshot محلی
+# ======================================================
+
+@router.get("/snapshot")
+def get_snapshot_status():
+    """
+    وضعیت Snapshot: سن هر منبع، تعداد خواندن محلی / SQL Server / قدیمی
+    """
+    return snapshot.snapshot_status()
+
+
+@router.post("/snapshot/sync")
+def sync_snapshot(
+    source: Optional[str] = Query(None),
+    user: AuthenticatedUser = Depends(require_admin)
+):
+    """
+    همگام‌سازی فوری Snapshot (همه منابع یا فقط source)
+    """
+    if not settings.SNAPSHOT_ENABLED:
+        raise HTTPException(
+            status_code=409,
+            detail="Snapshot غیرفعال است (SNAPSHOT_ENABLED)"
+        )
+
+    logger.info(
+        "User [%s] requested snapshot sync (%s)",
+        user.username, source or "all"
+    )
+
+    if source is None:
+        return snapshot.sync_all(force=True)
+
+    try:
+        return [snapshot.sync_source(source, force=True)]
+    except KeyError:
+        raise HTTPException(status_code=404, detail="منبع Snapshot یافت نشد")
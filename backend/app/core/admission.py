@@ -0,0 +1,291 @@
+# backend/app/core/admission.py
+
+"""
+این فایل مسئول:
+- کنترل پذیرش درخواست‌ها (Admission Control) به ازای هر دسته Route
+    directory → خواندن کاربران، سمت‌ها، View ها
+    sp        → Stored Procedure ها
+    export    → Export / Import حجیم
+- تنظیم خودکار سقف همزمانی بر اساس زمان دیتابیس (AIMD)
+- صف کوتاه با زمان انتظار محدود، سپس رد درخواست (503 + Retry-After)
+
+چرا لازم است؟
+- وقتی SQL Server کند می‌شود، درخواست‌ها در Thread Pool و صف IIS
+  انباشته می‌شوند و در نهایت همه با هم Timeout می‌خورند
+- با سقف همزمانی، درخواست‌های اضافه سریع رد می‌شوند و
+  زمان پاسخ درخواست‌های پذیرفته‌شده محدود می‌ماند
+
+AIMD (مثل کنترل ازدحام TCP):
+    زمان دیتابیس درخواست ≤ هدف → سقف آرام بالا می‌رود (+1 در هر دور کامل)
+    زمان دیتابیس درخواست > هدف → سقف ضرب در ADMISSION_DECREASE_FACTOR
+    (حداکثر یک بار در هر بازه هدف، تا درخواست‌های همزمان
+     یک ازدحام را چند بار حساب نکنند)
+
+نکته:
+    همه کارها روی Event Loop انجام می‌شود (بدون Lock)؛
+    هر Worker سقف‌های خودش را دارد.
+"""
+
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import current_timings, record_timing
+
+logger = get_logger(__name__)
+
+
+# ======================================================
+# یک دسته Route
+# ======================================================
+class _RouteClass:
+
+    def __init__(self, name: str, max_limit: int, target_sec: float):
+        self.name = name
+        self.max_limit = max_limit
+        self.min_limit = min(settings.ADMISSION_MIN_CONCURRENCY, max_limit)
+        self.target_sec = target_sec
+
+        self.limit = float(max_limit)
+        self.inflight = 0
+        self.waiters: deque = deque()
+        self.last_decrease = 0.0
+        self.latency_ewma = target_sec / 2
+
+        self.admitted = 0
+        self.queued_total = 0
+        self.shed = 0
+        self.timeouts = 0
+
+    # --------------------------------------------------
+    # گرفتن / آزاد کردن ظرفیت
+    # --------------------------------------------------
+    def _has_capacity(self) -> bool:
+        return self.inflight < max(int(self.limit), self.min_limit)
+
+    async def acquire(self) -> bool:
+        """
+        False → درخواست باید رد شود
+        """
+        if self._has_capacity() and not self.waiters:
+            self.inflight += 1
+            self.admitted += 1
+            return True
+
+        if len(self.waiters) >= settings.ADMISSION_MAX_QUEUE:
+            self.shed += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        self.queued_total += 1
+        started = time.perf_counter()
+
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(waiter),
+                settings.ADMISSION_QUEUE_TIMEOUT_MS / 1000
+            )
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if waiter.done() and not waiter.cancelled():
+                # همزمان با Timeout ظرفیت داده شد → پس دادن
+                self.release(None)
+            else:
+                waiter.cancel()
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            self.timeouts += 1
+            self.shed += 1
+            return False
+        finally:
+            if waiter in self.waiters:
+                self.waiters.remove(waiter)
+            record_timing("queue", time.perf_counter() - started)
+
+        self.admitted += 1
+        return True
+
+    def release(self, latency: Optional[float]):
+        self.inflight -= 1
+        if latency is not None:
+            self._adjust(latency)
+
+        # بیدار کردن منتظرها به اندازه ظرفیت آزاد
+        while self.waiters and self._has_capacity():
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                self.inflight += 1
+                waiter.set_result(True)
+
+    # --------------------------------------------------
+    # AIMD
+    # --------------------------------------------------
+    def _adjust(self, latency: float):
+        self.latency_ewma += 0.2 * (latency - self.latency_ewma)
+
+        if latency <= self.target_sec:
+            self.limit = min(self.limit + 1 / self.limit, self.max_limit)
+            return
+
+        now = time.monotonic()
+        if now - self.last_decrease < self.target_sec:
+            return
+        self.last_decrease = now
+
+        previous = self.limit
+        self.limit = max(
+            self.limit * settings.ADMISSION_DECREASE_FACTOR,
+            self.min_limit
+        )
+        if int(previous) != int(self.limit):
+            logger.warning(
+                "Admission [%s]: latency %.0f ms > %.0f ms, limit %s → %s",
+                self.name, latency * 1000, self.target_sec * 1000,
+                int(previous), int(self.limit)
+            )
+
+    def retry_after(self) -> int:
+        """
+        تخمین زمان خالی شدن صف (ثانیه، بین 1 و 30)
+        """
+        seconds = (
+            self.latency_ewma * (len(self.waiters) + 1) / max(self.limit, 1)
+        )
+        return min(max(math.ceil(seconds), 1), 30)
+
+    def status(self) -> Dict:
+        return {
+            "limit": int(self.limit),
+            "max_limit": self.max_limit,
+            "inflight": self.inflight,
+            "queued": len(self.waiters),
+            "latency_ewma_ms": round(self.latency_ewma * 1000, 1),
+            "target_ms": round(self.target_sec * 1000),
+            "admitted": self.admitted,
+            "queued_total": self.queued_total,
+            "shed": self.shed,
+            "queue_timeouts": self.timeouts,
+        }
+
+
+# ======================================================
+# دسته‌بندی Route ها
+# ======================================================
+_classes: Dict[str, _RouteClass] = {}
+
+
+def _route_class(path: str) -> Optional[_RouteClass]:
+    """
+    طولانی‌ترین پیشوند منطبق در ADMISSION_ROUTE_CLASSES
+
+    دسته خالی ("") → بدون کنترل پذیرش
+    """
+    best = None
+    for prefix, name in settings.ADMISSION_ROUTE_CLASSES.items():
+        if path.startswith(prefix) and (
+            best is None or len(prefix) > len(best[0])
+        ):
+            best = (prefix, name)
+    if best is None or not best[1]:
+        return None
+
+    name = best[1]
+    route_class = _classes.get(name)
+    if route_class is None:
+        route_class = _classes[name] = _RouteClass(
+            name,
+            settings.ADMISSION_MAX_CONCURRENCY.get(name, 32),
+            settings.ADMISSION_TARGET_LATENCY_MS.get(name, 1000) / 1000
+        )
+    return route_class
+
+
+def admission_status() -> Dict:
+    """
+    وضعیت دسته‌ها (برای /health)
+    """
+    if not settings.ADMISSION_ENABLED:
+        return {"enabled": False}
+    return {
+        "enabled": True,
+        "classes": {name: c.status() for name, c in _classes.items()},
+    }
+
+
+def reset_admission():
+    _classes.clear()
+
+
+# ======================================================
+# Middleware (ASGI خالص)
+# ======================================================
+_SHED_BODY = json.dumps(
+    {"detail": "سرور در حال حاضر شلوغ است؛ کمی بعد دوباره تلاش کنید"},
+    ensure_ascii=False
+).encode("utf-8")
+
+
+async def _shed(send, retry_after: int):
+    await send({
+        "type": "http.response.start",
+        "status": 503,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(_SHED_BODY)).encode()),
+            (b"retry-after", str(retry_after).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": _SHED_BODY})
+
+
+class AdmissionMiddleware:
+    """
+    کنترل پذیرش درخواست‌ها
+
+    باید داخل TimingMiddleware باشد (قبل از آن add شود)
+    تا زمان db درخواست را ببیند.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.ADMISSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        route_class = _route_class(scope["path"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await route_class.acquire():
+            await _shed(send, route_class.retry_after())
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        # خطای سرور (مثلاً قطعی دیتابیس) مثل پاسخ کند حساب می‌شود
+        latency = route_class.target_sec * 2
+        try:
+            await self.app(scope, receive, send_with_status)
+            if status < 500:
+                # زمان دیتابیس (اگر Query داشت) وگرنه کل زمان پردازش
+                latency = (
+                    current_timings().get("db")
+                    or time.perf_counter() - started
+                )
+        finally:
+            route_class.release(latency)
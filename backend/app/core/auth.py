@@ -17,6 +17,7 @@ from fastapi import Request, HTTPException, Depends
 from typing import Optional
 
 from app.core.config import settings
+from app.core.metrics import timed
 
 
 # ======================================================
@@ -88,6 +89,16 @@ def get_current_user(request: Request) -> AuthenticatedUser:
         @router.get("/users")
         def get_users(user: AuthenticatedUser = Depends(get_current_user)):
             ...
+
+    زمان آن در هدر Server-Timing با نام auth ثبت می‌شود.
+    """
+    with timed("auth"):
+        return _authenticate(request)
+
+
+def _authenticate(request: Request) -> AuthenticatedUser:
+    """
+    تشخیص کاربر (DEV: از DEV_USER / PRODUCTION: از هدرهای IIS)
     """
     # ===============================
     # حالت DEV (بدون IIS)
@@ -136,3 +147,27 @@ def get_optional_user(request: Request) -> Optional[AuthenticatedUser]:
         return get_current_user(request)
     except HTTPException:
         return None
+
+
+
+# ======================================================
+# Dependency مدیران سیستم (endpoint های /admin)
+# ======================================================
+def require_admin(
+    user: AuthenticatedUser = Depends(get_current_user)
+) -> AuthenticatedUser:
+    """
+    فقط کاربران ADMIN_USERS (نام کاربری بدون دامنه)
+
+    استفاده:
+        router = APIRouter(dependencies=[Depends(require_admin)])
+    """
+    admins = {name.lower() for name in settings.ADMIN_USERS}
+
+    if user.username.lower() not in admins:
+        raise HTTPException(
+            status_code=403,
+            detail="دسترسی فقط برای مدیران سیستم"
+        )
+
+    return user
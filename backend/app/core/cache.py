@@ -0,0 +1,298 @@
+# backend/app/core/cache.py
+
+"""
+این فایل مسئول:
+- Cache ساده درون‌حافظه‌ای (In-Memory) با زمان انقضا (TTL)
+- جلوگیری از اجرای همزمان یک Query برای یک کلید (Single Flight)
+- گزارش وضعیت Cache ها (تعداد Hit/Miss، زمان بارگذاری، سن داده)
+
+مناسب برای:
+- داده‌های پرخواندن و کم‌تغییر (سمت‌ها، تیم‌ها، فهرست کاربران، ...)
+
+معادل در Django:
+- django.core.cache (LocMemCache)
+
+استفاده:
+    @cached("hr.roles")
+    def get_all_roles():
+        ...
+
+    get_all_roles()               → از Cache (یا بارگذاری در اولین بار)
+    get_all_roles.invalidate()    → حذف داده Cache شده
+
+    @cached("hr.users_minimal", tables=("Users",))
+    invalidate_tables("Users")    → بعد از نوشتن در Users (Repository)
+
+    @cached("hr.team_hierarchy", background=True)
+        → بعد از انقضا یا invalidate مقدار قبلی برگردانده می‌شود و
+          بارگذاری دوباره در پس‌زمینه انجام می‌شود (برای Cache های پرهزینه)
+"""
+
+import functools
+import time
+from threading import Lock, Thread
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# خطای بارگذاری پس‌زمینه → تلاش دوباره بعد از این مدت (مقدار قبلی سرو می‌شود)
+_BACKGROUND_RETRY_SEC = 30
+
+
+# ======================================================
+# یک Cache نام‌دار
+# ======================================================
+class TTLCache:
+    """
+    Cache نام‌دار با TTL
+
+    هر کلید (آرگومان‌های تابع) یک ورودی دارد:
+        (value, loaded_at, load_sec)
+
+    generation با هر invalidate یک واحد زیاد می‌شود؛
+    بارگذاری‌ای که قبل از invalidate شروع شده نتیجه‌اش را ذخیره نمی‌کند
+    (وگرنه داده قبل از نوشتن دوباره در Cache می‌نشست).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: Optional[int] = None,
+        tables: Iterable[str] = (),
+        background: bool = False
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.tables = frozenset(tables)
+        self.background = background
+        self.generation = 0
+        self._refreshing: set = set()
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Hashable, Tuple[object, float, float]] = {}
+        self._lock = Lock()
+        self._key_locks: Dict[Hashable, Lock] = {}
+
+    @property
+    def effective_ttl(self) -> int:
+        return self.ttl if self.ttl is not None else settings.CACHE_TTL_SEC
+
+    def _fresh(self, entry) -> bool:
+        return time.time() - entry[1] < self.effective_ttl
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], object]):
+        """
+        گرفتن مقدار از Cache؛ اگر نبود یا منقضی شده بود بارگذاری می‌شود
+
+        اگر چند Thread همزمان یک کلید منقضی را بخواهند،
+        فقط یکی Query می‌زند و بقیه منتظر همان نتیجه می‌مانند.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and self._fresh(entry):
+            self.hits += 1
+            return entry[0]
+
+        if entry is not None and self.background:
+            # مقدار قبلی فوراً؛ بارگذاری دوباره در پس‌زمینه
+            self.hits += 1
+            self._refresh_in_background(key, loader)
+            return entry[0]
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, Lock())
+
+        with key_lock:
+            # شاید Thread دیگری همین الان بارگذاری کرده باشد
+            entry = self._entries.get(key)
+            if entry is not None and self._fresh(entry):
+                self.hits += 1
+                return entry[0]
+
+            self.misses += 1
+            generation = self.generation
+            started = time.perf_counter()
+            value = loader()
+            with self._lock:
+                if generation == self.generation:
+                    self._entries[key] = (
+                        value, time.time(), time.perf_counter() - started
+                    )
+            return value
+
+    def _refresh_in_background(self, key: Hashable, loader: Callable):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                while True:
+                    generation = self.generation
+                    started = time.perf_counter()
+                    value = loader()
+                    with self._lock:
+                        if generation == self.generation:
+                            self._entries[key] = (
+                                value, time.time(),
+                                time.perf_counter() - started
+                            )
+                            self.misses += 1
+                            return
+                    # در حین بارگذاری invalidate شده → دوباره
+            except Exception:
+                logger.exception("Background reload of cache %s failed", self.name)
+                with self._lock:
+                    entry = self._entries.get(key)
+                    if entry is not None:
+                        self._entries[key] = (
+                            entry[0],
+                            time.time() - self.effective_ttl
+                            + _BACKGROUND_RETRY_SEC,
+                            entry[2]
+                        )
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        Thread(target=run, name=f"hr-cache-{self.name}", daemon=True).start()
+
+    def invalidate(self, key: Hashable = None):
+        """
+        حذف یک کلید (یا همه کلیدها اگر key داده نشود)
+
+        background=True → مقدار باقی می‌ماند ولی کهنه علامت می‌خورد
+        (درخواست بعدی مقدار قبلی را می‌گیرد و بارگذاری در پس‌زمینه شروع می‌شود)
+        """
+        with self._lock:
+            self.generation += 1
+            keys = list(self._entries) if key is None else [key]
+            for item in keys:
+                if self.background and item in self._entries:
+                    value, _, load_sec = self._entries[item]
+                    self._entries[item] = (value, 0.0, load_sec)
+                else:
+                    self._entries.pop(item, None)
+
+    def values(self) -> Dict[Hashable, object]:
+        """
+        همه مقادیر فعلی Cache (برای گزارش و اندازه‌گیری)
+        """
+        return {key: entry[0] for key, entry in list(self._entries.items())}
+
+    def stats(self) -> Dict:
+        """
+        وضعیت Cache
+        """
+        now = time.time()
+        entries = list(self._entries.values())
+        oldest = min((entry[1] for entry in entries), default=None)
+        return {
+            "entries": len(entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "ttl_sec": self.effective_ttl,
+            "oldest_age_sec": (
+                round(now - oldest, 1) if oldest is not None else None
+            ),
+            "last_load_sec": (
+                round(max(entry[2] for entry in entries), 4)
+                if entries else None
+            ),
+        }
+
+
+# ======================================================
+# Registry همه Cache ها
+# ======================================================
+_caches: Dict[str, TTLCache] = {}
+
+
+def get_cache(
+    name: str,
+    ttl: Optional[int] = None,
+    tables: Iterable[str] = (),
+    background: bool = False
+) -> TTLCache:
+    """
+    گرفتن (یا ساختن) Cache نام‌دار
+    """
+    cache = _caches.get(name)
+    if cache is None:
+        cache = _caches.setdefault(
+            name, TTLCache(name, ttl, tables, background)
+        )
+    return cache
+
+
+def all_caches() -> Dict[str, TTLCache]:
+    """
+    همه Cache های ثبت‌شده
+    """
+    return dict(_caches)
+
+
+def cache_stats() -> Dict[str, Dict]:
+    """
+    وضعیت همه Cache ها (برای Health / Monitoring)
+    """
+    return {name: cache.stats() for name, cache in _caches.items()}
+
+
+def invalidate_tables(*tables: str):
+    """
+    باطل کردن Cache هایی که از این جدول‌ها ساخته شده‌اند
+    (بعد از نوشتن؛ کنار mark_snapshot_stale در Repository)
+    """
+    changed = set(tables)
+    for cache in list(_caches.values()):
+        if cache.tables & changed:
+            cache.invalidate()
+
+
+def clear_all_caches():
+    """
+    پاک کردن همه Cache ها
+    """
+    for cache in _caches.values():
+        cache.invalidate()
+
+
+# ======================================================
+# Decorator
+# ======================================================
+def cached(
+    name: str,
+    ttl: Optional[int] = None,
+    tables: Iterable[str] = (),
+    background: bool = False
+):
+    """
+    Cache کردن خروجی یک تابع بر اساس آرگومان‌هایش
+
+    آرگومان‌ها باید Hashable باشند.
+
+    ttl:
+        زمان انقضا (ثانیه)؛ اگر داده نشود CACHE_TTL_SEC استفاده می‌شود
+    tables:
+        جدول‌هایی که داده از آن‌ها ساخته می‌شود (برای invalidate_tables)
+    background:
+        بعد از اولین بارگذاری، مقدار کهنه سرو و در پس‌زمینه تازه می‌شود
+        (درخواست‌ها منتظر بارگذاری پرهزینه نمی‌مانند)
+    """
+    cache = get_cache(name, ttl, tables, background)
+
+    def decorator(func: Callable):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            return cache.get_or_load(key, lambda: func(*args, **kwargs))
+
+        wrapper.cache = cache
+        wrapper.invalidate = cache.invalidate
+        return wrapper
+
+    return decorator
@@ -0,0 +1,393 @@
+# backend/app/core/concurrency.py
+
+"""
+این فایل مسئول:
+- مدیریت Thread Pool های اختصاصی (جدا از Thread Pool پیش‌فرض Starlette)
+- اجرای کارهای Blocking (مثل پیمایش نتایج دیتابیس) بدون اشغال
+  Thread های Endpoint های تعاملی
+- Bulkhead: Executor جدا برای هر دسته کار، با آمار صف و میزان اشغال
+
+چرا لازم است؟
+- Endpoint های sync در FastAPI روی یک Thread Pool مشترک اجرا می‌شوند
+- کارهای طولانی (مثل Export یا HR_GetAssessorsAndEducators) اگر روی همان
+  Pool اجرا شوند، درخواست‌های سریع (مثل /api/hr/me) را معطل می‌کنند
+
+استفاده:
+    @router.post("/sp/...")
+    @bulkhead("sp")
+    def call_sp(...): ...
+
+    router = APIRouter(route_class=bulkhead_route("directory"))
+        → همه endpoint های sync این Router روی Bulkhead directory
+          (endpoint های async، از جمله @bulkhead، دست نمی‌خورند)
+
+    await run_in_bulkhead("directory", func, *args)
+
+اندازه‌ها:
+    BULKHEAD_WORKERS (و EXPORT_MAX_WORKERS، IMPORT_MAX_WORKERS، JOBS_MAX_WORKERS)
+    Pool دیتابیس جدا برای هر Bulkhead: DB_POOL_PARTITIONS (app.core.database)
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar
+from threading import Lock
+from typing import AsyncIterator, Callable, Dict, Iterator, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.metrics import TimedRoute, record_timing
+
+T = TypeVar("T")
+
+
+class BulkheadFull(Exception):
+    """
+    صف Bulkhead پر است (پاسخ 503)
+    """
+
+    def __init__(self, name: str):
+        super().__init__(f"Bulkhead [{name}] is full")
+        self.name = name
+
+
+# ======================================================
+# Bulkhead (Executor با آمار)
+# ======================================================
+"""
+Bulkhead جاری هر Thread در یک ContextVar است؛
+app.core.database از روی آن Pool دیتابیس همان Bulkhead را انتخاب می‌کند.
+"""
+
+_current_bulkhead: ContextVar[Optional[str]] = ContextVar(
+    "hr_current_bulkhead", default=None
+)
+
+
+def current_bulkhead() -> Optional[str]:
+    return _current_bulkhead.get()
+
+
+class Bulkhead(ThreadPoolExecutor):
+    """
+    ThreadPoolExecutor نام‌دار با آمار
+
+    queued      → کارهای ثبت‌شده که هنوز شروع نشده‌اند
+    active      → کارهای در حال اجرا
+    utilization → active / max_workers
+    busy_seconds_total / queue_wait_seconds_total → برای rate() در Prometheus
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int = 0):
+        super().__init__(
+            max_workers=max_workers,
+            thread_name_prefix=f"hr-{name}"
+        )
+        self.name = name
+        self.size = max_workers
+        self.max_queue = max_queue
+
+        self._stats_lock = Lock()
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.rejected = 0
+        self.busy_seconds = 0.0
+        self.queue_wait_seconds = 0.0
+        self.max_queue_wait = 0.0
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        with self._stats_lock:
+            if self.max_queue and self.queued >= self.max_queue:
+                self.rejected += 1
+                raise BulkheadFull(self.name)
+            self.queued += 1
+
+        return super().submit(
+            self._run, time.perf_counter(), fn, args, kwargs
+        )
+
+    def _run(self, submitted: float, fn: Callable, args, kwargs):
+        started = time.perf_counter()
+        waited = started - submitted
+        with self._stats_lock:
+            self.queued -= 1
+            self.active += 1
+            self.queue_wait_seconds += waited
+            self.max_queue_wait = max(self.max_queue_wait, waited)
+
+        token = _current_bulkhead.set(self.name)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _current_bulkhead.reset(token)
+            with self._stats_lock:
+                self.active -= 1
+                self.completed += 1
+                self.busy_seconds += time.perf_counter() - started
+
+    def status(self) -> Dict:
+        with self._stats_lock:
+            return {
+                "max_workers": self.size,
+                "active": self.active,
+                "queued": self.queued,
+                "utilization": round(self.active / self.size, 3),
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "busy_seconds_total": round(self.busy_seconds, 3),
+                "queue_wait_seconds_total": round(self.queue_wait_seconds, 3),
+                "max_queue_wait_ms": round(self.max_queue_wait * 1000, 1),
+            }
+
+
+# ======================================================
+# Executor های نام‌دار
+# ======================================================
+"""
+هر نوع کار (مثلاً export) Executor مخصوص خود را دارد.
+Executor ها در اولین استفاده ساخته می‌شوند.
+"""
+
+_executors: Dict[str, Bulkhead] = {}
+_executors_lock = Lock()
+
+
+def get_executor(name: str, max_workers: Optional[int] = None) -> Bulkhead:
+    """
+    گرفتن (یا ساختن) Executor نام‌دار
+
+    استفاده:
+        executor = get_executor("export", settings.EXPORT_MAX_WORKERS)
+
+    max_workers اگر داده نشود از BULKHEAD_WORKERS خوانده می‌شود.
+    """
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            # صف محدود فقط برای Bulkhead های endpoint ها (BULKHEAD_WORKERS)
+            max_queue = 0
+            if max_workers is None:
+                max_workers = settings.BULKHEAD_WORKERS.get(name, 4)
+                max_queue = settings.BULKHEAD_MAX_QUEUE
+            executor = Bulkhead(name, max_workers, max_queue)
+            _executors[name] = executor
+        return executor
+
+
+def get_export_executor() -> Bulkhead:
+    """
+    Executor مخصوص Export ها
+
+    تعداد Thread ها = EXPORT_MAX_WORKERS؛ هر next() یک Task جداست،
+    پس این سقف به تنهایی تعداد Export همزمان را محدود نمی‌کند
+    (Generator معلق بین دو Chunk هم Connection را نگه می‌دارد).
+    سقف Export همزمان با iterate_export اعمال می‌شود.
+    """
+    return get_executor("export", settings.EXPORT_MAX_WORKERS)
+
+
+def get_import_executor() -> Bulkhead:
+    """
+    Executor مخصوص Import فایل‌ها
+
+    تعداد Thread ها = حداکثر Import همزمان
+    """
+    return get_executor("import", settings.IMPORT_MAX_WORKERS)
+
+
+def shutdown_executors():
+    """
+    بستن همه Executor ها (در زمان Shutdown برنامه)
+    """
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        _executors.clear()
+
+
+def bulkhead_status() -> Dict[str, Dict]:
+    """
+    آمار همه Bulkhead های ساخته‌شده (برای /health و /metrics)
+    """
+    with _executors_lock:
+        executors = dict(_executors)
+    return {name: executor.status() for name, executor in executors.items()}
+
+
+def render_bulkhead_prometheus() -> str:
+    """
+    آمار Bulkhead ها در قالب Prometheus
+    """
+    metrics = (
+        ("hr_bulkhead_workers", "gauge", "max_workers"),
+        ("hr_bulkhead_active", "gauge", "active"),
+        ("hr_bulkhead_queued", "gauge", "queued"),
+        ("hr_bulkhead_utilization", "gauge", "utilization"),
+        ("hr_bulkhead_completed_total", "counter", "completed"),
+        ("hr_bulkhead_rejected_total", "counter", "rejected"),
+        ("hr_bulkhead_busy_seconds_total", "counter", "busy_seconds_total"),
+        (
+            "hr_bulkhead_queue_wait_seconds_total", "counter",
+            "queue_wait_seconds_total"
+        ),
+    )
+    status = bulkhead_status()
+
+    lines = []
+    for metric, kind, key in metrics:
+        lines.append(f"# TYPE {metric} {kind}")
+        for name, stats in sorted(status.items()):
+            lines.append(f'{metric}{{bulkhead="{name}"}} {stats[key]}')
+    return "\n".join(lines) + "\n"
+
+
+# ======================================================
+# اجرای کار روی Bulkhead
+# ======================================================
+async def run_in_bulkhead(name: str, func: Callable[..., T], *args) -> T:
+    """
+    مثل run_in_threadpool ولی روی Bulkhead نام‌دار
+
+    Context (زمان مراحل درخواست، ...) به Thread منتقل می‌شود
+    و زمان انتظار در صف به مرحله queue درخواست اضافه می‌شود.
+    """
+    context = contextvars.copy_context()
+    submitted = time.perf_counter()
+
+    def call():
+        # Context کپی‌شده مقدار Thread را نمی‌بیند؛ Bulkhead دوباره ثبت می‌شود
+        _current_bulkhead.set(name)
+        record_timing("queue", time.perf_counter() - submitted)
+        return func(*args)
+
+    future = get_executor(name).submit(context.run, call)
+    return await asyncio.wrap_future(future)
+
+
+def bulkhead(name: str):
+    """
+    Decorator: اجرای endpoint همگام (sync) روی Bulkhead نام‌دار
+
+    امضای تابع حفظ می‌شود (FastAPI پارامترها را از آن می‌خواند).
+    """
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            raise TypeError(
+                f"bulkhead({name!r}) is for sync endpoints: {func.__name__}"
+            )
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await run_in_bulkhead(
+                name, functools.partial(func, *args, **kwargs)
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def bulkhead_route(name: str) -> type:
+    """
+    route_class برای Router: همه endpoint های sync روی Bulkhead name
+
+    endpoint های async بدون تغییر روی Event Loop اجرا می‌شوند؛
+    endpoint ای که با @bulkhead دسته دیگری گرفته، async است و
+    روی همان دسته خودش می‌ماند.
+    """
+
+    class BulkheadRoute(TimedRoute):
+
+        def __init__(self, path: str, endpoint: Callable, **kwargs):
+            if not inspect.iscoroutinefunction(endpoint):
+                endpoint = bulkhead(name)(endpoint)
+            super().__init__(path, endpoint, **kwargs)
+
+    BulkheadRoute.__name__ = f"BulkheadRoute[{name}]"
+    return BulkheadRoute
+
+
+# ======================================================
+# پیمایش یک Iterator همگام (sync) داخل Executor
+# ======================================================
+async def iterate_in_executor(
+    iterator: Iterator[T],
+    executor: ThreadPoolExecutor
+) -> AsyncIterator[T]:
+    """
+    تبدیل Iterator همگام به Async Iterator
+
+    هر next() داخل executor داده‌شده اجرا می‌شود،
+    بنابراین Event Loop و Thread Pool پیش‌فرض درگیر نمی‌شوند.
+
+    اگر مصرف‌کننده زودتر متوقف شود (مثلاً قطع اتصال Client)،
+    Iterator بسته می‌شود تا منابع آن (مثل Connection) آزاد شوند.
+    """
+    loop = asyncio.get_running_loop()
+    sentinel = object()
+
+    try:
+        while True:
+            item = await loop.run_in_executor(
+                executor, next, iterator, sentinel
+            )
+            if item is sentinel:
+                break
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            await loop.run_in_executor(executor, close)
+
+
+# ======================================================
+# سقف Export همزمان (برای کل مدت Stream)
+# ======================================================
+"""
+هر Export از شروع تا پایان Stream یک Slot نگه می‌دارد
+(حداکثر EXPORT_MAX_WORKERS در هر Worker)؛ در نتیجه Client های کند
+نمی‌توانند با Connection های باز، Pool دیتابیس را برای
+endpoint های تعاملی پر کنند.
+
+    if not export_slot_available(): → 503
+    StreamingResponse(iterate_export(body))
+
+Semaphore در Event Loop ساخته می‌شود (بدون Lock)؛
+اگر دو درخواست همزمان آخرین Slot را ببینند، دومی کوتاه منتظر می‌ماند.
+"""
+
+_export_slots: Optional[asyncio.Semaphore] = None
+_export_slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _export_semaphore() -> asyncio.Semaphore:
+    global _export_slots, _export_slots_loop
+
+    loop = asyncio.get_running_loop()
+    if _export_slots is None or _export_slots_loop is not loop:
+        _export_slots = asyncio.Semaphore(settings.EXPORT_MAX_WORKERS)
+        _export_slots_loop = loop
+    return _export_slots
+
+
+def export_slot_available() -> bool:
+    """
+    آیا Export جدید بدون انتظار شروع می‌شود؟ (داخل Event Loop)
+    """
+    return not _export_semaphore().locked()
+
+
+async def iterate_export(iterator: Iterator[T]) -> AsyncIterator[T]:
+    """
+    iterate_in_executor روی Executor مخصوص Export،
+    با نگه داشتن یک Slot تا پایان Stream (یا قطع اتصال)
+    """
+    async with _export_semaphore():
+        async for item in iterate_in_executor(
+            iterator, get_export_executor()
+        ):
+            yield item
@@ -5,7 +5,7 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
-from typing import List
+from typing import Dict, List
 import os
 
 
@@ -31,6 +31,28 @@ class Settings(BaseSettings):
     # ===============================
     SECRET_KEY: str
     JWT_SECRET: str | None = None
+    ADMIN_USERS: List[str] = []         # نام کاربری مدیران سیستم (endpoint های /admin)
+
+    # ===============================
+    # Server (Uvicorn) - run.py
+    # ===============================
+    SERVER_HOST: str = "127.0.0.1"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 1             # 0 = تعداد هسته‌های CPU (فقط در PRODUCTION)؛ بیش از 1 → لاگ با WatchedFileHandler
+    SERVER_LOOP: str = "auto"           # auto | asyncio | uvloop
+    SERVER_HTTP: str = "auto"           # auto | h11 | httptools
+    SERVER_BACKLOG: int = 2048          # صف اتصال‌های در انتظار accept
+    SERVER_KEEPALIVE_SEC: int = 5       # Keep-Alive اتصال‌های بیکار
+    SERVER_LIMIT_CONCURRENCY: int | None = None     # حداکثر اتصال همزمان هر Worker (بیشتر → 503)
+    SERVER_LIMIT_MAX_REQUESTS: int | None = None    # بازیابی Worker بعد از این تعداد درخواست
+    SERVER_GRACEFUL_TIMEOUT_SEC: int = 30           # انتظار برای اتمام درخواست‌ها در Shutdown
+    SERVER_PROXY_HEADERS: bool = True               # پشت Reverse Proxy (X-Forwarded-*)
+    SERVER_FORWARDED_ALLOW_IPS: str = "127.0.0.1"
+
+    # ===============================
+    # Modules
+    # ===============================
+    ENABLED_MODULES: List[str] = ["hr"]     # ماژول‌هایی که Router آن‌ها ثبت می‌شود
 
     # ===============================
     # Localization
@@ -52,6 +74,10 @@ class Settings(BaseSettings):
     DB_HOST: str
     DB_PORT: str
     DB_DRIVER: str = "ODBC Driver 17 for SQL Server"
+    DB_POOL_SIZE: int = 5               # تعداد اتصال ثابت در Pool
+    DB_MAX_OVERFLOW: int = 10           # اتصال اضافه در زمان فشار
+    # Pool جدا برای Bulkhead ها (مثلاً {"sp": 8, "export": 2}) → کار کند Pool اصلی را پر نمی‌کند
+    DB_POOL_PARTITIONS: Dict[str, int] = {}
 
     # ===============================
     # Media / Static (برای فایل عکس و ...)
@@ -68,6 +94,147 @@ class Settings(BaseSettings):
     # ===============================
     LOG_LEVEL: str = "INFO"
     LOG_PATH: str = "logs/app.log"
+    LOG_JSON: bool = False              # خروجی JSON (یک رکورد در هر خط)
+    LOG_QUEUE_SIZE: int = 10000         # ظرفیت صف لاگ (پر شدن → حذف رکورد)
+
+    # حداکثر لاگ در ثانیه برای هر Logger (بر اساس پیشوند نام)؛
+    # فقط INFO و پایین‌تر (WARNING و ERROR همیشه ثبت می‌شوند)
+    LOG_RATE_LIMITS: Dict[str, int] = {
+        "app.modules.hr.service": 200,
+        "app.modules.hr.router": 200,
+    }
+
+    # نسبت نمونه‌برداری (0 تا 1) برای Logger های پرتکرار؛ مثلاً {"app.modules.hr.service": 0.1}
+    LOG_SAMPLE_RATES: Dict[str, float] = {}
+
+    # ===============================
+    # Metrics / Server-Timing
+    # ===============================
+    METRICS_ENABLED: bool = True            # هیستوگرام زمان پاسخ و /metrics
+    SERVER_TIMING_ENABLED: bool = True      # هدر Server-Timing در پاسخ‌ها
+    METRICS_BUCKETS: List[float] = [        # مرزهای هیستوگرام (ثانیه)
+        0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+        1, 2.5, 5, 10, 30
+    ]
+
+    # ===============================
+    # Admission Control (سقف همزمانی تطبیقی)
+    # ===============================
+    ADMISSION_ENABLED: bool = False         # رد درخواست‌های اضافه با 503 در زمان ازدحام
+    ADMISSION_ROUTE_CLASSES: Dict[str, str] = {     # پیشوند مسیر → دسته (طولانی‌ترین پیشوند)
+        "/api/hr/": "directory",
+        "/api/hr/sp/": "sp",
+        "/api/hr/export/": "export",
+        "/api/hr/import/": "export",
+        "/api/hr/events": "",           # "" → بدون کنترل (اتصال طولانی SSE)
+    }
+    ADMISSION_MAX_CONCURRENCY: Dict[str, int] = {   # سقف همزمانی هر دسته
+        "directory": 64,
+        "sp": 16,
+        "export": 4,
+    }
+    ADMISSION_TARGET_LATENCY_MS: Dict[str, int] = { # زمان دیتابیس هدف هر دسته
+        "directory": 250,
+        "sp": 3000,
+        "export": 60000,
+    }
+    ADMISSION_MIN_CONCURRENCY: int = 2      # سقف هیچ‌وقت از این کمتر نمی‌شود
+    ADMISSION_DECREASE_FACTOR: float = 0.7  # ضریب کاهش سقف در ازدحام
+    ADMISSION_QUEUE_TIMEOUT_MS: int = 1000  # حداکثر انتظار در صف قبل از 503
+    ADMISSION_MAX_QUEUE: int = 100          # حداکثر طول صف هر دسته
+
+    # ===============================
+    # Sampling Profiler (/admin/profiler)
+    # ===============================
+    PROFILER_ENABLED: bool = False          # پیش‌فرض خاموش (بدون هیچ سربار)
+    PROFILER_INTERVAL_MS: int = 5           # فاصله نمونه‌برداری از Stack ها
+    PROFILER_MAX_SECONDS: int = 120         # سقف مدت هر پروفایل
+
+    # ===============================
+    # Memory (tracemalloc) - /admin/memory
+    # ===============================
+    MEMORY_TRACKING_ENABLED: bool = False   # ردیابی حافظه از Startup (سربار دارد)
+    MEMORY_TRACEMALLOC_FRAMES: int = 1      # عمق Stack ذخیره‌شده برای هر تخصیص
+
+    # ===============================
+    # Cache
+    # ===============================
+    CACHE_TTL_SEC: int = 300            # زمان انقضای پیش‌فرض Cache ها
+
+    # ===============================
+    # Snapshot محلی (SQLite) برای خواندن
+    # ===============================
+    SNAPSHOT_ENABLED: bool = False              # خواندن جدول‌های کم‌تغییر از فایل محلی
+    SNAPSHOT_DB_PATH: str = "data/snapshot.sqlite3"
+    SNAPSHOT_SYNC_INTERVAL_SEC: int = 300       # فاصله همگام‌سازی با SQL Server
+    SNAPSHOT_MAX_STALENESS_SEC: int = 600       # قدیمی‌تر از این → خواندن از SQL Server
+    SNAPSHOT_SERVE_STALE_ON_ERROR: bool = True  # قطعی SQL Server → پاسخ از Snapshot قدیمی
+    SNAPSHOT_SYNC_CHUNK_SIZE: int = 5000        # تعداد رکورد در هر بار کپی
+
+    # ===============================
+    # Warm-up / Readiness
+    # ===============================
+    WARMUP_ENABLED: bool = True
+    WARMUP_POOL_CONNECTIONS: int = 5    # تعداد اتصال باز شده در Warm-up
+    WARMUP_TIMEOUT_SEC: int = 60        # حداکثر زمان انتظار برای Warm-up
+    WARMUP_JITTER_SEC: float = 0        # تأخیر تصادفی شروع Warm-up هر Worker (چند Worker)
+
+    # ===============================
+    # Health Probe
+    # ===============================
+    HEALTH_PROBE_INTERVAL_SEC: int = 10     # فاصله بررسی سلامت
+    HEALTH_PROBE_TIMEOUT_SEC: int = 3       # Timeout بررسی دیتابیس
+
+    # ===============================
+    # Events (SSE) - /api/hr/events
+    # ===============================
+    EVENTS_ENABLED: bool = True                 # تشخیص تغییر (با اولین Client شروع می‌شود)
+    EVENTS_POLL_INTERVAL_SEC: int = 15          # فاصله بررسی تغییرات
+    EVENTS_BUFFER_SIZE: int = 1000              # رویدادهای اخیر برای ادامه از Last-Event-ID
+    EVENTS_CLIENT_QUEUE_SIZE: int = 256         # صف هر Client؛ پر شود → قطع اتصال
+    EVENTS_MAX_CLIENTS: int = 500               # حداکثر اتصال همزمان هر Worker (بیشتر → 503)
+    EVENTS_HEARTBEAT_SEC: int = 15              # ping برای باز ماندن اتصال پشت Proxy
+    EVENTS_MAX_CHANGES_PER_POLL: int = 500      # بیشتر → یک رویداد reload به جای هر ردیف
+
+    # ===============================
+    # Export (خروجی گرفتن از View ها)
+    # ===============================
+    EXPORT_CHUNK_SIZE: int = 5000       # تعداد رکورد در هر بار fetch
+    EXPORT_MAX_WORKERS: int = 2         # حداکثر Export همزمان
+
+    # ===============================
+    # Delta Sync (/api/hr/changes - SQL Server Change Tracking)
+    # ===============================
+    CHANGES_MAX_ROWS: int = 10000       # بیشتر در یک جدول → resync به جای لیست تغییرات
+
+    # ===============================
+    # Bulkhead (Thread Pool جدا برای هر دسته endpoint)
+    # ===============================
+    BULKHEAD_WORKERS: Dict[str, int] = {    # تعداد Thread هر دسته
+        "directory": 16,                    # خواندن کاربران، سمت‌ها، View ها
+        "sp": 8,                            # Stored Procedure ها
+        "write": 4,                         # نوشتن گروهی
+    }
+    BULKHEAD_MAX_QUEUE: int = 200           # صف پر → 503 (0 = بدون محدودیت)
+
+    # ===============================
+    # Bulk Write (نوشتن گروهی)
+    # ===============================
+    BULK_CHUNK_SIZE: int = 1000         # تعداد رکورد در هر رفت‌وبرگشت
+
+    # ===============================
+    # Import (فایل CSV)
+    # ===============================
+    IMPORT_CHUNK_SIZE: int = 2000       # تعداد رکورد در هر دسته نوشتن
+    IMPORT_MAX_WORKERS: int = 1         # حداکثر Import همزمان
+    IMPORT_MAX_ERRORS: int = 1000       # حداکثر خطای ردیفی در گزارش
+
+    # ===============================
+    # Background Jobs
+    # ===============================
+    JOBS_DB_PATH: str = "data/jobs.sqlite3"     # محل ذخیره وضعیت/نتیجه Job ها
+    JOBS_MAX_WORKERS: int = 2                   # حداکثر Job همزمان
+    JOBS_RESULT_TTL_SEC: int = 24 * 60 * 60     # مدت نگه‌داری نتیجه Job ها
 
     # ===============================
     # Development Only
@@ -84,30 +251,79 @@ class Settings(BaseSettings):
 
 
 # ===============================
-# Load settings
+# Load settings (Lazy)
 # ===============================
-settings = Settings()
+"""
+تنظیمات در اولین استفاده (نه در زمان import) خوانده می‌شوند؛
+بنابراین import کردن ماژول‌ها برای CLI، تست یا Worker ها
+هزینه خواندن فایل env را ندارد.
 
+استفاده (مثل قبل):
+    from app.core.config import settings
+    settings.DEBUG
+"""
 
-# ===============================
-# Post processing
-# ===============================
+_settings: Settings | None = None
+
+
+def get_settings() -> Settings:
+    """
+    بارگذاری (فقط یک بار) و برگرداندن تنظیمات
+    """
+    global _settings
+
+    if _settings is None:
+        loaded = Settings()
 
-# اگر JWT_SECRET ست نشده، از SECRET_KEY استفاده می‌کنیم
-if not settings.JWT_SECRET:
-    settings.JWT_SECRET = settings.SECRET_KEY
-
-# MEDIA_ROOT پیش‌فرض
-if not settings.MEDIA_ROOT:
-    settings.MEDIA_ROOT = os.path.join(
-        settings.BASE_DIR,
-        "media"
-    )
-
-# نمایش اطلاعات محیط (مشابه print های Django)
-print("\n[~~~~~~~~ HR CONFIG LOADED ~~~~~~~~]")
-print("ENVIRONMENT :", settings.ENVIRONMENT)
-print("DEBUG       :", settings.DEBUG)
-print("DB HOST     :", settings.DB_HOST)
-print("MEDIA ROOT  :", settings.MEDIA_ROOT)
-print("[~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~]\n")
+        # ===============================
+        # Post processing
+        # ===============================
+
+        # اگر JWT_SECRET ست نشده، از SECRET_KEY استفاده می‌کنیم
+        if not loaded.JWT_SECRET:
+            loaded.JWT_SECRET = loaded.SECRET_KEY
+
+        # MEDIA_ROOT پیش‌فرض
+        if not loaded.MEDIA_ROOT:
+            loaded.MEDIA_ROOT = os.path.join(
+                loaded.BASE_DIR,
+                "media"
+            )
+
+        _settings = loaded
+
+    return _settings
+
+
+class _LazySettings:
+    """
+    نماینده (Proxy) تنظیمات
+
+    هر دسترسی به settings.X در اولین بار تنظیمات را بارگذاری می‌کند.
+    """
+
+    def __getattr__(self, name: str):
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name: str, value):
+        setattr(get_settings(), name, value)
+
+    def __repr__(self):
+        return repr(get_settings())
+
+
+settings: Settings = _LazySettings()  # type: ignore[assignment]
+
+
+def settings_summary() -> dict:
+    """
+    خلاصه تنظیمات محیط (برای لاگ Startup)
+
+    قبلاً در زمان import با print نمایش داده می‌شد
+    """
+    return {
+        "ENVIRONMENT": settings.ENVIRONMENT,
+        "DEBUG": settings.DEBUG,
+        "DB HOST": settings.DB_HOST,
+        "MEDIA ROOT": settings.MEDIA_ROOT,
+    }
@@ -0,0 +1,505 @@
+# backend/app/core/events.py
+
+"""
+این فایل مسئول:
+- تشخیص تغییر داده‌ها در پس‌زمینه (Change Detection)
+    هر منبع (مثلاً users) دوره‌ای خوانده و با دفعه قبل مقایسه می‌شود
+- انتشار رویدادهای تغییر (created / updated / deleted) برای Client ها
+- نگه‌داری رویدادهای اخیر برای ادامه از Last-Event-ID (بعد از قطع اتصال)
+
+چرا لازم است؟
+- Frontend برای دیدن تغییرات، مرتب کل لیست کاربران و نقش‌ها را
+  دوباره می‌خواند؛ هر Client یک بار کامل در هر دوره
+- اینجا هر Worker فقط یک بار در هر دوره مقایسه می‌کند و
+  فقط ردیف‌های تغییرکرده برای Client ها فرستاده می‌شوند
+
+روش کار:
+    register_change_source(
+        "users", repository.get_all_user_rows,
+        key=("NationalCode",), fields=("NationalCode", "FirstName"),
+        tables=("Users",)
+    )
+
+    subscribe({"users"}, last_event_id) → Subscriber
+        1. رویدادهای بعد از last_event_id (اگر هنوز در بافر باشند)
+        2. سپس رویدادهای جدید
+
+    - روی SQL Server اول Fingerprint جدول‌ها (table_fingerprint) گرفته
+      می‌شود؛ اگر تغییری نکرده باشد ردیف‌ها خوانده نمی‌شوند
+    - تشخیص تغییر با اولین Subscriber شروع می‌شود و بعد از قطع شدن
+      آخرین Subscriber متوقف می‌شود
+      (بدون Client هیچ Query اضافه‌ای اجرا نمی‌شود)
+    - بعد از نوشتن (notify_tables_changed) بررسی بعدی زودتر انجام می‌شود
+
+Backpressure:
+    هر Client صف محدود (EVENTS_CLIENT_QUEUE_SIZE) دارد؛
+    اگر Client کند باشد و صف پر شود، اتصال بسته می‌شود و
+    Client با Last-Event-ID از همان‌جا ادامه می‌دهد.
+    اگر رویدادهای لازم دیگر در بافر نباشند → رویداد resync
+    (Client باید داده را کامل دوباره بخواند).
+
+شناسه رویداد:
+    "<epoch>-<seq>" ؛ epoch برای هر Process جداست.
+    بعد از Restart یا اتصال به Worker دیگر، epoch فرق دارد → resync
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from threading import Event, Lock, Thread
+from typing import (
+    AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, Set
+)
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.snapshot import table_fingerprint
+
+logger = get_logger(__name__)
+
+_EPOCH = format(int(time.time() * 1000), "x")
+
+
+# ======================================================
+# رویداد
+# ======================================================
+class ChangeEvent:
+
+    __slots__ = ("seq", "topic", "data")
+
+    def __init__(self, seq: int, topic: str, data: Dict):
+        self.seq = seq
+        self.topic = topic
+        self.data = data
+
+    @property
+    def id(self) -> str:
+        return f"{_EPOCH}-{self.seq}"
+
+
+def _parse_event_id(value: Optional[str]) -> Optional[int]:
+    """
+    شناسه رویداد → seq (epoch دیگر یا نامعتبر → -1)
+    """
+    if not value:
+        return None
+    epoch, _, seq = value.strip().rpartition("-")
+    if epoch != _EPOCH or not seq.isdigit():
+        return -1
+    return int(seq)
+
+
+# ======================================================
+# Subscriber (یک اتصال Client)
+# ======================================================
+class Subscriber:
+    """
+    صف محدود رویدادهای یک Client
+
+    put فقط روی Event Loop همان Client اجرا می‌شود
+    (از Thread تشخیص تغییر با call_soon_threadsafe).
+    """
+
+    def __init__(self, topics: Set[str], loop: asyncio.AbstractEventLoop):
+        self.topics = topics
+        self.loop = loop
+        self.events: deque = deque()
+        self.ready = asyncio.Event()
+        self.overflowed = False
+        self.closed = False
+
+    def put(self, event: ChangeEvent):
+        if self.closed or self.overflowed:
+            return
+        if len(self.events) >= settings.EVENTS_CLIENT_QUEUE_SIZE:
+            # Client کند → قطع اتصال (ادامه با Last-Event-ID)
+            self.overflowed = True
+        else:
+            self.events.append(event)
+        self.ready.set()
+
+    def close(self):
+        self.closed = True
+        self.ready.set()
+
+    async def get(self, timeout: float) -> Optional[ChangeEvent]:
+        """
+        رویداد بعدی
+
+        None → Timeout (زمان ارسال ping)
+        ChangeEvent با seq = -1 → باید اتصال بسته شود
+        """
+        if not self.events and not self.overflowed and not self.closed:
+            self.ready.clear()
+            try:
+                await asyncio.wait_for(self.ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+
+        if self.events:
+            return self.events.popleft()
+        if self.overflowed:
+            return ChangeEvent(-1, "overflow", {})
+        if self.closed:
+            return ChangeEvent(-1, "closed", {})
+        return None
+
+
+# ======================================================
+# انتشار رویدادها
+# ======================================================
+_buffer: deque = deque()
+_subscribers: List[Subscriber] = []
+_lock = Lock()
+_seq = 0
+_stats = {"published": 0, "overflowed": 0, "resyncs": 0}
+
+
+def publish(topic: str, data: Dict) -> ChangeEvent:
+    """
+    انتشار یک رویداد برای Subscriber های آن topic (از هر Thread)
+    """
+    global _seq
+
+    with _lock:
+        _seq += 1
+        event = ChangeEvent(_seq, topic, data)
+        _buffer.append(event)
+        while len(_buffer) > settings.EVENTS_BUFFER_SIZE:
+            _buffer.popleft()
+        _stats["published"] += 1
+
+        for subscriber in _subscribers:
+            if topic in subscriber.topics:
+                _deliver(subscriber, event)
+
+    return event
+
+
+def _deliver(subscriber: Subscriber, event: ChangeEvent):
+    try:
+        subscriber.loop.call_soon_threadsafe(subscriber.put, event)
+    except RuntimeError:
+        # Event Loop بسته شده (Shutdown)
+        subscriber.closed = True
+
+
+def subscribe(
+    topics: Iterable[str],
+    last_event_id: Optional[str] = None
+) -> Optional[Subscriber]:
+    """
+    ثبت یک Client (داخل Event Loop)
+
+    رویدادهای بعد از last_event_id قبل از رویدادهای جدید فرستاده می‌شوند.
+    None → تعداد Client ها به EVENTS_MAX_CLIENTS رسیده است
+    """
+    subscriber = Subscriber(set(topics), asyncio.get_running_loop())
+    last_seq = _parse_event_id(last_event_id)
+
+    with _lock:
+        if len(_subscribers) >= settings.EVENTS_MAX_CLIENTS:
+            return None
+
+        if last_seq is not None:
+            oldest = _buffer[0].seq if _buffer else _seq + 1
+            if last_seq < 0 or last_seq > _seq or last_seq + 1 < oldest:
+                # رویدادهای لازم دیگر در دسترس نیستند
+                _stats["resyncs"] += 1
+                subscriber.events.append(ChangeEvent(_seq, "resync", {}))
+            else:
+                subscriber.events.extend(
+                    event for event in _buffer
+                    if event.seq > last_seq and event.topic in subscriber.topics
+                )
+
+        _subscribers.append(subscriber)
+
+    start_change_detection()
+    return subscriber
+
+
+def unsubscribe(subscriber: Subscriber):
+    with _lock:
+        if subscriber in _subscribers:
+            _subscribers.remove(subscriber)
+        if subscriber.overflowed:
+            _stats["overflowed"] += 1
+        idle = not _subscribers
+    subscriber.closed = True
+
+    if idle:
+        # Thread تشخیص تغییر بدون انتظار برای دوره بعد متوقف شود
+        _wake.set()
+
+
+def close_subscribers():
+    """
+    بستن همه اتصال‌ها (در Shutdown)
+    """
+    with _lock:
+        subscribers = list(_subscribers)
+    for subscriber in subscribers:
+        try:
+            subscriber.loop.call_soon_threadsafe(subscriber.close)
+        except RuntimeError:
+            pass
+
+
+# ======================================================
+# Server-Sent Events
+# ======================================================
+def _format(event: ChangeEvent) -> bytes:
+    data = json.dumps(event.data, ensure_ascii=False, default=str)
+    return f"id: {event.id}\nevent: {event.topic}\ndata: {data}\n\n".encode(
+        "utf-8"
+    )
+
+
+async def event_stream(subscriber: Subscriber) -> AsyncIterator[bytes]:
+    """
+    بدنه پاسخ text/event-stream برای یک Subscriber
+
+    - ping (Comment) هر EVENTS_HEARTBEAT_SEC ثانیه
+    - صف پر (Client کند) یا Shutdown → رویداد overflow / closed و پایان اتصال
+    """
+    try:
+        # فاصله اتصال دوباره EventSource (میلی‌ثانیه)
+        yield b"retry: 3000\n\n"
+        while True:
+            event = await subscriber.get(settings.EVENTS_HEARTBEAT_SEC)
+            if event is None:
+                yield b": ping\n\n"
+                continue
+            if event.seq < 0:
+                yield f"event: {event.topic}\ndata: {{}}\n\n".encode()
+                break
+            yield _format(event)
+    finally:
+        unsubscribe(subscriber)
+
+
+# ======================================================
+# منابع تغییر
+# ======================================================
+_sources: Dict[str, Dict] = {}
+
+
+def register_change_source(
+    topic: str,
+    loader: Callable[[], List[Dict]],
+    key: Sequence[str],
+    fields: Sequence[str],
+    tables: Sequence[str] = ()
+):
+    """
+    ثبت یک منبع برای تشخیص تغییر
+
+    loader → همه ردیف‌ها مستقیم از SQL Server (بدون Cache و Snapshot؛
+              وگرنه Fingerprint جدید با ردیف‌های قدیمی ذخیره می‌شود)
+    key    → ستون‌های کلید هر ردیف
+    fields → ستون‌هایی که در رویداد فرستاده می‌شوند
+    tables → جدول‌های SQL Server (برای Fingerprint و notify_tables_changed)
+    """
+    _sources[topic] = {
+        "loader": loader,
+        "key": tuple(key),
+        "fields": tuple(fields),
+        "tables": tuple(tables),
+        "state": None,          # کلید → hash ردیف
+        "fingerprint": None,
+        "dirty": False,
+    }
+
+
+def change_topics() -> List[str]:
+    return sorted(_sources)
+
+
+def notify_tables_changed(*tables: str):
+    """
+    اعلام تغییر جدول‌ها (بعد از نوشتن) → بررسی فوری منابع وابسته
+    """
+    woken = False
+    for source in _sources.values():
+        if set(source["tables"]) & set(tables):
+            source["dirty"] = True
+            woken = True
+    if woken:
+        _wake.set()
+
+
+def _row_hash(row: Dict) -> int:
+    return hash(tuple(
+        (column, value if _hashable(value) else repr(value))
+        for column, value in row.items()
+    ))
+
+
+def _hashable(value) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _fingerprint(source: Dict) -> Optional[str]:
+    if not source["tables"]:
+        return None
+    parts = [table_fingerprint(table) for table in source["tables"]]
+    if any(part is None for part in parts):
+        return None
+    return "|".join(parts)
+
+
+def detect_changes(topic: str) -> int:
+    """
+    مقایسه یک منبع با دفعه قبل و انتشار رویدادها
+
+    اولین بار فقط وضعیت پایه ذخیره می‌شود.
+    خروجی: تعداد ردیف‌های تغییرکرده
+    """
+    source = _sources[topic]
+    dirty = source["dirty"]
+    source["dirty"] = False
+
+    fingerprint = _fingerprint(source)
+    if (
+        not dirty
+        and fingerprint is not None
+        and source["state"] is not None
+        and fingerprint == source["fingerprint"]
+    ):
+        return 0
+
+    key_columns, fields = source["key"], source["fields"]
+    rows = {}
+    state = {}
+    for row in source["loader"]():
+        key = tuple(row.get(column) for column in key_columns)
+        rows[key] = row
+        state[key] = _row_hash(row)
+
+    previous = source["state"]
+    source["state"] = state
+    source["fingerprint"] = fingerprint
+    if previous is None:
+        logger.info("Change detection [%s]: baseline %s rows", topic, len(state))
+        return 0
+
+    changes = []
+    for key, row_hash in state.items():
+        old_hash = previous.get(key)
+        if old_hash is None:
+            changes.append(("created", key))
+        elif old_hash != row_hash:
+            changes.append(("updated", key))
+    changes.extend(("deleted", key) for key in previous.keys() - state.keys())
+
+    if len(changes) > settings.EVENTS_MAX_CHANGES_PER_POLL:
+        # تغییر گسترده (مثلاً Import) → یک رویداد برای خواندن دوباره
+        publish(topic, {"action": "reload", "count": len(changes)})
+    else:
+        for action, key in changes:
+            data = {"action": action, "key": dict(zip(key_columns, key))}
+            if action != "deleted":
+                data["row"] = {
+                    column: rows[key].get(column) for column in fields
+                }
+            publish(topic, data)
+
+    if changes:
+        logger.info("Change detection [%s]: %s changes", topic, len(changes))
+    return len(changes)
+
+
+# ======================================================
+# Thread تشخیص تغییر
+# ======================================================
+_stop = Event()
+_wake = Event()
+_thread: Optional[Thread] = None
+_last_run: Dict = {"at": None, "elapsed_ms": None}
+
+
+def _loop():
+    global _thread
+
+    while not _stop.is_set():
+        with _lock:
+            if not _subscribers:
+                # بدون Client → توقف (subscribe دوباره شروع می‌کند)
+                _thread = None
+                logger.info("Change detection stopped (no clients)")
+                break
+
+        started = time.perf_counter()
+        for topic in list(_sources):
+            try:
+                detect_changes(topic)
+            except Exception as exc:
+                logger.warning("Change detection [%s] failed: %s", topic, exc)
+        _last_run["at"] = time.time()
+        _last_run["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+        _wake.wait(settings.EVENTS_POLL_INTERVAL_SEC)
+        _wake.clear()
+
+
+def start_change_detection():
+    """
+    شروع تشخیص تغییر (با اولین Subscriber؛ اگر EVENTS_ENABLED)
+
+    Thread وقتی Subscriber ای نماند خودش متوقف می‌شود.
+    """
+    global _thread
+
+    if not settings.EVENTS_ENABLED or not _sources:
+        return
+    if _thread is not None and _thread.is_alive():
+        return
+
+    with _lock:
+        if _thread is not None and _thread.is_alive():
+            return
+        _stop.clear()
+        _thread = Thread(target=_loop, name="hr-change-detection", daemon=True)
+        _thread.start()
+
+    logger.info(
+        "Change detection started (%s sources, every %ss)",
+        len(_sources), settings.EVENTS_POLL_INTERVAL_SEC
+    )
+
+
+def stop_change_detection(timeout: float = 5):
+    _stop.set()
+    _wake.set()
+    close_subscribers()
+    if _thread is not None:
+        _thread.join(timeout)
+
+
+# ======================================================
+# گزارش
+# ======================================================
+def events_status() -> Dict:
+    """
+    وضعیت رویدادها (برای /health)
+    """
+    if not settings.EVENTS_ENABLED:
+        return {"enabled": False}
+
+    with _lock:
+        return {
+            "enabled": True,
+            "running": _thread is not None and _thread.is_alive(),
+            "clients": len(_subscribers),
+            "last_event_id": f"{_EPOCH}-{_seq}",
+            "buffered": len(_buffer),
+            "last_run_at": _last_run["at"],
+            "last_run_ms": _last_run["elapsed_ms"],
+            **_stats,
+        }
@@ -0,0 +1,246 @@
+# backend/app/core/health.py
+
+"""
+این فایل مسئول:
+- بررسی دوره‌ای سلامت سیستم در پس‌زمینه (Background Prober)
+    - تأخیر (Latency) دیتابیس با SELECT 1
+    - میزان اشغال Pool اتصال‌ها
+    - تازگی داده‌های Cache
+- نگه‌داری آخرین نتیجه برای پاسخ فوری /health و /ready
+
+چرا لازم است؟
+- اگر هر درخواست /health یک SELECT 1 اجرا کند، مانیتورینگ و Load Balancer
+  دائماً Connection می‌گیرند و آزاد می‌کنند
+- اگر دیتابیس قفل شود، خود Health Check هم قفل می‌شود
+
+در این روش /health هیچ کار I/O انجام نمی‌دهد و فقط آخرین نتیجه را برمی‌گرداند.
+"""
+
+import time
+from threading import Event, Lock, Thread
+from typing import Dict, Optional
+
+from sqlalchemy import text
+
+from app.core.cache import cache_stats
+from app.core.config import settings
+from app.core.database import get_engine
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# ======================================================
+# آخرین نتیجه بررسی
+# ======================================================
+"""
+بعد از هر بررسی، کل dict جایگزین می‌شود (نه ویرایش درجا)
+تا خواننده‌ها هیچ‌وقت نتیجه نیمه‌کاره نبینند.
+"""
+_snapshot: Dict = {
+    "status": "starting",
+    "checked_at": None,
+    "database": {
+        "ok": False,
+        "latency_ms": None,
+        "error": "not probed yet",
+    },
+    "pool": {},
+    "caches": {},
+}
+_snapshot_lock = Lock()
+
+_stop = Event()
+_thread: Optional[Thread] = None
+
+# Probe دیتابیس که هنوز تمام نشده (مثلاً دیتابیس قفل شده)
+_db_probe_inflight: Dict = {"thread": None, "started": None}
+
+
+# ======================================================
+# بررسی دیتابیس (با Timeout)
+# ======================================================
+def _probe_database() -> Dict:
+    """
+    اجرای SELECT 1 در یک Thread جدا با Timeout
+
+    اگر Probe قبلی هنوز گیر کرده باشد، Probe جدید ساخته نمی‌شود
+    (تا Thread ها و Connection ها انباشته نشوند).
+    """
+    inflight = _db_probe_inflight["thread"]
+    if inflight is not None and inflight.is_alive():
+        waited = time.perf_counter() - _db_probe_inflight["started"]
+        return {
+            "ok": False,
+            "latency_ms": round(waited * 1000, 1),
+            "error": "previous probe still running (database hanging?)",
+        }
+
+    result: Dict = {"ok": False, "latency_ms": None, "error": None}
+
+    def run():
+        started = time.perf_counter()
+        try:
+            with get_engine().connect() as conn:
+                conn.execute(text("SELECT 1"))
+            result["ok"] = True
+        except Exception as exc:
+            result["error"] = str(exc)[:300]
+        result["latency_ms"] = round(
+            (time.perf_counter() - started) * 1000, 1
+        )
+
+    thread = Thread(target=run, name="hr-health-db", daemon=True)
+    _db_probe_inflight["thread"] = thread
+    _db_probe_inflight["started"] = time.perf_counter()
+    thread.start()
+    thread.join(settings.HEALTH_PROBE_TIMEOUT_SEC)
+
+    if thread.is_alive():
+        return {
+            "ok": False,
+            "latency_ms": settings.HEALTH_PROBE_TIMEOUT_SEC * 1000,
+            "error": "timeout",
+        }
+
+    return result
+
+
+def _pool_status() -> Dict:
+    """
+    وضعیت Pool اتصال‌ها
+
+    saturation:
+        نسبت اتصال‌های در حال استفاده به حداکثر اتصال مجاز
+        (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    """
+    pool = get_engine().pool
+    try:
+        checked_out = pool.checkedout()
+        capacity = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": checked_out,
+            "overflow": pool.overflow(),
+            "capacity": capacity,
+            "saturation": (
+                round(checked_out / capacity, 3) if capacity else None
+            ),
+        }
+    except AttributeError:
+        # Pool هایی که این آمار را ندارند (مثلاً StaticPool)
+        return {"status": pool.status()}
+
+
+def _cache_status() -> Dict:
+    """
+    وضعیت Cache ها همراه با تازگی داده (stale)
+    """
+    stats = cache_stats()
+    for info in stats.values():
+        age = info["oldest_age_sec"]
+        info["stale"] = age is not None and age > info["ttl_sec"]
+    return stats
+
+
+def probe_once() -> Dict:
+    """
+    یک بار بررسی کامل و به‌روزرسانی نتیجه
+    """
+    database = _probe_database()
+
+    snapshot = {
+        "status": "ok" if database["ok"] else "error",
+        "checked_at": time.time(),
+        "database": database,
+        "pool": _pool_status(),
+        "caches": _cache_status(),
+    }
+
+    global _snapshot
+
+    with _snapshot_lock:
+        first_probe = _snapshot["checked_at"] is None
+        previous_ok = _snapshot["database"]["ok"]
+        _snapshot = snapshot
+
+    # فقط تغییر وضعیت لاگ می‌شود (نه هر Probe)
+    if database["ok"] and not previous_ok:
+        logger.info(
+            "Database connection OK (%s ms)", database['latency_ms']
+        )
+    elif not database["ok"] and (previous_ok or first_probe):
+        logger.error("Database connection FAILED: %s", database['error'])
+
+    return snapshot
+
+
+# ======================================================
+# API عمومی
+# ======================================================
+def get_health() -> Dict:
+    """
+    آخرین نتیجه بررسی سلامت (بدون هیچ I/O)
+    """
+    snapshot = dict(_snapshot)
+
+    age = snapshot_age()
+    snapshot["age_sec"] = round(age, 1) if age is not None else None
+    return snapshot
+
+
+def snapshot_age() -> Optional[float]:
+    """
+    چند ثانیه از آخرین بررسی گذشته است؟
+    """
+    checked_at = _snapshot["checked_at"]
+    if checked_at is None:
+        return None
+    return time.time() - checked_at
+
+
+def is_healthy() -> bool:
+    """
+    آیا آخرین بررسی موفق و به‌روز بوده است؟
+
+    اگر Prober متوقف شده باشد (بررسی قدیمی‌تر از سه دوره)،
+    وضعیت سالم در نظر گرفته نمی‌شود.
+    """
+    snapshot = _snapshot
+    age = snapshot_age()
+    return (
+        snapshot["database"]["ok"]
+        and age is not None
+        and age < settings.HEALTH_PROBE_INTERVAL_SEC * 3
+    )
+
+
+def _loop():
+    while not _stop.is_set():
+        try:
+            probe_once()
+        except Exception:
+            logger.exception("Health probe failed")
+        _stop.wait(settings.HEALTH_PROBE_INTERVAL_SEC)
+
+
+def start_health_prober():
+    """
+    شروع Prober پس‌زمینه (در Startup)
+    """
+    global _thread
+
+    if _thread is not None and _thread.is_alive():
+        return
+
+    _stop.clear()
+    _thread = Thread(target=_loop, name="hr-health", daemon=True)
+    _thread.start()
+
+
+def stop_health_prober():
+    """
+    توقف Prober (در Shutdown)
+    """
+    _stop.set()
@@ -0,0 +1,489 @@
+# backend/app/core/jobs.py
+
+"""
+این فایل مسئول:
+- اجرای کارهای طولانی (Job) در پس‌زمینه
+- نگه‌داری وضعیت و نتیجه Job ها در یک فایل SQLite محلی
+- جلوگیری از اجرای تکراری Job های یکسان (Deduplication)
+- لغو (Cancel) Job ها
+
+چرا لازم است؟
+- برخی SP ها (مثل محاسبه ارزیاب/آموزش‌دهنده برای کل دوره ارزیابی)
+  بیشتر از Timeout پروکسی IIS طول می‌کشند
+- با Job، درخواست فقط یک job_id می‌گیرد و بعداً وضعیت/نتیجه را می‌پرسد
+
+معادل در Django:
+- Celery (نسخه بسیار ساده و بدون Broker)
+
+نکات:
+- Job ها داخل همان Process و روی Executor اختصاصی اجرا می‌شوند
+- چون Store یک فایل است، وضعیت Job از همه Worker ها قابل مشاهده است
+- Job هایی که هنگام Restart نیمه‌کاره مانده‌اند، failed علامت می‌خورند
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import uuid
+from collections.abc import Mapping
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Callable, Dict, Iterator, Optional
+
+from app.core.concurrency import get_executor
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# ======================================================
+# وضعیت‌های Job
+# ======================================================
+PENDING = "pending"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLING = "cancelling"
+CANCELLED = "cancelled"
+
+ACTIVE_STATUSES = (PENDING, RUNNING, CANCELLING)
+
+
+class JobError(Exception):
+    """
+    خطای عمومی سیستم Job (نوع نامعتبر، پارامتر نامعتبر و ...)
+    """
+
+
+# ======================================================
+# ثبت انواع Job
+# ======================================================
+"""
+هر ماژول انواع Job خود را ثبت می‌کند:
+
+    register_job_kind("sp-get-target-role", service.sp_get_target_role)
+
+تابع Job با پارامترهای keyword صدا زده می‌شود و خروجی آن
+باید قابل تبدیل به JSON باشد.
+"""
+
+_job_kinds: Dict[str, Callable] = {}
+
+
+def register_job_kind(kind: str, func: Callable):
+    """
+    ثبت یک نوع Job
+    """
+    _job_kinds[kind] = func
+
+
+def get_job_kinds() -> list:
+    """
+    لیست انواع Job ثبت‌شده
+    """
+    return sorted(_job_kinds)
+
+
+# ======================================================
+# لغو همکارانه (Cooperative Cancel)
+# ======================================================
+"""
+Job های طولانی که چند مرحله دارند می‌توانند بین مراحل
+is_cancelled() را بررسی کنند و زودتر متوقف شوند.
+"""
+
+_current_job_id: ContextVar[Optional[str]] = ContextVar(
+    "current_job_id", default=None
+)
+
+
+def is_cancelled() -> bool:
+    """
+    آیا Job در حال اجرا (Thread فعلی) لغو شده است؟
+    """
+    job_id = _current_job_id.get()
+    if job_id is None:
+        return False
+    job = get_job(job_id)
+    return job is not None and job["status"] == CANCELLING
+
+
+# ======================================================
+# Store (SQLite محلی)
+# ======================================================
+_store_lock = Lock()
+_store_ready = False
+
+# Future های Job هایی که در همین Process اجرا می‌شوند
+_futures: Dict[str, Future] = {}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+@contextmanager
+def _connect() -> Iterator[sqlite3.Connection]:
+    """
+    Connection کوتاه‌مدت به Store (Commit و Close خودکار)
+    """
+    conn = sqlite3.connect(settings.JOBS_DB_PATH, timeout=30)
+    conn.row_factory = sqlite3.Row
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def _init_store():
+    """
+    ساخت جدول Job ها (در اولین استفاده)
+    """
+    global _store_ready
+
+    if _store_ready:
+        return
+
+    with _store_lock:
+        if _store_ready:
+            return
+
+        db_dir = os.path.dirname(settings.JOBS_DB_PATH)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        with _connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    dedup_key TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    submitted_by TEXT,
+                    submitted_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    pid INTEGER,
+                    result TEXT,
+                    error TEXT
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_jobs_dedup "
+                "ON jobs (dedup_key, status)"
+            )
+
+        _store_ready = True
+
+
+def _pid_alive(pid: int) -> bool:
+    """
+    آیا Process با این pid هنوز زنده است؟
+
+    روی ویندوز os.kill(pid, 0) سیگنال CTRL_C می‌فرستد؛
+    آنجا (که همیشه یک Worker داریم) Process های دیگر مرده فرض می‌شوند.
+    """
+    if pid == os.getpid():
+        return True
+    if os.name == "nt":
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _mark_interrupted_jobs():
+    """
+    Job های فعالی که Process اجراکننده آن‌ها دیگر وجود ندارد
+    (مثلاً بعد از Restart) failed علامت می‌خورند
+    تا کلاینت برای همیشه منتظر نماند.
+    """
+    _init_store()
+    with _store_lock, _connect() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT id, pid FROM jobs
+            WHERE status IN ({",".join("?" * len(ACTIVE_STATUSES))})
+            """,
+            ACTIVE_STATUSES
+        ).fetchall()
+
+        interrupted = [
+            row["id"] for row in rows
+            if row["pid"] is None or not _pid_alive(row["pid"])
+        ]
+
+        conn.executemany(
+            "UPDATE jobs SET status = ?, error = ?, finished_at = ? "
+            "WHERE id = ?",
+            [
+                (FAILED, "interrupted by restart", _now(), job_id)
+                for job_id in interrupted
+            ]
+        )
+
+    if interrupted:
+        logger.warning(
+            "Marked %s interrupted jobs as failed",
+            len(interrupted)
+        )
+
+
+def _transition(job_id: str, from_statuses: tuple, **fields) -> bool:
+    """
+    تغییر وضعیت فقط اگر وضعیت فعلی یکی از from_statuses باشد
+    (Compare-and-Set؛ بین Thread اجرا و cancel_job رقابت پیش نمی‌آید)
+
+    خروجی: True → تغییر انجام شد
+    """
+    columns = ", ".join(f"{key} = ?" for key in fields)
+    with _connect() as conn:
+        cursor = conn.execute(
+            f"UPDATE jobs SET {columns} WHERE id = ? "
+            f"AND status IN ({','.join('?' * len(from_statuses))})",
+            (*fields.values(), job_id, *from_statuses)
+        )
+        return cursor.rowcount == 1
+
+
+def _to_dict(row: sqlite3.Row, with_result: bool = False) -> Dict:
+    job = {
+        "id": row["id"],
+        "kind": row["kind"],
+        "params": json.loads(row["params"]),
+        "status": row["status"],
+        "submitted_by": row["submitted_by"],
+        "submitted_at": row["submitted_at"],
+        "started_at": row["started_at"],
+        "finished_at": row["finished_at"],
+        "error": row["error"],
+    }
+    if with_result:
+        job["result"] = (
+            json.loads(row["result"]) if row["result"] is not None else None
+        )
+    return job
+
+
+def _json_default(value):
+    """
+    تبدیل انواع غیر JSON (RowMapping، تاریخ، Decimal و ...)
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+def _purge_expired():
+    """
+    حذف Job های تمام‌شده قدیمی‌تر از JOBS_RESULT_TTL_SEC
+    """
+    threshold = (
+        datetime.now(timezone.utc)
+        - timedelta(seconds=settings.JOBS_RESULT_TTL_SEC)
+    ).isoformat(timespec="seconds")
+
+    with _connect() as conn:
+        conn.execute(
+            f"""
+            DELETE FROM jobs
+            WHERE finished_at IS NOT NULL AND finished_at < ?
+              AND status NOT IN ({",".join("?" * len(ACTIVE_STATUSES))})
+            """,
+            (threshold, *ACTIVE_STATUSES)
+        )
+
+
+# ======================================================
+# اجرای Job
+# ======================================================
+def _run_job(job_id: str, kind: str, params: Dict):
+    """
+    اجرای یک Job داخل Executor
+    """
+    if not _transition(
+        job_id, (PENDING,), status=RUNNING, started_at=_now()
+    ):
+        # قبل از شروع لغو شده (یا وجود ندارد)
+        _futures.pop(job_id, None)
+        if _transition(
+            job_id, (CANCELLING,), status=CANCELLED, finished_at=_now()
+        ):
+            logger.info("Job %s (%s) cancelled before start", job_id, kind)
+        return
+
+    token = _current_job_id.set(job_id)
+
+    try:
+        result = _job_kinds[kind](**params)
+        result_json = json.dumps(
+            result, ensure_ascii=False, default=_json_default
+        )
+    except Exception as exc:
+        logger.exception("Job %s (%s) failed", job_id, kind)
+        if not _transition(
+            job_id, (RUNNING,),
+            status=FAILED,
+            error=str(exc)[:1000],
+            finished_at=_now()
+        ):
+            _transition(
+                job_id, (CANCELLING,), status=CANCELLED, finished_at=_now()
+            )
+        return
+    finally:
+        _current_job_id.reset(token)
+        _futures.pop(job_id, None)
+
+    if _transition(
+        job_id, (RUNNING,),
+        status=SUCCEEDED,
+        result=result_json,
+        finished_at=_now()
+    ):
+        logger.info("Job %s (%s) succeeded", job_id, kind)
+        return
+
+    # در حین اجرا لغو شده → نتیجه کنار گذاشته می‌شود
+    if _transition(
+        job_id, (CANCELLING,), status=CANCELLED, finished_at=_now()
+    ):
+        logger.info("Job %s (%s) cancelled while running", job_id, kind)
+
+
+# ======================================================
+# API عمومی Job ها
+# ======================================================
+def submit_job(
+    kind: str,
+    params: Dict | None = None,
+    submitted_by: str | None = None
+) -> Dict:
+    """
+    ثبت یک Job جدید
+
+    Deduplication:
+        اگر Job یکسان (همان kind، همان params و همان submitted_by)
+        در صف یا در حال اجرا باشد، همان Job برگردانده می‌شود.
+        Job تمام‌شده دوباره استفاده نمی‌شود (ارسال دوباره → اجرای تازه).
+
+    خطا:
+        JobError → نوع Job یا پارامترها نامعتبر است
+    """
+    params = params or {}
+
+    func = _job_kinds.get(kind)
+    if func is None:
+        raise JobError(f"Unknown job kind: {kind}")
+
+    try:
+        inspect.signature(func).bind(**params)
+    except TypeError as exc:
+        raise JobError(f"Invalid params for {kind}: {exc}") from exc
+
+    _init_store()
+
+    params_json = json.dumps(params, sort_keys=True, default=str)
+    dedup_key = hashlib.sha256(
+        f"{kind}:{submitted_by}:{params_json}".encode("utf-8")
+    ).hexdigest()
+
+    with _store_lock:
+        _purge_expired()
+
+        with _connect() as conn:
+            row = conn.execute(
+                f"""
+                SELECT * FROM jobs
+                WHERE dedup_key = ?
+                  AND status IN (?, ?)
+                ORDER BY submitted_at DESC
+                LIMIT 1
+                """,
+                (dedup_key, PENDING, RUNNING)
+            ).fetchone()
+
+            if row is not None:
+                logger.info("Job %s (%s) reused (dedup)", row['id'], kind)
+                return _to_dict(row)
+
+            job_id = uuid.uuid4().hex
+            conn.execute(
+                """
+                INSERT INTO jobs (
+                    id, kind, params, dedup_key, status,
+                    submitted_by, submitted_at, pid
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (job_id, kind, params_json, dedup_key, PENDING,
+                 submitted_by, _now(), os.getpid())
+            )
+
+    _futures[job_id] = get_executor(
+        "jobs", settings.JOBS_MAX_WORKERS
+    ).submit(_run_job, job_id, kind, params)
+
+    logger.info("Job %s (%s) submitted by %s", job_id, kind, submitted_by)
+    return get_job(job_id)
+
+
+def get_job(job_id: str, with_result: bool = False) -> Optional[Dict]:
+    """
+    دریافت وضعیت (و در صورت نیاز نتیجه) یک Job
+    """
+    _init_store()
+    with _connect() as conn:
+        row = conn.execute(
+            "SELECT * FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+    return _to_dict(row, with_result) if row is not None else None
+
+
+def cancel_job(job_id: str) -> Optional[Dict]:
+    """
+    لغو یک Job
+
+    - Job در صف (pending) → فوراً cancelled
+    - Job در حال اجرا → cancelling؛ پس از پایان اجرا نتیجه کنار
+      گذاشته می‌شود و وضعیت cancelled می‌شود
+    - Job تمام‌شده → بدون تغییر
+    """
+    job = get_job(job_id)
+    if job is None:
+        return None
+
+    if job["status"] == PENDING:
+        future = _futures.pop(job_id, None)
+        cancelled = (future is None or future.cancel()) and _transition(
+            job_id, (PENDING,), status=CANCELLED, finished_at=_now()
+        )
+        if not cancelled:
+            # همین لحظه شروع شده است؛ _run_job وضعیت را cancelled می‌کند
+            _transition(job_id, (PENDING, RUNNING), status=CANCELLING)
+
+    elif job["status"] == RUNNING:
+        _transition(job_id, (RUNNING,), status=CANCELLING)
+
+    logger.info("Job %s cancel requested", job_id)
+    return get_job(job_id)
+
+
+def init_jobs():
+    """
+    آماده‌سازی سیستم Job در زمان Startup
+    """
+    _mark_interrupted_jobs()
@@ -4,34 +4,47 @@
 این فایل مسئول:
 - پیکربندی سیستم لاگ پروژه HR
 - ذخیره لاگ‌ها در فایل
+  (چند Worker → همه در یک فایل با WatchedFileHandler؛ چرخش با logrotate)
 - چاپ لاگ‌ها در کنسول (در حالت DEV)
+- نوشتن غیرهمگام لاگ (Queue) تا I/O فایل روی Thread درخواست انجام نشود
+- خروجی JSON (اختیاری)
+- محدودسازی / نمونه‌برداری لاگ‌های پرتکرار
 
 معادل در Django:
 - settings.py → LOGGING
 - فولدر logs/
+
+مسیر یک رکورد لاگ:
+    logger.info("Fetching user %s", nc)          ← Thread درخواست
+        → RateLimitFilter (حذف سریع لاگ‌های اضافه)
+        → QueueHandler (فقط قرار دادن در صف؛ بدون فرمت و I/O)
+    QueueListener                                 ← Thread جدا
+        → فرمت پیام → File / Console
+
+نکته:
+    پیام‌ها را با %s بنویسید (نه f-string) تا فرمت کردن
+    فقط در Thread لاگ و فقط برای رکوردهای ثبت‌شده انجام شود.
+    آرگومان‌های لاگ بعد از فراخوانی نباید تغییر کنند.
 """
 
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import random
+import time
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    WatchedFileHandler,
+)
 import os
+from typing import Dict, Optional
 
 from app.core.config import settings
 
 
-# ======================================================
-# اطمینان از وجود فولدر logs
-# ======================================================
-"""
-اگر فولدر logs وجود نداشته باشد،
-در اولین اجرای برنامه ساخته می‌شود.
-"""
-
-LOG_DIR = os.path.dirname(settings.LOG_PATH)
-
-if LOG_DIR and not os.path.exists(LOG_DIR):
-    os.makedirs(LOG_DIR)
-
-
 # ======================================================
 # فرمت لاگ‌ها
 # ======================================================
@@ -53,63 +66,291 @@ LOG_FORMAT = (
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
+class JsonFormatter(logging.Formatter):
+    """
+    فرمت JSON (یک رکورد در هر خط) برای ابزارهای جمع‌آوری لاگ
+
+    مثال:
+    {"time": "2026-01-23 10:15:30", "level": "INFO", "logger": "hr.router",
+     "message": "User fetched successfully", "pid": 1234, "thread": "..."}
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": self.formatTime(record, DATE_FORMAT),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "pid": record.process,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def _build_formatter() -> logging.Formatter:
+    if settings.LOG_JSON:
+        return JsonFormatter()
+    return logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+
+
 # ======================================================
-# تنظیم Root Logger
+# محدودسازی و نمونه‌برداری لاگ‌های پرتکرار
 # ======================================================
-logger = logging.getLogger()
-logger.setLevel(settings.LOG_LEVEL)
+class RateLimitFilter(logging.Filter):
+    """
+    حذف لاگ‌های اضافه Logger های پرتکرار (قبل از ورود به صف)
+
+    limits:
+        {پیشوند نام Logger: حداکثر رکورد در ثانیه}
+    sample_rates:
+        {پیشوند نام Logger: نسبت رکوردهای نگه‌داشته‌شده}
+
+    طولانی‌ترین پیشوند منطبق استفاده می‌شود.
+    WARNING و بالاتر هیچ‌وقت حذف نمی‌شوند.
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, int],
+        sample_rates: Dict[str, float]
+    ):
+        super().__init__()
+        self.limits = dict(limits)
+        self.sample_rates = dict(sample_rates)
+        self._prefixes = sorted(
+            set(self.limits) | set(self.sample_rates),
+            key=len,
+            reverse=True
+        )
+        self._rule_cache: Dict[str, Optional[str]] = {}
+
+        # پنجره یک‌ثانیه‌ای هر قاعده: [ثانیه، تعداد]
+        self._windows: Dict[str, list] = {}
+        self.suppressed: Dict[str, int] = {}
+
+    def _rule(self, logger_name: str) -> Optional[str]:
+        rule = self._rule_cache.get(logger_name, "")
+        if rule != "":
+            return rule
+
+        rule = None
+        for prefix in self._prefixes:
+            if logger_name == prefix or logger_name.startswith(prefix + "."):
+                rule = prefix
+                break
+
+        self._rule_cache[logger_name] = rule
+        return rule
+
+    def _drop(self, rule: str) -> bool:
+        self.suppressed[rule] = self.suppressed.get(rule, 0) + 1
+        return False
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self._prefixes:
+            return True
+
+        rule = self._rule(record.name)
+        if rule is None:
+            return True
+
+        rate = self.sample_rates.get(rule)
+        if rate is not None and random.random() >= rate:
+            return self._drop(rule)
+
+        limit = self.limits.get(rule)
+        if limit is not None:
+            second = int(time.monotonic())
+            window = self._windows.get(rule)
+            if window is None or window[0] != second:
+                window = self._windows[rule] = [second, 0]
+            window[1] += 1
+            if window[1] > limit:
+                return self._drop(rule)
+
+        return True
 
 
 # ======================================================
-# File Handler (ذخیره در فایل)
+# Queue Handler غیرمسدودکننده
 # ======================================================
-"""
-RotatingFileHandler:
-- وقتی فایل لاگ به حجم مشخص برسد
-- فایل جدید ساخته می‌شود
-- فایل‌های قدیمی نگه داشته می‌شوند
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    قرار دادن رکورد در صف بدون فرمت کردن و بدون انتظار
 
-این کار از پر شدن دیسک جلوگیری می‌کند
-"""
+    - QueueHandler استاندارد پیام را در Thread درخواست فرمت می‌کند؛
+      اینجا فرمت به Thread لاگ (QueueListener) سپرده می‌شود
+    - اگر صف پر باشد (دیسک کند)، رکورد حذف و شمرده می‌شود
+      تا درخواست منتظر نماند
+    """
 
-file_handler = RotatingFileHandler(
-    filename=settings.LOG_PATH,
-    maxBytes=10 * 1024 * 1024,   # 10 MB
-    backupCount=10,              # نگه داشتن 10 فایل قدیمی
-    encoding="utf-8"
-)
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
 
-file_handler.setLevel(settings.LOG_LEVEL)
-file_handler.setFormatter(
-    logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-)
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
 
 
 # ======================================================
-# Console Handler (فقط برای DEV)
+# راه‌اندازی سیستم لاگ (صریح، نه در زمان import)
 # ======================================================
 """
-در محیط DEV:
-- لاگ‌ها در کنسول هم نمایش داده می‌شوند
-در Production:
-- فقط فایل لاگ
+setup_logging یک بار در Startup برنامه (app.main) صدا زده می‌شود.
+
+قبلاً Handlerها در زمان import ساخته می‌شدند؛ بنابراین هر CLI یا تستی که
+فقط get_logger را import می‌کرد، فایل لاگ را باز می‌کرد.
 """
 
-console_handler = logging.StreamHandler()
-console_handler.setLevel(settings.LOG_LEVEL)
-console_handler.setFormatter(
-    logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-)
+_configured = False
 
+_queue_handler: Optional[NonBlockingQueueHandler] = None
+_rate_filter: Optional[RateLimitFilter] = None
+_listener: Optional[QueueListener] = None
 
-# ======================================================
-# اضافه کردن Handlerها
-# ======================================================
-if not logger.handlers:
-    logger.addHandler(file_handler)
 
-    if settings.DEBUG:
-        logger.addHandler(console_handler)
+def setup_logging():
+    """
+    پیکربندی Root Logger (فقط بار اول اثر دارد)
+    """
+    global _configured, _queue_handler, _rate_filter, _listener
+
+    if _configured:
+        return
+    _configured = True
+
+    # ===============================
+    # اطمینان از وجود فولدر logs
+    # ===============================
+    # اگر فولدر logs وجود نداشته باشد،
+    # در اولین اجرای برنامه ساخته می‌شود.
+    log_dir = os.path.dirname(settings.LOG_PATH)
+
+    if log_dir and not os.path.exists(log_dir):
+        os.makedirs(log_dir)
+
+    # ===============================
+    # تنظیم Root Logger
+    # ===============================
+    logger = logging.getLogger()
+    logger.setLevel(settings.LOG_LEVEL)
+
+    # ===============================
+    # File Handler (ذخیره در فایل)
+    # ===============================
+    # RotatingFileHandler:
+    # - وقتی فایل لاگ به حجم مشخص برسد
+    # - فایل جدید ساخته می‌شود
+    # - فایل‌های قدیمی نگه داشته می‌شوند
+    #
+    # این کار از پر شدن دیسک جلوگیری می‌کند
+    #
+    # چند Worker (SERVER_WORKERS != 1، هر Worker یک Process):
+    # چرخش همزمان یک فایل توسط چند Process لاگ‌ها را از بین می‌برد؛
+    # WatchedFileHandler فقط Append می‌کند و اگر فایل جابه‌جا شود
+    # (logrotate) دوباره بازش می‌کند → چرخش بیرون از برنامه انجام شود.
+    if settings.SERVER_WORKERS != 1:
+        file_handler = WatchedFileHandler(
+            filename=settings.LOG_PATH,
+            encoding="utf-8"
+        )
+    else:
+        file_handler = RotatingFileHandler(
+            filename=settings.LOG_PATH,
+            maxBytes=10 * 1024 * 1024,   # 10 MB
+            backupCount=10,              # نگه داشتن 10 فایل قدیمی
+            encoding="utf-8"
+        )
+
+    file_handler.setLevel(settings.LOG_LEVEL)
+    file_handler.setFormatter(_build_formatter())
+
+    # ===============================
+    # Console Handler (فقط برای DEV)
+    # ===============================
+    # در محیط DEV:
+    # - لاگ‌ها در کنسول هم نمایش داده می‌شوند
+    # در Production:
+    # - فقط فایل لاگ
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(settings.LOG_LEVEL)
+    console_handler.setFormatter(_build_formatter())
+
+    # ===============================
+    # اضافه کردن Handlerها (پشت صف)
+    # ===============================
+    # Root Logger فقط QueueHandler دارد؛
+    # Handlerهای فایل و کنسول در Thread جدای QueueListener اجرا می‌شوند.
+    if not logger.handlers:
+        handlers = [file_handler]
+
+        if settings.DEBUG:
+            handlers.append(console_handler)
+
+        log_queue = queue.Queue(maxsize=max(settings.LOG_QUEUE_SIZE, 0))
+
+        _rate_filter = RateLimitFilter(
+            settings.LOG_RATE_LIMITS,
+            settings.LOG_SAMPLE_RATES
+        )
+        _queue_handler = NonBlockingQueueHandler(log_queue)
+        _queue_handler.addFilter(_rate_filter)
+        logger.addHandler(_queue_handler)
+
+        _listener = QueueListener(
+            log_queue,
+            *handlers,
+            respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(stop_logging)
+
+    # ===============================
+    # تست اولیه لاگ (در زمان Startup)
+    # ===============================
+    startup_logger = get_logger("startup")
+
+    startup_logger.info("HR Logging system initialized")
+    startup_logger.info("Environment: %s", settings.ENVIRONMENT)
+    startup_logger.info("Log level: %s", settings.LOG_LEVEL)
+    startup_logger.info("Log file: %s", settings.LOG_PATH)
+
+
+def stop_logging():
+    """
+    نوشتن رکوردهای باقی‌مانده صف و توقف Thread لاگ (در Shutdown)
+    """
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def logging_stats() -> Dict:
+    """
+    وضعیت سیستم لاگ (برای Health / Monitoring)
+
+    - queued: رکوردهای منتظر نوشتن
+    - dropped: رکوردهای حذف‌شده به دلیل پر بودن صف
+    - suppressed: رکوردهای حذف‌شده با محدودسازی / نمونه‌برداری
+    """
+    if _queue_handler is None:
+        return {"queued": 0, "dropped": 0, "suppressed": {}}
+
+    return {
+        "queued": _queue_handler.queue.qsize(),
+        "dropped": _queue_handler.dropped,
+        "suppressed": dict(_rate_filter.suppressed),
+    }
 
 
 # ======================================================
@@ -131,14 +372,3 @@ def get_logger(name: str) -> logging.Logger:
         logger.info("پیام تست")
     """
     return logging.getLogger(name)
-
-
-# ======================================================
-# تست اولیه لاگ (در زمان Startup)
-# ======================================================
-startup_logger = get_logger("startup")
-
-startup_logger.info("HR Logging system initialized")
-startup_logger.info(f"Environment: {settings.ENVIRONMENT}")
-startup_logger.info(f"Log level: {settings.LOG_LEVEL}")
-startup_logger.info(f"Log file: {settings.LOG_PATH}")
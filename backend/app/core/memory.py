@@ -0,0 +1,326 @@
+# backend/app/core/memory.py
+
+"""
+این فایل مسئول:
+- اندازه‌گیری حافظه (اختیاری، با tracemalloc)
+    - بیشترین حافظه تخصیص‌یافته در هر درخواست (Peak) به ازای هر Route
+    - پرمصرف‌ترین محل‌های تخصیص حافظه (Top Allocation Sites)
+    - مقایسه با یک Baseline (برای پیدا کردن رشد حافظه)
+- اندازه حافظه Cache ها (بدون نیاز به tracemalloc)
+
+چرا لازم است؟
+- endpoint های فهرستی کل نتیجه را به RowMapping، dict و مدل pydantic
+  تبدیل می‌کنند؛ با بزرگ شدن View ها حافظه هر Worker بالا می‌رود
+- برای تعیین سقف حافظه Worker ها باید Peak واقعی هر درخواست را دانست
+
+روشن کردن:
+    MEMORY_TRACKING_ENABLED=true        → از Startup
+    POST /admin/memory/tracing?enable=true → در زمان اجرا
+
+نکته:
+    tracemalloc سربار قابل توجهی دارد (حافظه و CPU)؛
+    فقط برای اندازه‌گیری روشن شود.
+    Peak درخواست‌های همزمان روی هم اثر می‌گذارند؛
+    این درخواست‌ها با overlapped شمرده می‌شوند.
+"""
+
+import sys
+import time
+import tracemalloc
+from threading import Lock
+from typing import Dict, List, Optional
+
+from app.core.cache import all_caches
+from app.core.config import settings
+
+try:
+    import resource
+except ImportError:     # ویندوز
+    resource = None
+
+
+# ======================================================
+# روشن / خاموش کردن tracemalloc
+# ======================================================
+_baseline: Optional[tracemalloc.Snapshot] = None
+
+
+def start_tracing():
+    """
+    شروع ردیابی تخصیص حافظه
+    """
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(settings.MEMORY_TRACEMALLOC_FRAMES)
+
+
+def stop_tracing():
+    """
+    توقف ردیابی (حافظه خود tracemalloc آزاد می‌شود)
+    """
+    global _baseline
+
+    _baseline = None
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def is_tracing() -> bool:
+    return tracemalloc.is_tracing()
+
+
+# ======================================================
+# Peak حافظه هر درخواست
+# ======================================================
+"""
+در شروع درخواست، اگر درخواست دیگری در جریان نباشد Peak صفر می‌شود
+(tracemalloc.reset_peak)؛ در پایان، Peak منهای حافظه شروع
+به عنوان مصرف درخواست ثبت می‌شود.
+"""
+
+_route_stats: Dict[str, Dict] = {}
+_inflight = 0
+_overlapped_since_reset = False
+_stats_lock = Lock()
+
+
+def _request_started() -> int:
+    global _inflight, _overlapped_since_reset
+
+    with _stats_lock:
+        if _inflight == 0:
+            tracemalloc.reset_peak()
+            _overlapped_since_reset = False
+        else:
+            _overlapped_since_reset = True
+        _inflight += 1
+        return tracemalloc.get_traced_memory()[0]
+
+
+def _request_finished(route: str, started_bytes: int):
+    global _inflight
+
+    _, peak = tracemalloc.get_traced_memory()
+    peak_bytes = max(peak - started_bytes, 0)
+
+    with _stats_lock:
+        _inflight -= 1
+        overlapped = _overlapped_since_reset
+
+        stats = _route_stats.get(route)
+        if stats is None:
+            stats = _route_stats[route] = {
+                "count": 0,
+                "overlapped": 0,
+                "total_peak_bytes": 0,
+                "max_peak_bytes": 0,
+                "last_peak_bytes": 0,
+            }
+
+        stats["count"] += 1
+        stats["overlapped"] += int(overlapped)
+        stats["total_peak_bytes"] += peak_bytes
+        stats["last_peak_bytes"] = peak_bytes
+        if peak_bytes > stats["max_peak_bytes"]:
+            stats["max_peak_bytes"] = peak_bytes
+
+
+def route_memory_stats() -> List[Dict]:
+    """
+    Peak حافظه درخواست‌ها به ازای هر Route (بیشترین مصرف اول)
+    """
+    with _stats_lock:
+        items = [(route, dict(stats)) for route, stats in _route_stats.items()]
+
+    result = []
+    for route, stats in items:
+        total = stats.pop("total_peak_bytes")
+        stats["avg_peak_bytes"] = total // stats["count"] if stats["count"] else 0
+        result.append({"route": route, **stats})
+
+    return sorted(result, key=lambda item: item["max_peak_bytes"], reverse=True)
+
+
+def reset_route_memory_stats():
+    with _stats_lock:
+        _route_stats.clear()
+
+
+class MemoryTrackingMiddleware:
+    """
+    ثبت Peak حافظه هر درخواست (ASGI خالص)
+
+    وقتی tracemalloc خاموش است فقط یک شرط ساده اجرا می‌شود.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracemalloc.is_tracing():
+            await self.app(scope, receive, send)
+            return
+
+        started_bytes = _request_started()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            route = scope.get("route")
+            _request_finished(
+                f"{scope.get('method', '')} "
+                f"{getattr(route, 'path', None) or 'unmatched'}",
+                started_bytes
+            )
+
+
+# ======================================================
+# اندازه حافظه Cache ها
+# ======================================================
+def deep_sizeof(obj, _seen: Optional[set] = None) -> int:
+    """
+    اندازه تقریبی یک شیء و همه اشیای داخل آن (بایت)
+
+    هر شیء فقط یک بار شمرده می‌شود (رشته‌های تکراری مشترک).
+    """
+    seen = _seen if _seen is not None else set()
+    stack = [obj]
+    total = 0
+
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if isinstance(current, (str, bytes, int, float, bool, type(None))):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        else:
+            attributes = getattr(current, "__dict__", None)
+            if attributes is not None:
+                stack.append(attributes)
+            for slot in getattr(type(current), "__slots__", ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+
+    return total
+
+
+def cache_footprints() -> Dict[str, Dict]:
+    """
+    حافظه تقریبی هر Cache
+    """
+    result = {}
+    for name, cache in all_caches().items():
+        started = time.perf_counter()
+        values = cache.values()
+        result[name] = {
+            "entries": len(values),
+            "bytes": deep_sizeof(values),
+            "measure_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+    return result
+
+
+# ======================================================
+# پرمصرف‌ترین محل‌های تخصیص
+# ======================================================
+_IGNORED_FILES = (
+    tracemalloc.__file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+)
+
+
+def _filtered_snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, pattern) for pattern in _IGNORED_FILES
+    ])
+
+
+def _format_stat(stat) -> Dict:
+    frame = stat.traceback[0]
+    return {
+        "site": f"{frame.filename}:{frame.lineno}",
+        "bytes": stat.size,
+        "count": stat.count,
+    }
+
+
+def top_allocation_sites(limit: int = 20, group_by: str = "lineno") -> List[Dict]:
+    """
+    محل‌هایی که بیشترین حافظه زنده را تخصیص داده‌اند
+
+    group_by: lineno | filename
+    """
+    if not tracemalloc.is_tracing():
+        return []
+
+    stats = _filtered_snapshot().statistics(group_by)
+    return [_format_stat(stat) for stat in stats[:limit]]
+
+
+def set_baseline():
+    """
+    ذخیره Snapshot فعلی برای مقایسه بعدی
+    """
+    global _baseline
+
+    if tracemalloc.is_tracing():
+        _baseline = _filtered_snapshot()
+
+
+def growth_since_baseline(limit: int = 20) -> List[Dict]:
+    """
+    بیشترین رشد حافظه نسبت به Baseline
+    """
+    if _baseline is None or not tracemalloc.is_tracing():
+        return []
+
+    diffs = _filtered_snapshot().compare_to(_baseline, "lineno")
+    return [
+        {
+            **_format_stat(diff),
+            "bytes_diff": diff.size_diff,
+            "count_diff": diff.count_diff,
+        }
+        for diff in diffs[:limit]
+    ]
+
+
+# ======================================================
+# گزارش کلی
+# ======================================================
+def _max_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # لینوکس: کیلوبایت / macOS: بایت
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+def memory_report(top: int = 20, group_by: str = "lineno") -> Dict:
+    """
+    گزارش کامل حافظه این Worker
+    """
+    tracing = tracemalloc.is_tracing()
+    current, peak = tracemalloc.get_traced_memory() if tracing else (0, 0)
+
+    return {
+        "tracing": tracing,
+        "traced_current_bytes": current,
+        "traced_peak_bytes": peak,
+        "tracemalloc_overhead_bytes": (
+            tracemalloc.get_tracemalloc_memory() if tracing else 0
+        ),
+        "max_rss_bytes": _max_rss_bytes(),
+        "caches": cache_footprints(),
+        "routes": route_memory_stats(),
+        "top_sites": top_allocation_sites(top, group_by),
+        "growth_since_baseline": growth_since_baseline(top),
+    }
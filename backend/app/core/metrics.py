@@ -0,0 +1,487 @@
+# backend/app/core/metrics.py
+
+"""
+این فایل مسئول:
+- اندازه‌گیری زمان مراحل هر درخواست (auth، db، handler، serialize)
+- ارسال هدر Server-Timing (قابل مشاهده در DevTools مرورگر)
+- نگه‌داری هیستوگرام زمان پاسخ به ازای هر Route (p50 / p95 / p99)
+- خروجی Prometheus برای endpoint /metrics
+
+اجزا:
+    TimingMiddleware  → Middleware خالص ASGI (شروع/پایان درخواست، هدر، هیستوگرام)
+    TimedRoute        → APIRoute سفارشی (زمان endpoint و validation/serialize)
+    timed("auth")     → اندازه‌گیری یک مرحله در هر جای کد
+    install_engine_timing(engine) → زمان Query ها (رویدادهای SQLAlchemy)
+
+مراحل (Server-Timing):
+    queue      → انتظار در صف Admission Control (app.core.admission)
+    auth       → احراز هویت (get_current_user)
+    db         → زمان اجرای Query ها (جمع؛ داخل handler هم حساب شده)
+    snapshot   → زمان Query های Snapshot محلی (app.core.snapshot)
+    handler    → اجرای تابع endpoint
+    serialize  → Validation ورودی، Dependency ها و تبدیل خروجی به JSON
+    total      → کل زمان تا شروع ارسال پاسخ
+
+نکته:
+    هر Worker آمار خودش را دارد (Prometheus هر Worker را جدا می‌بیند
+    یا پشت Load Balancer نمونه‌برداری می‌کند).
+"""
+
+import functools
+import inspect
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
+
+from fastapi.routing import APIRoute
+
+from app.core.config import settings
+from app.core.profiler import track_request
+
+
+# ======================================================
+# زمان مراحل درخواست جاری
+# ======================================================
+"""
+در شروع هر درخواست یک dict در ContextVar قرار می‌گیرد.
+Thread Pool های Starlette (run_in_threadpool) Context را کپی می‌کنند؛
+چون خود dict مشترک است، زمان‌های ثبت‌شده در Thread ها هم جمع می‌شوند.
+"""
+
+_request_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar(
+    "hr_request_timings", default=None
+)
+
+
+def record_timing(phase: str, seconds: float):
+    """
+    اضافه کردن زمان یک مرحله به درخواست جاری (بیرون از درخواست: بی‌اثر)
+    """
+    timings = _request_timings.get()
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0.0) + seconds
+
+
+@contextmanager
+def timed(phase: str):
+    """
+    اندازه‌گیری زمان یک بلوک کد
+
+    استفاده:
+        with timed("auth"):
+            ...
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(phase, time.perf_counter() - started)
+
+
+def current_timings() -> Dict[str, float]:
+    """
+    زمان مراحل درخواست جاری (برای لاگ یا پروفایل)
+    """
+    return dict(_request_timings.get() or {})
+
+
+# ======================================================
+# زمان Query ها (رویدادهای SQLAlchemy)
+# ======================================================
+def install_engine_timing(engine, phase: str = "db"):
+    """
+    ثبت زمان هر Query در مرحله phase درخواست جاری
+    """
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("hr_query_started", []).append(
+            time.perf_counter()
+        )
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["hr_query_started"].pop()
+        record_timing(phase, time.perf_counter() - started)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        if context.connection is None:
+            return
+        stack = context.connection.info.get("hr_query_started")
+        if stack:
+            record_timing(phase, time.perf_counter() - stack.pop())
+
+
+# ======================================================
+# هیستوگرام زمان پاسخ
+# ======================================================
+class LatencyHistogram:
+    """
+    هیستوگرام با مرزهای ثابت (مثل Prometheus)
+
+    برآورد صدک‌ها با درون‌یابی خطی داخل Bucket انجام می‌شود
+    (مرزهای Bucket به کمترین/بیشترین مقدار دیده‌شده محدود می‌شوند).
+    """
+
+    def __init__(self, buckets: List[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)   # آخری: +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                lower = max(
+                    self.buckets[index - 1] if index else 0.0, self.min
+                )
+                upper = min(
+                    self.buckets[index]
+                    if index < len(self.buckets) else self.max,
+                    self.max
+                )
+                fraction = (rank - cumulative) / bucket_count
+                return lower + (upper - lower) * fraction
+            cumulative += bucket_count
+        return self.max
+
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# (method, route) → هیستوگرام
+_histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+
+# (method, route, status) → تعداد
+_requests_total: Dict[Tuple[str, str, int], int] = {}
+
+# (route, phase) → جمع زمان (ثانیه)
+_phase_seconds: Dict[Tuple[str, str], float] = {}
+
+_metrics_lock = Lock()
+
+
+def observe_request(
+    method: str,
+    route: str,
+    status: int,
+    seconds: float,
+    phases: Dict[str, float]
+):
+    """
+    ثبت یک درخواست کامل‌شده
+    """
+    with _metrics_lock:
+        histogram = _histograms.get((method, route))
+        if histogram is None:
+            histogram = _histograms[(method, route)] = LatencyHistogram(
+                settings.METRICS_BUCKETS
+            )
+        histogram.observe(seconds)
+
+        key = (method, route, status)
+        _requests_total[key] = _requests_total.get(key, 0) + 1
+
+        for phase, value in phases.items():
+            phase_key = (route, phase)
+            _phase_seconds[phase_key] = (
+                _phase_seconds.get(phase_key, 0.0) + value
+            )
+
+
+def latency_summary() -> List[Dict]:
+    """
+    خلاصه زمان پاسخ هر Route (میلی‌ثانیه)
+    """
+    with _metrics_lock:
+        items = [
+            (method, route, histogram.count, histogram.sum,
+             [histogram.quantile(q) for q in QUANTILES])
+            for (method, route), histogram in _histograms.items()
+        ]
+
+    return [
+        {
+            "method": method,
+            "route": route,
+            "count": count,
+            "avg_ms": round(total / count * 1000, 2) if count else None,
+            **{
+                f"p{int(q * 100)}_ms": (
+                    round(value * 1000, 2) if value is not None else None
+                )
+                for q, value in zip(QUANTILES, values)
+            },
+        }
+        for method, route, count, total, values in sorted(
+            items, key=lambda item: (item[1], item[0])
+        )
+    ]
+
+
+def reset_metrics():
+    """
+    پاک کردن همه آمار
+    """
+    with _metrics_lock:
+        _histograms.clear()
+        _requests_total.clear()
+        _phase_seconds.clear()
+
+
+# ======================================================
+# خروجی Prometheus
+# ======================================================
+def _label(value) -> str:
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace('"', '\\"')
+    )
+
+
+def _number(value: float) -> str:
+    return repr(round(value, 6))
+
+
+def render_prometheus() -> str:
+    """
+    متن Prometheus (text exposition format 0.0.4)
+    """
+    lines = [
+        "# HELP hr_http_request_duration_seconds "
+        "HTTP request latency by route.",
+        "# TYPE hr_http_request_duration_seconds histogram",
+    ]
+
+    with _metrics_lock:
+        histograms = [
+            (key, list(h.counts), h.count, h.sum, h.buckets,
+             [h.quantile(q) for q in QUANTILES])
+            for key, h in _histograms.items()
+        ]
+        requests_total = dict(_requests_total)
+        phase_seconds = dict(_phase_seconds)
+
+    for (method, route), counts, count, total, buckets, _ in histograms:
+        labels = f'method="{_label(method)}",route="{_label(route)}"'
+        cumulative = 0
+        for bound, bucket_count in zip(buckets, counts):
+            cumulative += bucket_count
+            lines.append(
+                f"hr_http_request_duration_seconds_bucket"
+                f'{{{labels},le="{bound}"}} {cumulative}'
+            )
+        lines.append(
+            f"hr_http_request_duration_seconds_bucket"
+            f'{{{labels},le="+Inf"}} {count}'
+        )
+        lines.append(
+            f"hr_http_request_duration_seconds_sum{{{labels}}} "
+            f"{_number(total)}"
+        )
+        lines.append(
+            f"hr_http_request_duration_seconds_count{{{labels}}} {count}"
+        )
+
+    lines += [
+        "# HELP hr_http_request_latency_seconds "
+        "Estimated latency quantiles by route (from histogram buckets).",
+        "# TYPE hr_http_request_latency_seconds gauge",
+    ]
+    for (method, route), _, _, _, _, values in histograms:
+        for q, value in zip(QUANTILES, values):
+            if value is None:
+                continue
+            lines.append(
+                f"hr_http_request_latency_seconds"
+                f'{{method="{_label(method)}",route="{_label(route)}",'
+                f'quantile="{q}"}} {_number(value)}'
+            )
+
+    lines += [
+        "# HELP hr_http_requests_total HTTP requests by route and status.",
+        "# TYPE hr_http_requests_total counter",
+    ]
+    for (method, route, status), value in sorted(requests_total.items()):
+        lines.append(
+            f"hr_http_requests_total"
+            f'{{method="{_label(method)}",route="{_label(route)}",'
+            f'status="{status}"}} {value}'
+        )
+
+    lines += [
+        "# HELP hr_http_phase_seconds_total "
+        "Time spent per request phase by route.",
+        "# TYPE hr_http_phase_seconds_total counter",
+    ]
+    for (route, phase), value in sorted(phase_seconds.items()):
+        lines.append(
+            f"hr_http_phase_seconds_total"
+            f'{{route="{_label(route)}",phase="{_label(phase)}"}} '
+            f"{_number(value)}"
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+# ======================================================
+# Route سفارشی: زمان endpoint و serialize
+# ======================================================
+def _timed_endpoint(endpoint: Callable, route_path: str) -> Callable:
+    """
+    پوشاندن تابع endpoint برای ثبت مرحله handler
+    (و ردیابی درخواست برای پروفایلر)
+
+    امضای تابع (برای FastAPI) با functools.wraps حفظ می‌شود.
+    include_router همان endpoint پوشانده‌شده را دوباره ثبت می‌کند؛
+    پوشاندن دوباره انجام نمی‌شود.
+    """
+    if getattr(endpoint, "_hr_timed", False):
+        return endpoint
+
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            with timed("handler"), track_request(route_path):
+                return await endpoint(*args, **kwargs)
+    else:
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            with timed("handler"), track_request(route_path):
+                return endpoint(*args, **kwargs)
+
+    wrapper._hr_timed = True
+    return wrapper
+
+
+class TimedRoute(APIRoute):
+    """
+    APIRoute با اندازه‌گیری مراحل
+
+    زمان کل پردازش Route منهای handler و auth
+    به عنوان serialize ثبت می‌شود
+    (خواندن Body، Validation ورودی، Dependency ها، تبدیل خروجی به JSON).
+
+    استفاده:
+        router = APIRouter(prefix="/api/hr", route_class=TimedRoute)
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, _timed_endpoint(endpoint, path), **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request):
+            started = time.perf_counter()
+            try:
+                return await handler(request)
+            finally:
+                timings = _request_timings.get()
+                if timings is not None:
+                    elapsed = time.perf_counter() - started
+                    timings["serialize"] = max(
+                        elapsed
+                        - timings.get("handler", 0.0)
+                        - timings.get("auth", 0.0),
+                        0.0
+                    )
+
+        return timed_handler
+
+
+# ======================================================
+# Middleware (ASGI خالص)
+# ======================================================
+_SERVER_TIMING_ORDER = (
+    "queue", "auth", "db", "snapshot", "handler", "serialize"
+)
+
+
+def _server_timing_header(timings: Dict[str, float], total: float) -> bytes:
+    parts = [
+        f"{phase};dur={timings[phase] * 1000:.1f}"
+        for phase in _SERVER_TIMING_ORDER
+        if phase in timings
+    ]
+    parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts).encode("latin-1")
+
+
+class TimingMiddleware:
+    """
+    ثبت زمان درخواست‌ها و افزودن هدر Server-Timing
+
+    به صورت ASGI خالص نوشته شده (نه BaseHTTPMiddleware)
+    تا پاسخ‌های Streaming بافر نشوند و سربار کم باشد.
+
+    زمان ثبت‌شده در هیستوگرام: تا پایان ارسال Body
+    (برای Export های Streaming یعنی کل مدت دانلود).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings: Dict[str, float] = {}
+        token = _request_timings.set(timings)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if settings.SERVER_TIMING_ENABLED:
+                    headers = list(message.get("headers", []))
+                    headers.append((
+                        b"server-timing",
+                        _server_timing_header(
+                            timings, time.perf_counter() - started
+                        )
+                    ))
+                    message = {**message, "headers": headers}
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_timings.reset(token)
+
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            observe_request(
+                scope.get("method", ""),
+                route_path,
+                status,
+                time.perf_counter() - started,
+                timings
+            )
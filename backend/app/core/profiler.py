@@ -0,0 +1,334 @@
+# backend/app/core/profiler.py
+
+"""
+این فایل مسئول:
+- پروفایل نمونه‌برداری (Sampling Profiler) روی Worker در حال اجرا
+    - برای N ثانیه (همه Thread های مشغول)
+    - یا برای N درخواست بعدی یک Route (فقط Thread همان درخواست‌ها)
+- خروجی Collapsed Stack (قابل استفاده در flamegraph.pl و speedscope)
+
+روش کار:
+    یک Thread پس‌زمینه هر PROFILER_INTERVAL_MS میلی‌ثانیه
+    Stack همه Thread ها را با sys._current_frames() می‌خواند و می‌شمارد.
+    به کد برنامه هیچ Hook یا Trace اضافه نمی‌شود (سربار کم).
+
+ایمنی:
+    - PROFILER_ENABLED به صورت پیش‌فرض خاموش است
+    - وقتی پروفایلی در حال اجرا نیست، track_request فقط یک شرط ساده است
+    - هر بار فقط یک پروفایل و حداکثر PROFILER_MAX_SECONDS ثانیه
+
+خروجی (هر خط یک Stack و تعداد نمونه):
+    MainThread;run (server.py:68);handle (router.py:90);... 42
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import nullcontext
+from typing import Dict, Optional, Set
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ProfilerError(Exception):
+    """
+    خطای شروع / وضعیت پروفایلر (پیام آن به کاربر نمایش داده می‌شود)
+    """
+
+
+# ======================================================
+# تشخیص Thread بیکار
+# ======================================================
+"""
+در حالت ثانیه‌ای، Thread هایی که فقط منتظرند (Thread Pool خالی،
+Event Loop در select، Prober در Event.wait) نمونه‌ها را شلوغ می‌کنند؛
+اگر بالاترین Frame در این فایل‌ها باشد، نمونه شمرده نمی‌شود.
+"""
+
+_IDLE_FILES = (
+    "threading.py",
+    "selectors.py",
+    "queue.py",
+    os.path.join("concurrent", "futures", "thread.py"),
+)
+
+
+def _is_idle(frame) -> bool:
+    return frame.f_code.co_filename.endswith(_IDLE_FILES)
+
+
+def _short_path(filename: str) -> str:
+    parts = filename.replace("\\", "/").split("/")
+    if "app" in parts:
+        return "/".join(parts[parts.index("app"):])
+    return "/".join(parts[-2:])
+
+
+def _collapse(frame, thread_name: str) -> str:
+    """
+    تبدیل Stack یک Thread به یک خط Collapsed (ریشه → برگ)
+    """
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(
+            f"{code.co_name} ({_short_path(code.co_filename)}:"
+            f"{code.co_firstlineno})"
+        )
+        frame = frame.f_back
+
+    names.append(thread_name)
+    names.reverse()
+    return ";".join(name.replace(";", ":") for name in names)
+
+
+# ======================================================
+# یک جلسه پروفایل
+# ======================================================
+class _Session:
+
+    def __init__(
+        self,
+        seconds: float,
+        requests: Optional[int],
+        route: Optional[str],
+        include_idle: bool
+    ):
+        self.mode = "requests" if requests else "seconds"
+        self.seconds = seconds
+        self.remaining = requests
+        self.route = route
+        self.include_idle = include_idle
+
+        self.started_at = time.time()
+        self.deadline = time.monotonic() + seconds
+        self.finished_at: Optional[float] = None
+        self.samples = 0
+        self.requests_profiled = 0
+        self.stacks: Counter = Counter()
+
+        # Thread هایی که الان درخواست منطبق را پردازش می‌کنند
+        self.active_threads: Set[int] = set()
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+
+    def matches(self, route_path: str) -> bool:
+        return self.route is None or route_path.startswith(self.route)
+
+    def status(self) -> Dict:
+        return {
+            "mode": self.mode,
+            "route": self.route,
+            "running": not self.done.is_set(),
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "max_seconds": self.seconds,
+            "requests_remaining": self.remaining,
+            "requests_profiled": self.requests_profiled,
+            "samples": self.samples,
+            "distinct_stacks": len(self.stacks),
+        }
+
+
+_session: Optional[_Session] = None
+_session_lock = threading.Lock()
+
+
+# ======================================================
+# Thread نمونه‌برداری
+# ======================================================
+def _sample_loop(session: _Session):
+    interval = settings.PROFILER_INTERVAL_MS / 1000
+    own_ident = threading.get_ident()
+
+    try:
+        while not session.done.is_set():
+            if time.monotonic() >= session.deadline:
+                break
+
+            # حالت requests: تا شروع درخواست منطبق، نمونه‌برداری لازم نیست
+            if session.mode == "requests" and not session.active_threads:
+                time.sleep(interval)
+                continue
+
+            names = {t.ident: t.name for t in threading.enumerate()}
+            frames = sys._current_frames()
+
+            with session.lock:
+                if session.mode == "requests":
+                    targets = session.active_threads & frames.keys()
+                else:
+                    targets = frames.keys() - {own_ident}
+
+                for ident in targets:
+                    frame = frames[ident]
+                    if not session.include_idle and _is_idle(frame):
+                        continue
+                    session.stacks[
+                        _collapse(frame, names.get(ident, str(ident)))
+                    ] += 1
+
+                session.samples += 1
+
+            # آزاد کردن ارجاع به Frame ها (جلوگیری از نگه‌داشتن حافظه)
+            del frames
+            time.sleep(interval)
+    finally:
+        session.finished_at = time.time()
+        session.done.set()
+        logger.info(
+            "Profiler finished: %s samples, %s stacks",
+            session.samples,
+            len(session.stacks)
+        )
+
+
+# ======================================================
+# API عمومی
+# ======================================================
+def start_profile(
+    seconds: float,
+    requests: Optional[int] = None,
+    route: Optional[str] = None,
+    include_idle: bool = False
+) -> Dict:
+    """
+    شروع پروفایل
+
+    seconds:
+        مدت پروفایل (در حالت requests: حداکثر زمان انتظار)
+    requests:
+        اگر داده شود، فقط N درخواست بعدی منطبق با route پروفایل می‌شوند
+    route:
+        پیشوند مسیر Route (مثل /api/hr/users)
+    """
+    global _session
+
+    if not settings.PROFILER_ENABLED:
+        raise ProfilerError("پروفایلر غیرفعال است (PROFILER_ENABLED)")
+
+    if seconds <= 0 or seconds > settings.PROFILER_MAX_SECONDS:
+        raise ProfilerError(
+            f"مدت پروفایل باید بین 0 و {settings.PROFILER_MAX_SECONDS} "
+            f"ثانیه باشد"
+        )
+
+    with _session_lock:
+        if _session is not None and not _session.done.is_set():
+            raise ProfilerError("یک پروفایل دیگر در حال اجراست")
+
+        session = _Session(seconds, requests, route, include_idle)
+        _session = session
+
+    threading.Thread(
+        target=_sample_loop,
+        args=(session,),
+        name="hr-profiler",
+        daemon=True
+    ).start()
+
+    logger.info(
+        "Profiler started (mode=%s, seconds=%s, requests=%s, route=%s)",
+        session.mode, seconds, requests, route
+    )
+    return session.status()
+
+
+def stop_profile() -> Optional[Dict]:
+    """
+    توقف زودتر پروفایل جاری
+    """
+    session = _session
+    if session is None:
+        return None
+    session.done.set()
+    return session.status()
+
+
+def profile_status() -> Optional[Dict]:
+    """
+    وضعیت آخرین پروفایل
+    """
+    session = _session
+    return session.status() if session is not None else None
+
+
+def wait_profile(timeout: Optional[float] = None) -> bool:
+    """
+    انتظار برای پایان پروفایل جاری
+    """
+    session = _session
+    return session is None or session.done.wait(timeout)
+
+
+def collapsed_stacks() -> str:
+    """
+    خروجی Collapsed Stack آخرین پروفایل (قابل استفاده در flamegraph.pl)
+    """
+    session = _session
+    if session is None:
+        return ""
+
+    with session.lock:
+        items = session.stacks.most_common()
+
+    return "".join(f"{stack} {count}\n" for stack, count in items)
+
+
+# ======================================================
+# ردیابی درخواست‌ها (حالت N درخواست بعدی)
+# ======================================================
+class _RequestTracker:
+
+    def __init__(self, session: _Session):
+        self.session = session
+        self.ident = threading.get_ident()
+
+    def __enter__(self):
+        with self.session.lock:
+            self.session.active_threads.add(self.ident)
+
+    def __exit__(self, *exc_info):
+        session = self.session
+        with session.lock:
+            session.active_threads.discard(self.ident)
+            session.requests_profiled += 1
+            finished = session.remaining == 0 and not session.active_threads
+
+        # بعد از پایان آخرین درخواست، پروفایل تمام می‌شود
+        if finished:
+            session.done.set()
+        return False
+
+
+_NULL = nullcontext()
+
+
+def track_request(route_path: str):
+    """
+    Context Manager دور اجرای endpoint (در TimedRoute)
+
+    وقتی پروفایل «N درخواست بعدی» فعال نیست، هیچ کاری انجام نمی‌دهد.
+    endpoint های async روی Thread حلقه رویداد اجرا می‌شوند؛
+    نمونه‌های آن Thread در آن بازه شامل کار درخواست‌های همزمان هم هست.
+    """
+    session = _session
+    if (
+        session is None
+        or session.mode != "requests"
+        or session.done.is_set()
+        or not session.matches(route_path)
+    ):
+        return _NULL
+
+    with session.lock:
+        if session.remaining <= 0:
+            return _NULL
+        session.remaining -= 1
+
+    return _RequestTracker(session)
@@ -0,0 +1,673 @@
+# backend/app/core/snapshot.py
+
+"""
+این فایل مسئول:
+- نگه‌داری یک کپی محلی (Snapshot) از جدول‌ها و View های کم‌تغییر
+  در یک فایل SQLite
+- همگام‌سازی دوره‌ای با SQL Server (در پس‌زمینه)
+- پاسخ دادن به Query های خواندنی از Snapshot (اگر به‌اندازه کافی تازه باشد)
+- ادامه سرویس خواندنی در زمان قطعی SQL Server (با داده قدیمی‌تر)
+
+چرا لازم است؟
+- داده‌های HR خیلی بیشتر خوانده می‌شوند تا نوشته شوند
+- هر خواندن یک رفت‌وبرگشت شبکه تا SQL Server است؛
+  خواندن از فایل محلی چند برابر سریع‌تر است
+
+روش کار:
+    register_snapshot_source("Users", indexes=[("NationalCode",)])
+        → جدول Users در Snapshot نگه‌داری می‌شود
+
+    read_query(sql, params, sources=("Users",))
+        1. اگر Snapshot همه sources تازه‌تر از SNAPSHOT_MAX_STALENESS_SEC باشد
+           → همان sql روی فایل محلی اجرا می‌شود
+        2. در غیر این صورت (یا خطای اجرای محلی) → SQL Server
+        3. اگر SQL Server در دسترس نباشد و SNAPSHOT_SERVE_STALE_ON_ERROR
+           → Snapshot (هر چقدر قدیمی) برگردانده می‌شود
+
+همگام‌سازی:
+    - هر منبع کامل در یک جدول موقت کپی و سپس جایگزین می‌شود
+      (خواننده‌ها هیچ‌وقت جدول نیمه‌کاره نمی‌بینند)
+    - روی SQL Server اول یک Fingerprint (تعداد + CHECKSUM_AGG) گرفته می‌شود؛
+      اگر تغییری نکرده باشد کپی انجام نمی‌شود
+    - بعد از نوشتن (mark_snapshot_stale) آن منبع تا همگام‌سازی بعدی
+      از SQL Server خوانده می‌شود
+
+چند Worker:
+    همه Worker ها از یک فایل می‌خوانند؛ هر Worker اگر منبعی به تازگی
+    توسط Worker دیگری همگام شده باشد، آن را دوباره کپی نمی‌کند.
+
+نکته:
+    sql باید روی SQLite هم قابل اجرا باشد (SELECT ساده، بدون TOP و توابع T-SQL)؛
+    در غیر این صورت هر بار از SQL Server خوانده می‌شود.
+"""
+
+import os
+import sqlite3
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from threading import Event, Lock, Thread
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.sql.elements import TextClause
+
+from app.core.config import settings
+from app.core.database import execute_query, execute_query_one, get_engine
+from app.core.logging import get_logger
+from app.core.metrics import install_engine_timing
+
+logger = get_logger(__name__)
+
+# خطاهایی که یعنی SQL Server در دسترس نیست (نه خطای خود Query)
+_UNAVAILABLE_ERRORS = (OperationalError, InterfaceError, PoolTimeoutError)
+
+
+# ======================================================
+# ثبت منابع
+# ======================================================
+"""
+هر منبع:
+    name    → نام جدول / View (در Snapshot هم با همین نام)
+    select  → Query کپی (پیش‌فرض: SELECT * FROM name)
+    indexes → ایندکس‌های جدول محلی (برای WHERE های Repository)
+    tables  → جدول‌هایی که تغییرشان این منبع را کهنه می‌کند
+"""
+
+_sources: Dict[str, Dict] = {}
+
+
+def register_snapshot_source(
+    name: str,
+    select_sql: Optional[str] = None,
+    indexes: Iterable[Sequence[str]] = (),
+    tables: Optional[Iterable[str]] = None
+):
+    """
+    ثبت یک جدول / View برای نگه‌داری در Snapshot
+    """
+    _sources[name] = {
+        "select": select_sql or f"SELECT * FROM {name}",
+        "indexes": [tuple(columns) for columns in indexes],
+        "tables": set(tables or (name,)),
+    }
+
+
+# ======================================================
+# نوع ستون‌ها (حفظ نوع Python در رفت و برگشت)
+# ======================================================
+"""
+SQLite نوع ثابت ندارد؛ نوع هر ستون از اولین مقدار غیر None تشخیص داده می‌شود
+و با نام نوع سفارشی در جدول ثبت می‌شود تا هنگام خواندن
+(detect_types=PARSE_DECLTYPES) همان نوع Python برگردد (مثلاً bit → bool).
+"""
+
+sqlite3.register_converter("HRBOOL", lambda value: value != b"0")
+sqlite3.register_converter("HRDECIMAL", lambda value: Decimal(value.decode()))
+sqlite3.register_converter(
+    "HRDATETIME", lambda value: datetime.fromisoformat(value.decode())
+)
+sqlite3.register_converter(
+    "HRDATE", lambda value: date.fromisoformat(value.decode())
+)
+
+
+def _column_type(value) -> str:
+    if isinstance(value, bool):
+        return "HRBOOL"
+    if isinstance(value, int):
+        return "INTEGER"
+    if isinstance(value, float):
+        return "REAL"
+    if isinstance(value, Decimal):
+        return "HRDECIMAL"
+    if isinstance(value, datetime):
+        return "HRDATETIME"
+    if isinstance(value, date):
+        return "HRDATE"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "BLOB"
+    return "TEXT"
+
+
+def _to_sqlite(value):
+    if value is None or isinstance(value, (str, int, float, bytes)):
+        return value
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+    return str(value)
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+# ======================================================
+# Engine فایل محلی
+# ======================================================
+_local_engine: Optional[Engine] = None
+_local_lock = Lock()
+
+
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    # WAL: خواندن همزمان با جایگزینی جدول‌ها
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def get_local_engine() -> Engine:
+    """
+    Engine فایل Snapshot (در اولین استفاده ساخته می‌شود)
+    """
+    global _local_engine
+
+    if _local_engine is None:
+        with _local_lock:
+            if _local_engine is None:
+                directory = os.path.dirname(settings.SNAPSHOT_DB_PATH)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+
+                engine = create_engine(
+                    f"sqlite:///{settings.SNAPSHOT_DB_PATH}",
+                    connect_args={
+                        "check_same_thread": False,
+                        "timeout": 30,
+                        "detect_types": sqlite3.PARSE_DECLTYPES,
+                    },
+                )
+                event.listen(engine, "connect", _sqlite_pragmas)
+                install_engine_timing(engine, phase="snapshot")
+
+                with engine.begin() as conn:
+                    conn.execute(text("""
+                        CREATE TABLE IF NOT EXISTS _snapshot_meta (
+                            name TEXT PRIMARY KEY,
+                            started_at REAL,
+                            synced_at REAL,
+                            dirty_at REAL,
+                            rows INTEGER,
+                            elapsed_ms REAL,
+                            fingerprint TEXT
+                        )
+                    """))
+                _local_engine = engine
+    return _local_engine
+
+
+# ======================================================
+# وضعیت منابع (Meta)
+# ======================================================
+"""
+اطلاعات همگام‌سازی در جدول _snapshot_meta (مشترک بین Worker ها) است؛
+هر Worker یک کپی از آن را حداکثر هر _META_REFRESH_SEC ثانیه دوباره می‌خواند.
+"""
+
+_META_REFRESH_SEC = 2.0
+
+_meta: Dict = {"loaded_at": 0.0, "sources": {}}
+_stats = {
+    "local_reads": 0,
+    "live_reads": 0,
+    "stale_reads": 0,
+    "local_errors": 0,
+}
+_stats_lock = Lock()
+
+
+def _count(key: str):
+    with _stats_lock:
+        _stats[key] += 1
+
+
+def _load_meta(force: bool = False) -> Dict[str, Dict]:
+    now = time.monotonic()
+    if not force and now - _meta["loaded_at"] < _META_REFRESH_SEC:
+        return _meta["sources"]
+
+    with get_local_engine().connect() as conn:
+        rows = conn.execute(text("SELECT * FROM _snapshot_meta")).mappings()
+        _meta["sources"] = {row["name"]: dict(row) for row in rows}
+    _meta["loaded_at"] = now
+    return _meta["sources"]
+
+
+def _write_meta(name: str, **values):
+    columns = ", ".join(values)
+    placeholders = ", ".join(f":{key}" for key in values)
+    updates = ", ".join(f"{key} = excluded.{key}" for key in values)
+
+    with get_local_engine().begin() as conn:
+        conn.execute(
+            text(f"""
+                INSERT INTO _snapshot_meta (name, {columns})
+                VALUES (:name, {placeholders})
+                ON CONFLICT (name) DO UPDATE SET {updates}
+            """),
+            {"name": name, **values}
+        )
+    _meta["loaded_at"] = 0.0
+
+
+"""
+منابع کهنه‌شده در همین Process (نام → زمان نوشتن)؛
+اگر ثبت dirty_at در _snapshot_meta شکست بخورد (مثلاً قفل فایل)،
+خواندن‌های بعدی این Process باز هم از SQL Server انجام می‌شوند.
+"""
+_dirty: Dict[str, float] = {}
+
+
+def _is_usable(meta: Optional[Dict], max_age: Optional[float]) -> bool:
+    """
+    آیا Snapshot یک منبع قابل استفاده است؟
+
+    max_age=None → هر Snapshot موجود (حالت قطعی SQL Server)
+    """
+    if meta is None or meta["synced_at"] is None:
+        return False
+    if max_age is None:
+        return True
+    if meta["dirty_at"] is not None and meta["dirty_at"] >= meta["started_at"]:
+        return False
+    dirty_at = _dirty.get(meta["name"])
+    if dirty_at is not None and dirty_at >= meta["started_at"]:
+        return False
+    return time.time() - meta["started_at"] <= max_age
+
+
+# ======================================================
+# خواندن
+# ======================================================
+_incompatible: set = set()
+
+# پیام‌هایی که یعنی خود Query با SQLite سازگار نیست (نه خطای گذرا)
+_INCOMPATIBLE_MESSAGES = ("syntax error", "no such function")
+
+
+def _is_incompatible(exc: Exception) -> bool:
+    """
+    خطای ناسازگاری Dialect (T-SQL روی SQLite)
+
+    خطاهای دیگر (قفل، I/O، تغییر Schema، پارامتر نامعتبر) گذرا هستند
+    و Query در دفعه بعد دوباره روی Snapshot امتحان می‌شود.
+    """
+    orig = getattr(exc, "orig", exc)
+    if not isinstance(orig, sqlite3.OperationalError):
+        return False
+    message = str(orig)
+    return any(part in message for part in _INCOMPATIBLE_MESSAGES)
+
+
+def _local_read(
+    sql: str | TextClause,
+    params: Optional[dict],
+    sources: Sequence[str],
+    max_age: Optional[float],
+    one: bool
+):
+    """
+    اجرای Query روی Snapshot (None = Snapshot قابل استفاده نیست)
+    """
+    key = str(sql)
+    if key in _incompatible:
+        return None
+
+    try:
+        meta = _load_meta()
+        if not all(_is_usable(meta.get(name), max_age) for name in sources):
+            return None
+
+        statement = text(sql) if isinstance(sql, str) else sql
+        with get_local_engine().connect() as conn:
+            result = conn.execute(statement, params or {}).mappings()
+            return [result.first()] if one else result.all()
+    except Exception as exc:
+        _count("local_errors")
+        if _is_incompatible(exc):
+            # Query با SQLite سازگار نیست → از این به بعد همیشه SQL Server
+            _incompatible.add(key)
+        logger.warning(
+            "Snapshot query failed, using live database: %s", str(exc)[:300]
+        )
+        return None
+
+
+def _read(sql, params, sources, one: bool):
+    if settings.SNAPSHOT_ENABLED and sources:
+        rows = _local_read(
+            sql, params, sources, settings.SNAPSHOT_MAX_STALENESS_SEC, one
+        )
+        if rows is not None:
+            _count("local_reads")
+            return rows[0] if one else rows
+
+    try:
+        _count("live_reads")
+        if one:
+            return execute_query_one(sql, params)
+        return execute_query(sql, params)
+    except _UNAVAILABLE_ERRORS as exc:
+        if not (
+            settings.SNAPSHOT_ENABLED
+            and settings.SNAPSHOT_SERVE_STALE_ON_ERROR
+            and sources
+        ):
+            raise
+
+        rows = _local_read(sql, params, sources, None, one)
+        if rows is None:
+            raise
+
+        _count("stale_reads")
+        logger.warning(
+            "Database unavailable, serving snapshot for %s: %s",
+            ", ".join(sources), str(exc)[:200]
+        )
+        return rows[0] if one else rows
+
+
+def read_query(
+    sql: str | TextClause,
+    params: Optional[dict] = None,
+    sources: Sequence[str] = ()
+):
+    """
+    مثل execute_query؛ در صورت امکان از Snapshot محلی
+
+    sources:
+        منابع ثبت‌شده‌ای که sql از آن‌ها می‌خواند
+    """
+    return _read(sql, params, sources, one=False)
+
+
+def read_query_one(
+    sql: str | TextClause,
+    params: Optional[dict] = None,
+    sources: Sequence[str] = ()
+):
+    """
+    مثل execute_query_one؛ در صورت امکان از Snapshot محلی
+    """
+    return _read(sql, params, sources, one=True)
+
+
+# ======================================================
+# همگام‌سازی
+# ======================================================
+def table_fingerprint(name: str) -> Optional[str]:
+    """
+    اثر انگشت سبک داده روی SQL Server (بدون انتقال رکوردها)
+
+    برای دیتابیس‌های دیگر (یا ستون‌هایی که CHECKSUM ندارند) None
+    """
+    if get_engine().dialect.name != "mssql":
+        return None
+    try:
+        row = execute_query_one(
+            f"SELECT COUNT_BIG(*) AS n, "
+            f"CHECKSUM_AGG(BINARY_CHECKSUM(*)) AS c FROM {name}"
+        )
+    except _UNAVAILABLE_ERRORS:
+        raise
+    except Exception:
+        return None
+    return f"{row['n']}:{row['c']}"
+
+
+def _copy_source(name: str, source: Dict) -> int:
+    """
+    کپی کامل یک منبع در جدول موقت و جایگزینی جدول فعلی
+    """
+    staging = f"{name}__sync"
+    rows_copied = 0
+    local = get_local_engine()
+    raw = local.raw_connection()
+
+    try:
+        cursor = raw.driver_connection.cursor()
+        cursor.execute(f"DROP TABLE IF EXISTS {_quote(staging)}")
+
+        with get_engine().connect() as conn:
+            result = conn.execution_options(
+                stream_results=True,
+                yield_per=settings.SNAPSHOT_SYNC_CHUNK_SIZE
+            ).execute(text(source["select"]))
+            columns = list(result.keys())
+
+            # هر Chunk یک Transaction کوتاه: قفل نوشتن SQLite در طول
+            # خواندن از SQL Server نگه داشته نمی‌شود (mark_snapshot_stale
+            # و Worker های دیگر منتظر کل کپی نمی‌مانند)
+            insert_sql = None
+            for chunk in result.partitions(settings.SNAPSHOT_SYNC_CHUNK_SIZE):
+                if insert_sql is None:
+                    insert_sql = _create_table(cursor, staging, columns, chunk)
+                cursor.executemany(
+                    insert_sql,
+                    [tuple(_to_sqlite(value) for value in row) for row in chunk]
+                )
+                raw.driver_connection.commit()
+                rows_copied += len(chunk)
+
+            if insert_sql is None:
+                _create_table(cursor, staging, columns, [])
+        raw.driver_connection.commit()
+
+        # جایگزینی در یک Transaction (خواننده‌ها نسخه قبلی یا جدید را می‌بینند)
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute(f"DROP TABLE IF EXISTS {_quote(name)}")
+        cursor.execute(
+            f"ALTER TABLE {_quote(staging)} RENAME TO {_quote(name)}"
+        )
+        for index_columns in source["indexes"]:
+            cursor.execute(
+                f"CREATE INDEX {_quote('IX_' + name + '_' + '_'.join(index_columns))} "
+                f"ON {_quote(name)} "
+                f"({', '.join(_quote(column) for column in index_columns)})"
+            )
+        cursor.execute("COMMIT")
+    except Exception:
+        raw.driver_connection.rollback()
+        raise
+    finally:
+        raw.close()
+
+    return rows_copied
+
+
+def _create_table(cursor, table: str, columns: List[str], rows) -> str:
+    types = {}
+    for index, column in enumerate(columns):
+        value = next(
+            (row[index] for row in rows if row[index] is not None), None
+        )
+        types[column] = _column_type(value) if value is not None else ""
+
+    cursor.execute(
+        f"CREATE TABLE {_quote(table)} ("
+        + ", ".join(
+            f"{_quote(column)} {types[column]}".strip() for column in columns
+        )
+        + ")"
+    )
+    return (
+        f"INSERT INTO {_quote(table)} VALUES "
+        f"({', '.join('?' for _ in columns)})"
+    )
+
+
+def sync_source(name: str, force: bool = False) -> Dict:
+    """
+    همگام‌سازی یک منبع با SQL Server
+
+    force=False:
+        اگر منبع (توسط هر Worker) کمتر از SNAPSHOT_SYNC_INTERVAL_SEC
+        پیش همگام شده و کهنه نشده باشد، کاری انجام نمی‌شود
+    """
+    source = _sources[name]
+    meta = _load_meta(force=True).get(name)
+
+    if not force and _is_usable(meta, settings.SNAPSHOT_SYNC_INTERVAL_SEC):
+        return {"name": name, "action": "skipped"}
+
+    started_at = time.time()
+    started = time.perf_counter()
+    fingerprint = table_fingerprint(name)
+
+    if (
+        fingerprint is not None
+        and meta is not None
+        and meta["synced_at"] is not None
+        and meta["fingerprint"] == fingerprint
+    ):
+        _write_meta(name, started_at=started_at, synced_at=time.time())
+        return {"name": name, "action": "unchanged"}
+
+    rows = _copy_source(name, source)
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    _write_meta(
+        name,
+        started_at=started_at,
+        synced_at=time.time(),
+        rows=rows,
+        elapsed_ms=elapsed_ms,
+        fingerprint=fingerprint
+    )
+
+    if _dirty.get(name, started_at) < started_at:
+        _dirty.pop(name, None)
+
+    logger.info(
+        "Snapshot %s synced: %s rows in %s ms", name, rows, elapsed_ms
+    )
+    return {"name": name, "action": "copied", "rows": rows, "elapsed_ms": elapsed_ms}
+
+
+def sync_all(force: bool = False) -> List[Dict]:
+    """
+    همگام‌سازی همه منابع (خطای یک منبع بقیه را متوقف نمی‌کند)
+    """
+    results = []
+    for name in list(_sources):
+        try:
+            results.append(sync_source(name, force=force))
+        except Exception as exc:
+            logger.warning("Snapshot sync of %s failed: %s", name, exc)
+            results.append({"name": name, "action": "failed", "error": str(exc)[:300]})
+    return results
+
+
+def mark_snapshot_stale(*tables: str):
+    """
+    اعلام تغییر جدول‌ها (بعد از نوشتن)
+
+    منابع وابسته تا همگام‌سازی بعدی از SQL Server خوانده می‌شوند
+    و Thread همگام‌سازی زودتر بیدار می‌شود.
+    اگر ثبت در _snapshot_meta شکست بخورد، دست‌کم همین Process
+    (با _dirty) تا همگام‌سازی بعدی از SQL Server می‌خواند.
+    """
+    if not settings.SNAPSHOT_ENABLED:
+        return
+
+    now = time.time()
+    for name, source in _sources.items():
+        if source["tables"] & set(tables):
+            _dirty[name] = now
+            try:
+                _write_meta(name, dirty_at=now)
+            except Exception as exc:
+                logger.warning("Could not mark snapshot %s stale: %s", name, exc)
+    _wake.set()
+
+
+# ======================================================
+# Thread همگام‌سازی
+# ======================================================
+_stop = Event()
+_wake = Event()
+_thread: Optional[Thread] = None
+
+
+def _sync_loop():
+    while not _stop.is_set():
+        sync_all()
+        _wake.wait(settings.SNAPSHOT_SYNC_INTERVAL_SEC)
+        _wake.clear()
+
+
+def start_snapshot_sync():
+    """
+    شروع همگام‌سازی پس‌زمینه (در Startup؛ اگر SNAPSHOT_ENABLED)
+    """
+    global _thread
+
+    if not settings.SNAPSHOT_ENABLED or not _sources:
+        return
+    if _thread is not None and _thread.is_alive():
+        return
+
+    _stop.clear()
+    _thread = Thread(target=_sync_loop, name="hr-snapshot-sync", daemon=True)
+    _thread.start()
+    logger.info(
+        "Snapshot sync started (%s sources, every %ss)",
+        len(_sources), settings.SNAPSHOT_SYNC_INTERVAL_SEC
+    )
+
+
+def stop_snapshot_sync(timeout: float = 5):
+    _stop.set()
+    _wake.set()
+    if _thread is not None:
+        _thread.join(timeout)
+
+
+# ======================================================
+# گزارش
+# ======================================================
+def snapshot_status() -> Dict:
+    """
+    وضعیت Snapshot (برای /health و /admin/snapshot)
+    """
+    if not settings.SNAPSHOT_ENABLED:
+        return {"enabled": False}
+
+    with _stats_lock:
+        stats = dict(_stats)
+
+    try:
+        meta = _load_meta()
+    except Exception as exc:
+        return {"enabled": True, "error": str(exc)[:300], **stats}
+
+    now = time.time()
+    sources = {}
+    for name in _sources:
+        item = meta.get(name)
+        sources[name] = {
+            "synced": item is not None and item["synced_at"] is not None,
+            "age_sec": (
+                round(now - item["started_at"], 1)
+                if item and item["started_at"] else None
+            ),
+            "fresh": _is_usable(item, settings.SNAPSHOT_MAX_STALENESS_SEC),
+            "rows": item["rows"] if item else None,
+            "last_copy_ms": item["elapsed_ms"] if item else None,
+        }
+
+    return {
+        "enabled": True,
+        "path": settings.SNAPSHOT_DB_PATH,
+        "max_staleness_sec": settings.SNAPSHOT_MAX_STALENESS_SEC,
+        "incompatible_queries": len(_incompatible),
+        **stats,
+        "sources": sources,
+    }
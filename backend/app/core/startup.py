@@ -0,0 +1,171 @@
+# backend/app/core/startup.py
+
+"""
+این فایل مسئول:
+- اندازه‌گیری زمان مراحل راه‌اندازی برنامه (Startup)
+    - بارگذاری تنظیمات
+    - راه‌اندازی لاگ
+    - import ماژول‌ها و Router ها
+    - ساخت Engine دیتابیس
+- گزارش زمان import ماژول‌ها (Import-time Breakdown)
+
+هدف:
+    زمان شروع سرد (Cold Start) هر Worker قابل اندازه‌گیری و کوچک بماند.
+
+اجرای گزارش import از خط فرمان (داخل فولدر backend):
+    python -m app.core.startup
+    python -m app.core.startup --module app.main --top 30
+"""
+
+import os
+import re
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, List
+
+# زمان شروع (تقریباً زمان import اولین ماژول برنامه)
+_started_at = time.time()
+_started_perf = time.perf_counter()
+
+_phases: List[Dict] = []
+
+
+# ======================================================
+# ثبت زمان مراحل
+# ======================================================
+def record_phase(name: str, elapsed_sec: float):
+    """
+    ثبت زمان یک مرحله Startup
+    """
+    _phases.append({
+        "phase": name,
+        "elapsed_ms": round(elapsed_sec * 1000, 2),
+        "at_ms": round((time.perf_counter() - _started_perf) * 1000, 2),
+    })
+
+
+@contextmanager
+def startup_phase(name: str):
+    """
+    اندازه‌گیری زمان یک مرحله
+
+    استفاده:
+        with startup_phase("logging"):
+            setup_logging()
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(name, time.perf_counter() - started)
+
+
+def startup_report() -> Dict:
+    """
+    گزارش زمان مراحل Startup این Worker
+    """
+    return {
+        "pid": os.getpid(),
+        "started_at": _started_at,
+        "phases": list(_phases),
+        "total_ms": round(sum(p["elapsed_ms"] for p in _phases), 2),
+    }
+
+
+# ======================================================
+# گزارش زمان import ماژول‌ها
+# ======================================================
+_IMPORTTIME_LINE = re.compile(
+    r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)"
+)
+
+
+def import_time_breakdown(module: str = "app.main", top: int = 20) -> Dict:
+    """
+    اندازه‌گیری زمان import یک ماژول در یک Process جدا
+    (با python -X importtime)
+
+    خروجی:
+        {
+            "module": "app.main",
+            "total_ms": 850.2,
+            "packages": [              # بر اساس بسته سطح اول
+                {"package": "fastapi", "cumulative_ms": 310.5}, ...
+            ],
+            "modules": [               # کندترین ماژول‌ها (زمان خود ماژول)
+                {"module": "app.core.config", "self_ms": 12.1}, ...
+            ]
+        }
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=os.getcwd(),
+    )
+
+    packages: Dict[str, float] = {}
+    modules: List[Dict] = []
+    total_us = 0
+
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+
+        self_us, cumulative_us, indent, name = match.groups()
+        modules.append({"module": name, "self_ms": int(self_us) / 1000})
+
+        # ماژول‌های سطح اول (بدون تورفتگی اضافه)
+        if len(indent) <= 1:
+            package = name.split(".")[0]
+            packages[package] = (
+                packages.get(package, 0) + int(cumulative_us) / 1000
+            )
+            total_us += int(cumulative_us)
+
+    return {
+        "module": module,
+        "ok": completed.returncode == 0,
+        "total_ms": round(total_us / 1000, 1),
+        "packages": [
+            {"package": name, "cumulative_ms": round(ms, 1)}
+            for name, ms in sorted(
+                packages.items(), key=lambda item: item[1], reverse=True
+            )[:top]
+        ],
+        "modules": sorted(
+            modules, key=lambda item: item["self_ms"], reverse=True
+        )[:top],
+    }
+
+
+def _print_breakdown(module: str, top: int):
+    report = import_time_breakdown(module, top)
+
+    print(f"\nImport time of {report['module']}: {report['total_ms']} ms")
+    if not report["ok"]:
+        print("(import failed; numbers cover modules loaded before the error)")
+
+    print("\nBy top-level package (cumulative):")
+    for item in report["packages"]:
+        print(f"  {item['cumulative_ms']:>9.1f} ms  {item['package']}")
+
+    print("\nSlowest modules (self):")
+    for item in report["modules"]:
+        print(f"  {item['self_ms']:>9.1f} ms  {item['module']}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Import-time breakdown of the HR backend"
+    )
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    _print_breakdown(args.module, args.top)
@@ -0,0 +1,176 @@
+# backend/app/core/warmup.py
+
+"""
+این فایل مسئول:
+- گرم کردن (Warm-up) برنامه بعد از Startup
+    - باز کردن چند Connection در Pool دیتابیس
+    - بارگذاری همزمان Cache های پراستفاده (سمت‌ها، تیم‌ها، کاربران، ...)
+- گزارش آمادگی (Readiness) برای Load Balancer
+
+چرا لازم است؟
+- بعد از Restart، اولین کاربران هزینه Connection و Query سرد را می‌پردازند
+- با Readiness جدا از /health، در Restart مرحله‌ای (Rolling)
+  ترافیک تا پایان Warm-up به این Worker فرستاده نمی‌شود
+
+ثبت کار Warm-up در هر ماژول:
+    register_warmup_task("hr.roles", service.get_all_roles)
+
+چند Worker (run.py با SERVER_WORKERS > 1):
+    هر Worker یک Process جداست و Startup خودش را اجرا می‌کند؛
+    پس Warm-up (و Cache و Pool) برای هر Worker جداگانه انجام می‌شود.
+    - WARMUP_JITTER_SEC: پخش کردن شروع Warm-up Worker ها
+      تا همه همزمان به دیتابیس فشار نیاورند
+"""
+
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from threading import Thread
+from typing import Callable, Dict
+
+from app.core.config import settings
+from app.core.database import warm_pool
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# ======================================================
+# ثبت کارهای Warm-up
+# ======================================================
+_tasks: Dict[str, Callable] = {}
+
+
+def register_warmup_task(name: str, func: Callable):
+    """
+    ثبت یک کار Warm-up (تابع بدون آرگومان)
+    """
+    _tasks[name] = func
+
+
+# ======================================================
+# وضعیت Warm-up
+# ======================================================
+"""
+status:
+    pending  → هنوز شروع نشده
+    running  → در حال اجرا
+    done     → تمام شده (ممکن است برخی کارها خطا داشته باشند)
+    disabled → Warm-up غیرفعال است (برنامه بلافاصله آماده است)
+"""
+
+_state: Dict = {
+    "status": "pending",
+    "pid": None,
+    "started_at": None,
+    "elapsed_sec": None,
+    "pool_connections": 0,
+    "tasks": {},
+}
+
+
+def is_warm() -> bool:
+    """
+    آیا Warm-up تمام شده است؟
+    """
+    return _state["status"] in ("done", "disabled")
+
+
+def warmup_status() -> Dict:
+    """
+    گزارش وضعیت Warm-up
+    """
+    return {
+        **_state,
+        "tasks": {name: dict(info) for name, info in _state["tasks"].items()},
+    }
+
+
+# ======================================================
+# اجرای Warm-up
+# ======================================================
+def _run_task(name: str, func: Callable):
+    started = time.perf_counter()
+    info = {"ok": False, "elapsed_sec": None, "error": None}
+    _state["tasks"][name] = info
+
+    try:
+        func()
+        info["ok"] = True
+    except Exception as exc:
+        info["error"] = str(exc)[:500]
+        logger.exception("Warm-up task %s failed", name)
+    finally:
+        info["elapsed_sec"] = round(time.perf_counter() - started, 4)
+
+
+def run_warmup():
+    """
+    اجرای کامل Warm-up (همگام)
+
+    1. باز کردن WARMUP_POOL_CONNECTIONS اتصال در Pool
+    2. اجرای همزمان همه کارهای ثبت‌شده
+       (حداکثر WARMUP_TIMEOUT_SEC ثانیه انتظار)
+    """
+    _state["status"] = "running"
+
+    if settings.WARMUP_JITTER_SEC > 0:
+        time.sleep(random.uniform(0, settings.WARMUP_JITTER_SEC))
+
+    _state["started_at"] = time.time()
+    started = time.perf_counter()
+
+    logger.info("Warm-up started (pid=%s)", os.getpid())
+
+    try:
+        _state["pool_connections"] = warm_pool(
+            settings.WARMUP_POOL_CONNECTIONS
+        )
+    except Exception:
+        logger.exception("Warm-up of database pool failed")
+
+    if _tasks:
+        executor = ThreadPoolExecutor(
+            max_workers=len(_tasks),
+            thread_name_prefix="hr-warmup"
+        )
+        futures = [
+            executor.submit(_run_task, name, func)
+            for name, func in _tasks.items()
+        ]
+        _, not_done = wait(futures, timeout=settings.WARMUP_TIMEOUT_SEC)
+        executor.shutdown(wait=False)
+
+        if not_done:
+            logger.warning(
+                "Warm-up timed out; %s tasks still running", len(not_done)
+            )
+
+    _state["elapsed_sec"] = round(time.perf_counter() - started, 4)
+    _state["status"] = "done"
+
+    failed = [
+        name for name, info in _state["tasks"].items() if not info["ok"]
+    ]
+    logger.info(
+        "Warm-up finished in %ss (pool=%s, failed=%s)",
+        _state["elapsed_sec"],
+        _state["pool_connections"],
+        failed
+    )
+
+
+def start_warmup():
+    """
+    شروع Warm-up در پس‌زمینه (Startup منتظر نمی‌ماند)
+
+    تا پایان Warm-up، endpoint /ready پاسخ 503 می‌دهد.
+    """
+    _state["pid"] = os.getpid()
+
+    if not settings.WARMUP_ENABLED:
+        _state["status"] = "disabled"
+        return
+
+    Thread(target=run_warmup, name="hr-warmup", daemon=True).start()
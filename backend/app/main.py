@@ -17,18 +17,71 @@
 - بخشی از settings.py
 """
 
+from app.core.startup import startup_phase, startup_report
+
+import importlib
+
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.core.config import settings
-from app.core.logging import get_logger
-from app.core.database import test_db_connection
-from app.modules.hr.router import router as hr_router
+from app.core.config import get_settings, settings, settings_summary
+from app.core.logging import (
+    get_logger,
+    logging_stats,
+    setup_logging,
+    stop_logging
+)
+from app.core.admin import router as admin_router
+from app.core.admission import AdmissionMiddleware, admission_status
+from app.core.concurrency import (
+    BulkheadFull,
+    bulkhead_status,
+    render_bulkhead_prometheus,
+    shutdown_executors
+)
+from app.core.database import partition_pool_status
+from app.core.events import events_status, stop_change_detection
+from app.core.health import (
+    get_health,
+    is_healthy,
+    start_health_prober,
+    stop_health_prober
+)
+from app.core.jobs import init_jobs
+from app.core.memory import MemoryTrackingMiddleware, start_tracing
+from app.core.metrics import (
+    TimedRoute,
+    TimingMiddleware,
+    latency_summary,
+    render_prometheus
+)
+from app.core.snapshot import (
+    snapshot_status,
+    start_snapshot_sync,
+    stop_snapshot_sync
+)
+from app.core.warmup import is_warm, start_warmup, warmup_status
 
 logger = get_logger(__name__)
 
 
+# ======================================================
+# راه‌اندازی صریح تنظیمات و لاگ
+# ======================================================
+"""
+تنظیمات و لاگ دیگر در زمان import ماژول‌های core آماده نمی‌شوند؛
+فقط خود برنامه (این فایل) آن‌ها را راه‌اندازی می‌کند.
+Engine دیتابیس هم در اولین استفاده ساخته می‌شود.
+"""
+
+with startup_phase("settings"):
+    get_settings()
+
+with startup_phase("logging"):
+    setup_logging()
+
+
 # ======================================================
 # ایجاد برنامه FastAPI
 # ======================================================
@@ -39,6 +92,9 @@ app = FastAPI(
     debug=settings.DEBUG
 )
 
+# Route های سطح برنامه (health، metrics، ...) هم زمان‌سنجی می‌شوند
+app.router.route_class = TimedRoute
+
 
 # ======================================================
 # Middleware ها
@@ -59,6 +115,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+"""
+Timing:
+- زمان مراحل هر درخواست در هدر Server-Timing
+- هیستوگرام زمان پاسخ هر Route برای /metrics
+- آخرین Middleware اضافه‌شده بیرونی‌ترین است؛
+  بنابراین زمان CORS هم در total حساب می‌شود
+"""
+
+"""
+Memory:
+- Peak حافظه هر درخواست (فقط وقتی tracemalloc روشن است؛ /admin/memory)
+"""
+
+app.add_middleware(MemoryTrackingMiddleware)
+
+"""
+Admission Control:
+- سقف همزمانی تطبیقی هر دسته Route؛ اضافه‌ها 503 + Retry-After
+- داخل TimingMiddleware است تا زمان db درخواست‌ها را ببیند
+"""
+
+app.add_middleware(AdmissionMiddleware)
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(TimingMiddleware)
+
 
 # ======================================================
 # Exception Handler عمومی
@@ -74,7 +156,7 @@ async def global_exception_handler(
     جلوگیری از نمایش StackTrace به کاربر
     """
     logger.exception(
-        f"Unhandled exception on path {request.url.path}"
+        "Unhandled exception on path %s", request.url.path
     )
 
     return JSONResponse(
@@ -86,19 +168,67 @@ async def global_exception_handler(
     )
 
 
+@app.exception_handler(BulkheadFull)
+async def bulkhead_full_handler(
+    request: Request,
+    exc: BulkheadFull
+):
+    """
+    صف Bulkhead پر است → 503 (بقیه دسته‌ها تحت تأثیر نیستند)
+    """
+    logger.warning(
+        "Bulkhead %s full on path %s", exc.name, request.url.path
+    )
+
+    return JSONResponse(
+        status_code=503,
+        headers={"Retry-After": "1"},
+        content={
+            "success": False,
+            "message": "سرور در حال حاضر شلوغ است؛ کمی بعد دوباره تلاش کنید"
+        }
+    )
+
+
 # ======================================================
 # ثبت Router ها
 # ======================================================
 
 """
+ماژول‌ها از روی تنظیم ENABLED_MODULES ثبت می‌شوند.
+Router هر ماژول (app.modules.<name>.router) فقط اگر فعال باشد import می‌شود.
+
 در آینده اگر ماژول‌های دیگری اضافه شوند:
 - finance
 - workflow
 - evaluation
-اینجا register می‌شوند
+کافی است نامشان به ENABLED_MODULES اضافه شود
+"""
+
+
+def register_module_routers(application: FastAPI):
+    """
+    import و ثبت Router ماژول‌های فعال
+    """
+    for module_name in settings.ENABLED_MODULES:
+        with startup_phase(f"import app.modules.{module_name}"):
+            module = importlib.import_module(
+                f"app.modules.{module_name}.router"
+            )
+        application.include_router(module.router)
+
+
+register_module_routers(app)
+
+
+# ======================================================
+# Router مدیریتی (/admin)
+# ======================================================
+"""
+endpoint های عیب‌یابی (پروفایلر، ...) فقط برای ADMIN_USERS
 """
 
-app.include_router(hr_router)
+app.include_router(admin_router)
 
 
 # ======================================================
@@ -108,19 +238,107 @@ app.include_router(hr_router)
 @app.get("/health", tags=["System"])
 def health_check():
     """
-    بررسی وضعیت سیستم
+    بررسی وضعیت سیستم (Liveness)
 
     استفاده:
     - مانیتورینگ
     - Load Balancer
     - تست اولیه IIS
+
+    نکته:
+        این endpoint به دیتابیس وصل نمی‌شود؛
+        آخرین نتیجه Prober پس‌زمینه (app.core.health) را برمی‌گرداند
     """
-    db_ok = test_db_connection()
+    health = get_health()
 
     return {
-        "status": "ok" if db_ok else "error",
-        "database": "connected" if db_ok else "disconnected",
-        "environment": settings.ENVIRONMENT
+        "status": health["status"],
+        "database": (
+            "connected" if health["database"]["ok"] else "disconnected"
+        ),
+        "environment": settings.ENVIRONMENT,
+        "checked_at": health["checked_at"],
+        "age_sec": health["age_sec"],
+        "db_latency_ms": health["database"]["latency_ms"],
+        "db_error": health["database"]["error"],
+        "pool": health["pool"],
+        "caches": health["caches"],
+        "logging": logging_stats(),
+        "snapshot": snapshot_status(),
+        "events": events_status(),
+        "admission": admission_status(),
+        "bulkheads": bulkhead_status(),
+        "pool_partitions": partition_pool_status(),
+    }
+
+
+# ======================================================
+# Readiness API
+# ======================================================
+
+@app.get("/ready", tags=["System"])
+def readiness_check():
+    """
+    بررسی آمادگی برای دریافت ترافیک (جدا از /health)
+
+    تا پایان Warm-up، یا وقتی آخرین بررسی دیتابیس ناموفق/قدیمی است،
+    پاسخ 503 برمی‌گرداند؛
+    Load Balancer فقط بعد از 200 ترافیک را به این Worker می‌فرستد.
+    """
+    warm = is_warm()
+    healthy = is_healthy()
+    ready = warm and healthy
+    health = get_health()
+
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "not_ready",
+            "warm": warm,
+            "healthy": healthy,
+            "checked_at": health["checked_at"],
+            "db_latency_ms": health["database"]["latency_ms"],
+            "warmup": warmup_status(),
+        }
+    )
+
+
+# ======================================================
+# Metrics API
+# ======================================================
+
+@app.get("/metrics", tags=["System"], response_class=PlainTextResponse)
+def get_metrics(format: str = "prometheus"):
+    """
+    زمان پاسخ Route ها (هیستوگرام و صدک‌های p50 / p95 / p99)
+
+    - format=prometheus (پیش‌فرض): متن Prometheus برای Scrape
+    - format=json: خلاصه خوانا (میلی‌ثانیه)
+    """
+    if format == "json":
+        return JSONResponse(content=latency_summary())
+
+    return PlainTextResponse(
+        render_prometheus() + render_bulkhead_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+# ======================================================
+# Startup Report API
+# ======================================================
+
+@app.get("/startup-report", tags=["System"])
+def get_startup_report():
+    """
+    زمان مراحل راه‌اندازی این Worker
+
+    برای گزارش زمان import ماژول‌ها:
+        python -m app.core.startup
+    """
+    return {
+        **startup_report(),
+        "warmup": warmup_status(),
     }
 
 
@@ -136,14 +354,34 @@ def on_startup():
     logger.info("===================================")
     logger.info(" HR SYSTEM STARTING ")
     logger.info("===================================")
-    logger.info(f"Environment : {settings.ENVIRONMENT}")
-    logger.info(f"Debug       : {settings.DEBUG}")
+    for key, value in settings_summary().items():
+        logger.info("%-12s: %s", key, value)
+
+    # ردیابی حافظه (اختیاری؛ سربار دارد)
+    if settings.MEMORY_TRACKING_ENABLED:
+        start_tracing()
 
-    # تست اتصال دیتابیس
-    if test_db_connection():
-        logger.info("Database connection OK")
-    else:
-        logger.error("Database connection FAILED")
+    # بررسی دوره‌ای سلامت (اولین بررسی، اتصال دیتابیس را لاگ می‌کند)
+    start_health_prober()
+
+    # آماده‌سازی Job های پس‌زمینه
+    with startup_phase("jobs"):
+        init_jobs()
+
+    # Snapshot محلی (اختیاری؛ همگام‌سازی در پس‌زمینه)
+    start_snapshot_sync()
+
+    # Warm-up (در پس‌زمینه؛ تا پایان آن /ready پاسخ 503 می‌دهد)
+    start_warmup()
+
+    report = startup_report()
+    logger.info(
+        "Startup phases (%s ms): %s",
+        report["total_ms"],
+        ", ".join(
+            f"{p['phase']}={p['elapsed_ms']}ms" for p in report["phases"]
+        )
+    )
 
 
 # ======================================================
@@ -155,4 +393,9 @@ def on_shutdown():
     """
     رویداد خاموش شدن برنامه
     """
+    stop_health_prober()
+    stop_snapshot_sync()
+    stop_change_detection()
+    shutdown_executors()
     logger.info("HR SYSTEM SHUTDOWN")
+    stop_logging()
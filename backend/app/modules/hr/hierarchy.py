@@ -0,0 +1,335 @@
+# backend/app/modules/hr/hierarchy.py
+
+"""
+سلسله‌مراتب تیم‌ها و زنجیره مدیریت (از پیش محاسبه‌شده)
+
+مسئولیت این فایل:
+- ساخت درخت تیم‌ها از داده سازمان
+    مدیر هر تیم  → اعضای فعلی با Superior = 1
+    تیم بالاتر   → HR_GetTeamManager با سمت مدیر تیم
+                   (برای سمت مدیر، مدیر تیم بالاتر را برمی‌گرداند)
+- نگه‌داشتن ساختار در Cache برای پاسخ با یک Lookup:
+    ancestors[team] → لیست تیم‌های بالاتر (از والد تا ریشه)
+    Euler Tour      → زیردرخت هر تیم یک بازه پیوسته [tin, tout] است؛
+                      اعضای همه تیم‌های زیردرخت یک Slice از یک لیست هستند
+    org_chart       → درخت آماده برای ارسال به Client
+
+چرا؟
+    پیدا کردن مدیر با HR_GetTeamManager برای هر سمت/تیم یک فراخوانی است
+    و بالا رفتن در زنجیره مدیریت چند فراخوانی پشت سر هم؛
+    اینجا این فراخوانی‌ها فقط یک بار (در ساخت Cache) انجام می‌شوند.
+
+ساخت دوباره (بعد از انقضا یا تغییر داده) در پس‌زمینه انجام می‌شود و
+تا آماده شدن، ساختار قبلی سرو می‌شود؛ خطای HR_GetTeamManager برای یک تیم
+کل ساخت را متوقف نمی‌کند (والد قبلی همان تیم نگه داشته می‌شود).
+"""
+
+import json
+from typing import Dict, List, Optional, Tuple
+
+from app.core.cache import cached
+from app.core.logging import get_logger
+from app.core.warmup import register_warmup_task
+from app.modules.hr import repository, service
+
+logger = get_logger(__name__)
+
+# والد هر تیم در آخرین ساخت موفق (جایگزین وقتی HR_GetTeamManager خطا بدهد)
+_last_parents: Dict[str, Optional[str]] = {}
+
+
+# ======================================================
+# ساخت سلسله‌مراتب
+# ======================================================
+def _parent_teams(
+    managers: Dict[str, List[Dict]]
+) -> Dict[str, Optional[str]]:
+    """
+    تیم بالاتر هر تیم (با یک فراخوانی HR_GetTeamManager برای هر تیم)
+
+    خطای یک تیم → والد همان تیم از ساخت قبلی (یا ریشه)
+    """
+    parents: Dict[str, Optional[str]] = {}
+    failed = 0
+    for team_code, team_managers in managers.items():
+        try:
+            rows = repository.sp_get_team_manager(
+                team_managers[0]["RoleId"], team_code
+            )
+        except Exception as exc:
+            failed += 1
+            logger.debug(
+                "HR_GetTeamManager failed for team %s: %s", team_code, exc
+            )
+            parents[team_code] = _last_parents.get(team_code)
+            continue
+        parent = next(
+            (
+                row.get("TeamCode") for row in rows
+                if row.get("TeamCode") not in (None, team_code)
+            ),
+            None
+        )
+        parents[team_code] = parent
+
+    if failed:
+        logger.warning(
+            "Team hierarchy: HR_GetTeamManager failed for %s of %s teams; "
+            "previous parents kept",
+            failed, len(managers)
+        )
+    return parents
+
+
+def _break_cycles(parents: Dict[str, Optional[str]]) -> int:
+    """
+    حذف حلقه‌ها (داده ناسازگار)؛ تیم داخل حلقه ریشه می‌شود
+
+    خروجی: تعداد حلقه‌های شکسته‌شده
+    """
+    broken = 0
+    state: Dict[str, int] = {}      # 1 → در مسیر جاری، 2 → بررسی‌شده
+
+    for start in parents:
+        path = []
+        team = start
+        while team is not None and state.get(team) is None:
+            state[team] = 1
+            path.append(team)
+            team = parents.get(team)
+        if team is not None and state.get(team) == 1:
+            parents[path[-1]] = None
+            broken += 1
+        for visited in path:
+            state[visited] = 2
+
+    return broken
+
+
+@cached(
+    "hr.team_hierarchy",
+    tables=("UserTeamRole", "Team"),
+    background=True
+)
+def get_hierarchy() -> Dict:
+    """
+    ساخت کامل سلسله‌مراتب (Cache می‌شود، CACHE_TTL_SEC)
+
+    فقط اولین ساخت درخواست را منتظر نگه می‌دارد؛
+    بعد از آن ساخت دوباره در پس‌زمینه است.
+    """
+    logger.info("Building team hierarchy")
+
+    teams = {team["TeamCode"]: team for team in service.get_all_teams()}
+    members: Dict[str, List[Dict]] = {code: [] for code in teams}
+    for row in repository.get_current_user_team_roles():
+        members.setdefault(row["TeamCode"], []).append(row)
+
+    managers = {
+        code: [row for row in rows if row["Superior"]]
+        for code, rows in members.items()
+    }
+    parents = _parent_teams(
+        {code: rows for code, rows in managers.items() if rows}
+    )
+    for code in members:
+        parents.setdefault(code, None)
+    broken = _break_cycles(parents)
+    if broken:
+        logger.warning("Team hierarchy: %s cycles broken", broken)
+
+    children: Dict[str, List[str]] = {code: [] for code in parents}
+    roots = []
+    for code in sorted(parents):
+        parent = parents[code]
+        if parent is None or parent not in children:
+            roots.append(code)
+        else:
+            children[parent].append(code)
+
+    # Euler Tour (پیمایش عمقی بدون بازگشت)
+    tin: Dict[str, int] = {}
+    tout: Dict[str, int] = {}
+    ancestors: Dict[str, List[str]] = {}
+    order: List[str] = []
+
+    stack = [(root, False) for root in reversed(roots)]
+    while stack:
+        code, done = stack.pop()
+        if done:
+            tout[code] = len(order) - 1
+            continue
+
+        parent = parents.get(code)
+        ancestors[code] = (
+            [parent] + ancestors[parent]
+            if parent is not None and parent in ancestors else []
+        )
+        tin[code] = len(order)
+        order.append(code)
+
+        stack.append((code, True))
+        stack.extend((child, False) for child in reversed(children[code]))
+
+    # اعضای همه تیم‌ها به ترتیب Euler → زیردرخت = یک Slice
+    flat_members: List[Dict] = []
+    offsets: List[int] = []
+    for code in order:
+        offsets.append(len(flat_members))
+        flat_members.extend(members.get(code, ()))
+    offsets.append(len(flat_members))
+
+    by_user: Dict[str, List[str]] = {}
+    for code in order:
+        for row in members.get(code, ()):
+            teams_of_user = by_user.setdefault(row["NationalCode"], [])
+            if code not in teams_of_user:
+                teams_of_user.append(code)
+
+    _last_parents.clear()
+    _last_parents.update(parents)
+
+    hierarchy = {
+        "teams": teams,
+        "parents": parents,
+        "children": children,
+        "roots": roots,
+        "managers": managers,
+        "ancestors": ancestors,
+        "tin": tin,
+        "tout": tout,
+        "offsets": offsets,
+        "members": flat_members,
+        "by_user": by_user,
+    }
+    hierarchy["org_chart"], hierarchy["chart_nodes"] = _org_chart(hierarchy)
+    # کل درخت یک بار Serialize می‌شود (پاسخ /org-chart بدون پردازش)
+    hierarchy["org_chart_json"] = json.dumps(
+        hierarchy["org_chart"], ensure_ascii=False, default=str
+    ).encode("utf-8")
+
+    logger.info(
+        "Team hierarchy built: %s teams, %s roots, depth %s",
+        len(order), len(roots),
+        max((len(a) for a in ancestors.values()), default=-1) + 1
+    )
+    return hierarchy
+
+
+def _team_node(hierarchy: Dict, code: str) -> Dict:
+    team = hierarchy["teams"].get(code, {})
+    start = hierarchy["offsets"][hierarchy["tin"][code]]
+    end = hierarchy["offsets"][hierarchy["tin"][code] + 1]
+    return {
+        "TeamCode": code,
+        "TeamName": team.get("TeamName"),
+        "Managers": hierarchy["managers"].get(code, []),
+        "MemberCount": end - start,
+    }
+
+
+def _org_chart(hierarchy: Dict) -> Tuple[List[Dict], Dict[str, Dict]]:
+    """
+    درخت تیم‌ها برای Client (بدون بازگشت، مناسب عمق زیاد)
+
+    خروجی: (ریشه‌ها، گره هر تیم)
+    """
+    chart: List[Dict] = []
+    nodes: Dict[str, Dict] = {}
+    stack = [(root, chart) for root in reversed(hierarchy["roots"])]
+    while stack:
+        code, siblings = stack.pop()
+        node = nodes[code] = _team_node(hierarchy, code)
+        node["Children"] = []
+        siblings.append(node)
+        stack.extend(
+            (child, node["Children"])
+            for child in reversed(hierarchy["children"][code])
+        )
+    return chart, nodes
+
+
+# ======================================================
+# Lookup ها
+# ======================================================
+def get_management_chain(national_code: str) -> List[Dict]:
+    """
+    زنجیره مدیریت کاربر (از مدیر مستقیم تا بالاترین مدیر)
+
+    برای هر تیم کاربر جدا محاسبه می‌شود؛
+    اگر کاربر مدیر همان تیم باشد، زنجیره از تیم بالاتر شروع می‌شود.
+    """
+    hierarchy = get_hierarchy()
+    chains = []
+
+    for code in hierarchy["by_user"].get(national_code, ()):
+        is_manager = any(
+            row["NationalCode"] == national_code
+            for row in hierarchy["managers"].get(code, ())
+        )
+        path = hierarchy["ancestors"][code]
+        if not is_manager:
+            path = [code] + path
+
+        chains.append({
+            "TeamCode": code,
+            "Chain": [
+                _team_node(hierarchy, team)
+                for team in path
+                if hierarchy["managers"].get(team)
+            ],
+        })
+
+    return chains
+
+
+def get_subordinates(national_code: str) -> List[Dict]:
+    """
+    همه زیرمجموعه‌های یک مدیر (مستقیم و غیرمستقیم)
+
+    اعضای زیردرخت هر تیمی که کاربر مدیر آن است
+    (با Euler Tour یک Slice از لیست اعضا)
+    """
+    hierarchy = get_hierarchy()
+    offsets = hierarchy["offsets"]
+    result: List[Dict] = []
+    covered = -1
+
+    managed = sorted(
+        (
+            code for code in hierarchy["by_user"].get(national_code, ())
+            if any(
+                row["NationalCode"] == national_code
+                for row in hierarchy["managers"].get(code, ())
+            )
+        ),
+        key=hierarchy["tin"].get
+    )
+    for code in managed:
+        tin, tout = hierarchy["tin"][code], hierarchy["tout"][code]
+        if tin <= covered:
+            # زیردرخت تیم دیگری از همین مدیر است
+            continue
+        result.extend(hierarchy["members"][offsets[tin]:offsets[tout + 1]])
+        covered = tout
+
+    return [row for row in result if row["NationalCode"] != national_code]
+
+
+def get_org_chart(team_code: Optional[str] = None) -> Optional[List[Dict]]:
+    """
+    درخت سازمانی یک تیم (زیردرخت)
+
+    None → تیم پیدا نشد
+    """
+    node = get_hierarchy()["chart_nodes"].get(team_code)
+    return [node] if node is not None else None
+
+
+def get_org_chart_json() -> bytes:
+    """
+    کل درخت سازمانی (JSON آماده)
+    """
+    return get_hierarchy()["org_chart_json"]
+
+register_warmup_task("hr.team_hierarchy", get_hierarchy)
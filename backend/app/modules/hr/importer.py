@@ -0,0 +1,295 @@
+# backend/app/modules/hr/importer.py
+
+"""
+Import فایل CSV ماژول HR
+
+مسئولیت این فایل:
+- خواندن Stream فایل CSV (بدون بارگذاری کل فایل در حافظه)
+- اعتبارسنجی هر ردیف با Schema های schemas.py
+- نوشتن ردیف‌های معتبر به‌صورت دسته‌ای (Bulk) از طریق Repository
+- گزارش پیشرفت و خطاهای ردیفی
+
+جریان داده:
+    Request Body (async)
+        → صف محدود (Backpressure)
+        → Thread اختصاصی Import: Decode → CSV → Validate → Bulk Write
+"""
+
+import asyncio
+import codecs
+import csv
+import time
+from array import array
+from typing import AsyncIterator, Callable, Dict, Iterable, Iterator, Optional
+
+from pydantic import BaseModel, ValidationError
+
+from app.core.concurrency import get_import_executor
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.modules.hr import repository
+from app.modules.hr.schemas import UserIn, UserTeamRoleIn
+
+logger = get_logger(__name__)
+
+
+# ======================================================
+# انواع Import
+# ======================================================
+"""
+هر نوع Import:
+    schema → مدل اعتبارسنجی هر ردیف
+    writer → تابع Bulk Write در Repository
+"""
+
+IMPORT_KINDS: Dict[str, Dict] = {
+    "users": {
+        "schema": UserIn,
+        "writer": repository.bulk_insert_users,
+    },
+    "team-roles": {
+        "schema": UserTeamRoleIn,
+        "writer": repository.bulk_insert_user_team_roles,
+    },
+}
+
+
+# ======================================================
+# خواندن خطوط متن از Stream بایت‌ها
+# ======================================================
+def _iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """
+    تبدیل Stream بایت‌ها به خطوط متن (UTF-8، با یا بدون BOM)
+
+    فقط یک خط ناقص در حافظه نگه داشته می‌شود.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+
+    for chunk in chunks:
+        lines = (pending + decoder.decode(chunk)).split("\n")
+
+        # خط آخر ممکن است ناقص باشد
+        pending = lines.pop()
+
+        for line in lines:
+            yield line + "\n"
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def _clean_row(row: Dict) -> Dict:
+    """
+    آماده‌سازی یک ردیف CSV برای اعتبارسنجی
+
+    - حذف فاصله‌های اضافه
+    - تبدیل سلول خالی به None
+    """
+    return {
+        key.strip(): (value.strip() or None) if isinstance(value, str) else value
+        for key, value in row.items()
+        if key is not None
+    }
+
+
+def _format_errors(exc: ValidationError) -> list:
+    """
+    تبدیل خطای Pydantic به لیست پیام‌های کوتاه
+    """
+    return [
+        f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}"
+        for err in exc.errors()
+    ]
+
+
+# ======================================================
+# Import (همگام – داخل Thread اختصاصی)
+# ======================================================
+def import_csv(
+    kind: str,
+    chunks: Iterable[bytes],
+    atomic: bool = False,
+    on_progress: Optional[Callable[[Dict], None]] = None
+) -> Dict:
+    """
+    Import فایل CSV (ورودی به‌صورت Stream بایت‌ها)
+
+    atomic:
+        True  → با اولین خطای دیتابیس هیچ ردیفی ثبت نمی‌شود
+        False → ردیف‌های خطادار کنار گذاشته و بقیه ثبت می‌شوند
+
+    ردیف‌هایی که اعتبارسنجی نشوند اصلاً به دیتابیس ارسال نمی‌شوند
+    و در errors گزارش می‌شوند (حداکثر IMPORT_MAX_ERRORS مورد).
+
+    on_progress:
+        بعد از نوشتن هر دسته با خلاصه پیشرفت صدا زده می‌شود
+    """
+    config = IMPORT_KINDS[kind]
+    schema: type[BaseModel] = config["schema"]
+    fields = schema.model_fields
+
+    started = time.perf_counter()
+
+    errors = []
+    stats = {"total_rows": 0, "invalid_rows": 0, "error_count": 0}
+
+    # شماره خط CSV برای هر ردیف معتبر
+    # (برای تبدیل row_index خطاهای دیتابیس به شماره خط)
+    valid_lines = array("l")
+
+    def add_error(line: int, messages: list):
+        stats["error_count"] += 1
+        if len(errors) < settings.IMPORT_MAX_ERRORS:
+            errors.append({"line": line, "errors": messages})
+
+    def valid_rows() -> Iterator[Dict]:
+        reader = csv.DictReader(_iter_lines(chunks))
+
+        unknown = set(reader.fieldnames or []) - set(fields)
+        if unknown:
+            logger.warning(
+                "Import %s: ignoring unknown columns %s", kind, sorted(unknown)
+            )
+
+        for row in reader:
+            stats["total_rows"] += 1
+            try:
+                item = schema.model_validate(_clean_row(row))
+            except ValidationError as exc:
+                stats["invalid_rows"] += 1
+                add_error(reader.line_num, _format_errors(exc))
+                continue
+
+            valid_lines.append(reader.line_num)
+            yield item.model_dump()
+
+    def on_chunk(chunk_report: Dict, report: Dict):
+        progress = {
+            "kind": kind,
+            "rows_read": stats["total_rows"],
+            "rows_written": report["written_rows"],
+            "rows_failed": report["failed_rows"] + stats["invalid_rows"],
+            "elapsed_sec": round(time.perf_counter() - started, 2),
+        }
+        logger.info(
+            "Import %s progress: read=%s, written=%s, failed=%s",
+            kind,
+            progress["rows_read"],
+            progress["rows_written"],
+            progress["rows_failed"]
+        )
+        if on_progress is not None:
+            on_progress(progress)
+
+    bulk_report = config["writer"](
+        valid_rows(),
+        chunk_size=settings.IMPORT_CHUNK_SIZE,
+        atomic=atomic,
+        isolate_errors=not atomic,
+        on_chunk=on_chunk
+    )
+
+    # خطاهای دیتابیس هر ردیف → شماره خط فایل
+    for chunk in bulk_report["chunks"]:
+        for row_error in chunk["row_errors"]:
+            add_error(
+                valid_lines[row_error["row_index"]],
+                [row_error["error"]]
+            )
+
+    elapsed = time.perf_counter() - started
+
+    report = {
+        "kind": kind,
+        "total_rows": stats["total_rows"],
+        "valid_rows": len(valid_lines),
+        "invalid_rows": stats["invalid_rows"],
+        "written_rows": bulk_report["written_rows"],
+        "failed_rows": bulk_report["failed_rows"],
+        "committed": bulk_report["committed"],
+        "elapsed_sec": round(elapsed, 4),
+        "rows_per_sec": (
+            round(stats["total_rows"] / elapsed, 1) if elapsed else 0.0
+        ),
+        "errors": sorted(errors, key=lambda e: e["line"]),
+        "errors_truncated": stats["error_count"] > len(errors),
+        "chunks": bulk_report["chunks"],
+    }
+
+    logger.info(
+        "Import %s finished: total=%s, written=%s, invalid=%s, "
+        "failed=%s, elapsed=%ss",
+        kind,
+        report["total_rows"],
+        report["written_rows"],
+        report["invalid_rows"],
+        report["failed_rows"],
+        report["elapsed_sec"]
+    )
+
+    return report
+
+
+# ======================================================
+# Import از Stream درخواست (async)
+# ======================================================
+async def import_csv_stream(
+    kind: str,
+    stream: AsyncIterator[bytes],
+    atomic: bool = False
+) -> Dict:
+    """
+    Import فایل CSV مستقیماً از Body درخواست
+
+    - Body تکه‌تکه خوانده و در یک صف محدود قرار می‌گیرد
+    - Thread اختصاصی Import از همان صف می‌خواند و پردازش می‌کند
+    - اگر نوشتن کند باشد، صف پر می‌شود و خواندن Body متوقف می‌ماند
+      (Backpressure)؛ بنابراین حافظه مصرفی محدود است
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=8)
+
+    # نشانه قطع شدن Body (مثلاً قطع اتصال Client) → Import باید Rollback شود
+    aborted = object()
+
+    def body_chunks() -> Iterator[bytes]:
+        while True:
+            data = asyncio.run_coroutine_threadsafe(queue.get(), loop).result()
+            if data is None:
+                return
+            if data is aborted:
+                raise RuntimeError("Import aborted: request body interrupted")
+            yield data
+
+    worker = loop.run_in_executor(
+        get_import_executor(),
+        import_csv, kind, body_chunks(), atomic
+    )
+
+    async def put(item) -> bool:
+        """
+        قرار دادن در صف؛ اگر Worker زودتر تمام شد (مثلاً خطا) منتظر نمی‌ماند
+        """
+        putter = asyncio.ensure_future(queue.put(item))
+        done, _ = await asyncio.wait(
+            {putter, worker},
+            return_when=asyncio.FIRST_COMPLETED
+        )
+        if putter not in done:
+            putter.cancel()
+            return False
+        return True
+
+    try:
+        async for data in stream:
+            if data and not await put(data):
+                break
+    except BaseException:
+        await put(aborted)
+        raise
+
+    await put(None)
+
+    return await worker
@@ -0,0 +1,42 @@
+# backend/app/modules/hr/jobs.py
+
+"""
+Job های ماژول HR
+
+مسئولیت این فایل:
+- ثبت عملیات طولانی ماژول HR به‌عنوان نوع Job
+  (اجرا در پس‌زمینه از طریق app.core.jobs)
+
+پارامترهای هر Job همان پارامترهای تابع Service است.
+
+مثال:
+    POST /api/hr/jobs/sp-get-target-role
+    {"info_id": 10, "request_type": 1}
+"""
+
+from app.core.jobs import register_job_kind
+from app.modules.hr import service
+
+
+# ======================================================
+# Stored Procedures
+# ======================================================
+register_job_kind(
+    "sp-get-target-role",
+    service.sp_get_target_role
+)
+
+register_job_kind(
+    "sp-get-assessors-educators",
+    service.sp_get_assessors_educators
+)
+
+register_job_kind(
+    "sp-get-assessors-educators-all",
+    service.sp_get_assessors_educators_all
+)
+
+register_job_kind(
+    "sp-get-team-manager",
+    service.sp_get_team_manager
+)
@@ -14,13 +14,63 @@ Repository لایه‌ی ارتباط با دیتابیس برای ماژول HR
 - cursor.execute(...)
 """
 
-from sqlalchemy import text
-from typing import List, Dict, Optional
+from functools import lru_cache
 
+from sqlalchemy import bindparam, text
+from sqlalchemy.sql.elements import TextClause
+from typing import List, Dict, Optional, Iterator, Iterable, Callable, Tuple
+
+from app.core.cache import invalidate_tables
 from app.core.database import (
+    execute_bulk,
     execute_query,
     execute_query_one,
-    execute_sp_with_result
+    get_engine,
+    execute_sp_with_result,
+    execute_sp_multi_result,
+    stream_query
+)
+from app.core.events import notify_tables_changed
+from app.core.snapshot import (
+    mark_snapshot_stale,
+    read_query,
+    read_query_one,
+    register_snapshot_source
+)
+
+# ======================================================
+# Snapshot محلی (SNAPSHOT_ENABLED)
+# ======================================================
+"""
+جدول‌ها و View های کم‌تغییر که می‌توانند از Snapshot محلی خوانده شوند.
+tables: جدول‌هایی که نوشتن در آن‌ها Snapshot این منبع را کهنه می‌کند
+"""
+
+register_snapshot_source(
+    "Users",
+    indexes=[("NationalCode",), ("UserName",)]
+)
+register_snapshot_source("V_AllUserList", tables=("Users",))
+register_snapshot_source("Team")
+register_snapshot_source("HR_Team", tables=("Team",))
+register_snapshot_source("Role")
+register_snapshot_source(
+    "UserTeamRole",
+    indexes=[("NationalCode",)]
+)
+register_snapshot_source(
+    "V_UserTeamRole",
+    tables=("UserTeamRole", "Users", "Team", "Role")
+)
+register_snapshot_source(
+    "V_HR_RoleTarget",
+    indexes=[("RoleID", "RequestType")],
+    tables=("Role",)
+)
+register_snapshot_source(
+    "V_RoleTeam",
+    indexes=[("TeamCode",)],
+    tables=("UserTeamRole",)
 )
 
 # ======================================================
@@ -55,6 +105,43 @@ def get_all_users_minimal() -> List[Dict]:
             ContractDate
         FROM V_AllUserList
     """
+    return read_query(sql, sources=("V_AllUserList",))
+
+
+def get_user_dates() -> List[Dict]:
+    """
+    تاریخ‌های همه کاربران (تولد، شروع و پایان قرارداد)
+
+    برای ساخت ایندکس تاریخ در Service (فیلتر بازه‌ای سمت سرور)
+    """
+    sql = """
+        SELECT
+            NationalCode,
+            FirstName,
+            LastName,
+            IsActive,
+            BirthDate,
+            BirthDateMiladi,
+            ContractDate,
+            ContractDateMiladi,
+            ContractEndDate,
+            ContractEndDateMiladi
+        FROM Users
+    """
+    return read_query(sql, sources=("Users",))
+
+
+def get_all_user_rows() -> List[Dict]:
+    """
+    همه ستون‌های همه کاربران (برای تشخیص تغییر)
+
+    همیشه از SQL Server (نه Snapshot)؛ Fingerprint تشخیص تغییر
+    از جدول اصلی گرفته می‌شود و ردیف‌ها باید با آن هم‌زمان باشند
+    """
+    sql = """
+        SELECT *
+        FROM Users
+    """
     return execute_query(sql)
 
 
@@ -70,7 +157,9 @@ def get_user_by_national_code(national_code: str) -> Optional[Dict]:
         FROM Users
         WHERE NationalCode = :national_code
     """
-    return execute_query_one(sql, {"national_code": national_code})
+    return read_query_one(
+        sql, {"national_code": national_code}, sources=("Users",)
+    )
 
 
 def get_user_by_username(username: str) -> Optional[Dict]:
@@ -85,7 +174,53 @@ def get_user_by_username(username: str) -> Optional[Dict]:
         FROM Users
         WHERE UserName = :username
     """
-    return execute_query_one(sql, {"username": username})
+    return read_query_one(sql, {"username": username}, sources=("Users",))
+
+
+USER_WRITE_COLUMNS = (
+    "NationalCode", "UserName", "FirstName", "LastName",
+    "FirstNameEnglish", "LastNameEnglish", "FatherName",
+    "Gender", "BirthDate", "BirthDateMiladi",
+    "ContractDate", "ContractDateMiladi",
+    "ContractEndDate", "ContractEndDateMiladi",
+    "IsActive", "About",
+    "DegreeType", "MarriageStatus", "MilitaryStatus", "Religion",
+    "ContractType", "UserStatus",
+    "BirthCity", "IdentityCity", "LivingAddress",
+)
+
+
+def bulk_insert_users(
+    rows: Iterable[Dict],
+    chunk_size: int = 1000,
+    atomic: bool = True,
+    isolate_errors: bool = False,
+    on_chunk: Optional[Callable] = None
+) -> Dict:
+    """
+    ثبت گروهی کاربران جدید
+
+    معادل:
+        Users.objects.bulk_create([...])
+
+    هر رکورد باید همه ستون‌های USER_WRITE_COLUMNS را داشته باشد
+    """
+    columns = ", ".join(USER_WRITE_COLUMNS)
+    values = ", ".join(f":{col}" for col in USER_WRITE_COLUMNS)
+
+    sql = f"""
+        INSERT INTO Users ({columns})
+        VALUES ({values})
+    """
+    report = execute_bulk(
+        sql, rows, chunk_size, atomic,
+        isolate_errors=isolate_errors,
+        on_chunk=on_chunk
+    )
+    mark_snapshot_stale("Users")
+    invalidate_tables("Users")
+    notify_tables_changed("Users")
+    return report
 
 
 # ======================================================
@@ -103,6 +238,17 @@ def get_all_teams() -> List[Dict]:
         SELECT *
         FROM Team
     """
+    return read_query(sql, sources=("Team",))
+
+
+def get_all_team_rows() -> List[Dict]:
+    """
+    همه تیم‌ها (برای تشخیص تغییر؛ همیشه از SQL Server)
+    """
+    sql = """
+        SELECT *
+        FROM Team
+    """
     return execute_query(sql)
 
 
@@ -118,7 +264,7 @@ def get_active_service_teams() -> List[Dict]:
         FROM HR_Team
         WHERE ActiveInService = 1
     """
-    return execute_query(sql)
+    return read_query(sql, sources=("HR_Team",))
 
 
 def get_active_evaluation_teams() -> List[Dict]:
@@ -130,7 +276,7 @@ def get_active_evaluation_teams() -> List[Dict]:
         FROM Team
         WHERE ActiveInEvaluation = 1
     """
-    return execute_query(sql)
+    return read_query(sql, sources=("Team",))
 
 
 # ======================================================
@@ -145,6 +291,17 @@ def get_all_roles() -> List[Dict]:
         SELECT *
         FROM Role
     """
+    return read_query(sql, sources=("Role",))
+
+
+def get_all_role_rows() -> List[Dict]:
+    """
+    همه سمت‌ها (برای تشخیص تغییر؛ همیشه از SQL Server)
+    """
+    sql = """
+        SELECT *
+        FROM Role
+    """
     return execute_query(sql)
 
 
@@ -160,7 +317,9 @@ def get_user_roles_by_national_code(national_code: str) -> List[int]:
         FROM UserTeamRole
         WHERE NationalCode = :national_code
     """
-    rows = execute_query(sql, {"national_code": national_code})
+    rows = read_query(
+        sql, {"national_code": national_code}, sources=("UserTeamRole",)
+    )
     return [row["RoleId"] for row in rows]
 
 
@@ -181,7 +340,9 @@ def get_user_team_roles(national_code: str) -> List[Dict]:
         WHERE NationalCode = :national_code
           AND EndDate IS NULL
     """
-    return execute_query(sql, {"national_code": national_code})
+    return read_query(
+        sql, {"national_code": national_code}, sources=("UserTeamRole",)
+    )
 
 
 def get_all_user_team_roles() -> List[Dict]:
@@ -192,43 +353,262 @@ def get_all_user_team_roles() -> List[Dict]:
         SELECT *
         FROM V_UserTeamRole
     """
+    return read_query(sql, sources=("V_UserTeamRole",))
+
+
+def get_current_user_team_roles() -> List[Dict]:
+    """
+    نقش‌های فعلی همه کاربران (EndDate خالی)
+    """
+    sql = """
+        SELECT *
+        FROM V_UserTeamRole
+        WHERE EndDate IS NULL
+    """
+    return read_query(sql, sources=("V_UserTeamRole",))
+
+
+def get_all_team_role_rows() -> List[Dict]:
+    """
+    همه ردیف‌های جدول UserTeamRole (برای تشخیص تغییر؛ همیشه از SQL Server)
+    """
+    sql = """
+        SELECT *
+        FROM UserTeamRole
+    """
     return execute_query(sql)
 
 
+def bulk_insert_user_team_roles(
+    rows: Iterable[Dict],
+    chunk_size: int = 1000,
+    atomic: bool = True,
+    isolate_errors: bool = False,
+    on_chunk: Optional[Callable] = None
+) -> Dict:
+    """
+    ثبت گروهی نقش کاربران در تیم‌ها
+
+    معادل:
+        UserTeamRole.objects.bulk_create([...])
+
+    هر رکورد:
+        NationalCode, TeamCode, RoleId, LevelId,
+        Superior, StartDate, EndDate
+    """
+    sql = """
+        INSERT INTO UserTeamRole (
+            NationalCode, TeamCode, RoleId, LevelId,
+            Superior, StartDate, EndDate
+        )
+        VALUES (
+            :NationalCode, :TeamCode, :RoleId, :LevelId,
+            :Superior, :StartDate, :EndDate
+        )
+    """
+    report = execute_bulk(
+        sql, rows, chunk_size, atomic,
+        isolate_errors=isolate_errors,
+        on_chunk=on_chunk
+    )
+    mark_snapshot_stale("UserTeamRole")
+    invalidate_tables("UserTeamRole")
+    notify_tables_changed("UserTeamRole")
+    return report
+
+
+def bulk_end_user_team_roles(
+    rows: Iterable[Dict],
+    chunk_size: int = 1000,
+    atomic: bool = True
+) -> Dict:
+    """
+    پایان دادن گروهی به نقش‌های فعلی کاربران (ثبت EndDate)
+
+    هر رکورد:
+        NationalCode, TeamCode, RoleId, EndDate
+    """
+    sql = """
+        UPDATE UserTeamRole
+        SET EndDate = :EndDate
+        WHERE NationalCode = :NationalCode
+          AND TeamCode = :TeamCode
+          AND RoleId = :RoleId
+          AND EndDate IS NULL
+    """
+    report = execute_bulk(sql, rows, chunk_size, atomic)
+    mark_snapshot_stale("UserTeamRole")
+    invalidate_tables("UserTeamRole")
+    notify_tables_changed("UserTeamRole")
+    return report
+
+
 # ======================================================
 # Views (V_*)
 # ======================================================
 
-def get_view_role_target(filters: Dict) -> List[Dict]:
+"""
+فیلتر V_HR_RoleTarget
+
+- فقط ستون‌های ROLE_TARGET_FILTER_COLUMNS مجاز هستند
+  (ستون‌های ROLE_TARGET_FLAG_COLUMNS فقط مقایسه مساوی با True/False)
+- ترتیب شرط‌ها همیشه ترتیب همین لیست است (نه ترتیب کلیدهای درخواست)
+- لیست IN تا توان بعدی 2 با تکرار آخرین مقدار پر می‌شود
+
+در نتیجه متن SQL فقط به «شکل» فیلتر بستگی دارد و SQL Server
+به‌جای یک Plan برای هر ترکیب کلید/طول لیست، چند Plan ثابت و
+پارامتری نگه می‌دارد. SQL هر شکل یک بار ساخته و Cache می‌شود.
+"""
+
+ROLE_TARGET_FILTER_COLUMNS = (
+    "RoleID",
+    "RoleTargetID",
+    "LevelID",
+    "LevelIdTargetID",
+    "RequestType",
+    "Superior",
+    "SuperiorTarget",
+    "Education",
+    "Evaluation",
+    "PmChange",
+    "ITChange",
+)
+
+# ستون‌های bit (فقط eq)
+ROLE_TARGET_FLAG_COLUMNS = frozenset((
+    "Superior",
+    "SuperiorTarget",
+    "Education",
+    "Evaluation",
+    "PmChange",
+    "ITChange",
+))
+
+# شکل فیلتر: ((ستون، عملگر، تعداد پارامتر), ...)
+FilterShape = Tuple[Tuple[str, str, int], ...]
+
+
+def _in_bucket(count: int) -> int:
     """
-    دریافت اطلاعات ویو V_HR_RoleTarget با فیلتر داینامیک
+    کوچک‌ترین توان 2 که ≥ count باشد
+    """
+    return 1 << (count - 1).bit_length()
 
-    filters مثال:
-        {
-            "RoleID": 12,
-            "RequestType": 1
-        }
+
+def _role_target_conditions(filters: Dict) -> Tuple[FilterShape, Dict]:
     """
+    تبدیل filters به شکل (Canonical) و پارامترها
 
-    where_clauses = []
+    مقدار هر ستون:
+        int                     → eq
+        list[int]               → in (یک مقدار → eq)
+        {"gte": .., "lte": ..}  → gte / lte / between
+        bool (ستون‌های Flag)    → eq
+    """
+    unknown = set(filters) - set(ROLE_TARGET_FILTER_COLUMNS)
+    if unknown:
+        raise ValueError(f"Invalid filter columns: {sorted(unknown)}")
+
+    shape = []
     params = {}
 
-    for key, value in filters.items():
-        if value not in ("", None):
-            where_clauses.append(f"{key} = :{key}")
-            params[key] = value
+    for column in ROLE_TARGET_FILTER_COLUMNS:
+        value = filters.get(column)
+        if value in ("", None):
+            continue
+
+        if column in ROLE_TARGET_FLAG_COLUMNS:
+            if not isinstance(value, (bool, int)):
+                raise ValueError(f"Filter {column} accepts only true/false")
+            shape.append((column, "eq", 1))
+            params[column] = bool(value)
+            continue
+
+        if isinstance(value, dict):
+            low, high = value.get("gte"), value.get("lte")
+            if low is not None and high is not None:
+                shape.append((column, "between", 2))
+                params[f"{column}_min"] = low
+                params[f"{column}_max"] = high
+            elif low is not None:
+                shape.append((column, "gte", 1))
+                params[f"{column}_min"] = low
+            elif high is not None:
+                shape.append((column, "lte", 1))
+                params[f"{column}_max"] = high
+            continue
+
+        if isinstance(value, (list, tuple, set)):
+            values = sorted(set(value))
+            if not values:
+                continue
+            if len(values) > 1:
+                bucket = _in_bucket(len(values))
+                values += [values[-1]] * (bucket - len(values))
+                shape.append((column, "in", bucket))
+                params.update(
+                    (f"{column}_{i}", item) for i, item in enumerate(values)
+                )
+                continue
+            value = values[0]
+
+        shape.append((column, "eq", 1))
+        params[column] = value
+
+    return tuple(shape), params
+
+
+@lru_cache(maxsize=256)
+def _role_target_sql(shape: FilterShape) -> TextClause:
+    """
+    ساخت SQL یک شکل فیلتر (یک بار برای هر شکل)
+
+    نام ستون‌ها فقط از ROLE_TARGET_FILTER_COLUMNS می‌آید؛
+    مقادیر همیشه پارامتر هستند.
+    """
+    where_clauses = []
+    for column, op, count in shape:
+        if op == "eq":
+            where_clauses.append(f"{column} = :{column}")
+        elif op == "in":
+            names = ", ".join(f":{column}_{i}" for i in range(count))
+            where_clauses.append(f"{column} IN ({names})")
+        elif op == "between":
+            where_clauses.append(
+                f"{column} BETWEEN :{column}_min AND :{column}_max"
+            )
+        elif op == "gte":
+            where_clauses.append(f"{column} >= :{column}_min")
+        elif op == "lte":
+            where_clauses.append(f"{column} <= :{column}_max")
 
     where_sql = ""
     if where_clauses:
-        where_sql = "WHERE " + " AND ".join(where_clauses)
+        where_sql = "WHERE " + "\n          AND ".join(where_clauses)
 
-    sql = f"""
+    return text(f"""
         SELECT *
         FROM V_HR_RoleTarget
         {where_sql}
+    """)
+
+
+def get_view_role_target(filters: Dict) -> List[Dict]:
     """
+    دریافت اطلاعات ویو V_HR_RoleTarget با فیلتر
 
-    return execute_query(sql, params)
+    filters مثال (خروجی RoleTargetFilter):
+        {
+            "RoleID": 12,
+            "RequestType": [1, 2],
+            "LevelID": {"gte": 2},
+            "Superior": True
+        }
+    """
+    shape, params = _role_target_conditions(filters)
+    return read_query(
+        _role_target_sql(shape), params, sources=("V_HR_RoleTarget",)
+    )
 
 
 def get_view_role_team(role_ids: List[int], team_code: str) -> List[int]:
@@ -238,19 +618,195 @@ def get_view_role_team(role_ids: List[int], team_code: str) -> List[int]:
     معادل:
         V_RoleTeam.objects.filter(...)
     """
-    sql = """
+    if not role_ids:
+        return []
+
+    # expanding: لیست به (:role_ids_1, :role_ids_2, ...) باز می‌شود
+    sql = text("""
         SELECT RoleID
         FROM V_RoleTeam
         WHERE TeamCode = :team_code
           AND RoleID IN :role_ids
-    """
-    rows = execute_query(sql, {
+    """).bindparams(bindparam("role_ids", expanding=True))
+    rows = read_query(sql, {
         "team_code": team_code,
         "role_ids": tuple(role_ids)
-    })
+    }, sources=("V_RoleTeam",))
     return [row["RoleID"] for row in rows]
 
 
+# ======================================================
+# Export (خروجی حجیم از View ها)
+# ======================================================
+"""
+فقط View های این لیست قابل Export هستند.
+
+key:
+    ستون یکتا و مرتب‌شونده برای ادامه دادن Export (Resume)
+    Export همیشه بر اساس این ستون مرتب می‌شود
+"""
+
+EXPORT_VIEWS: Dict[str, Dict] = {
+    "users": {
+        "view": "V_AllUserList",
+        "key": "NationalCode",
+    },
+    "user-team-roles": {
+        "view": "V_UserTeamRole",
+        "key": "id",
+    },
+}
+
+
+def stream_export_view(
+    name: str,
+    after: Optional[str] = None,
+    until: Optional[str] = None,
+    chunk_size: int = 5000
+) -> Iterator[List[Dict]]:
+    """
+    خواندن تکه‌تکه یک View برای Export
+
+    after:
+        فقط رکوردهایی با key بزرگتر از این مقدار (برای Resume)
+    until:
+        فقط رکوردهایی با key کوچکتر یا مساوی این مقدار
+
+    خروجی:
+        Generator از لیست رکوردها (هر لیست حداکثر chunk_size رکورد)
+    """
+    view = EXPORT_VIEWS[name]
+    key = view["key"]
+
+    where_clauses = []
+    params = {}
+
+    if after is not None:
+        where_clauses.append(f"{key} > :after")
+        params["after"] = after
+
+    if until is not None:
+        where_clauses.append(f"{key} <= :until")
+        params["until"] = until
+
+    where_sql = ""
+    if where_clauses:
+        where_sql = "WHERE " + " AND ".join(where_clauses)
+
+    sql = f"""
+        SELECT *
+        FROM {view["view"]}
+        {where_sql}
+        ORDER BY {key}
+    """
+
+    return stream_query(sql, params, chunk_size)
+
+
+# ======================================================
+# Change Tracking (همگام‌سازی تغییرات - /changes)
+# ======================================================
+"""
+جدول‌هایی که تغییراتشان با SQL Server Change Tracking خوانده می‌شود.
+
+key:
+    کلید اصلی (Primary Key) جدول؛ Change Tracking فقط همین ستون‌ها
+    را برای ردیف‌های حذف‌شده نگه می‌دارد
+
+فعال‌سازی (یک بار، توسط DBA):
+    ALTER DATABASE <db> SET CHANGE_TRACKING = ON
+        (CHANGE_RETENTION = 7 DAYS, AUTO_CLEANUP = ON);
+    ALTER TABLE Users ENABLE CHANGE_TRACKING;
+    ALTER TABLE Team ENABLE CHANGE_TRACKING;
+    ALTER TABLE Role ENABLE CHANGE_TRACKING;
+    ALTER TABLE UserTeamRole ENABLE CHANGE_TRACKING;
+"""
+
+CHANGE_TRACKING_TABLES: Dict[str, Dict] = {
+    "users": {
+        "table": "Users",
+        "key": ("NationalCode",),
+    },
+    "teams": {
+        "table": "Team",
+        "key": ("TeamCode",),
+    },
+    "roles": {
+        "table": "Role",
+        "key": ("RoleId",),
+    },
+    "user-team-roles": {
+        "table": "UserTeamRole",
+        "key": ("id",),
+    },
+}
+
+
+def change_tracking_supported() -> bool:
+    """
+    Change Tracking فقط روی SQL Server وجود دارد
+    """
+    return get_engine().dialect.name == "mssql"
+
+
+def get_change_tracking_versions(names: Iterable[str]) -> Dict:
+    """
+    نسخه فعلی دیتابیس و حداقل نسخه معتبر هر جدول
+
+    خروجی:
+        {"current": 1234, "min_valid": {"users": 1000, ...}}
+        (جدولی که Change Tracking آن فعال نیست → None)
+    """
+    names = list(names)
+    columns = ",\n            ".join(
+        f"CHANGE_TRACKING_MIN_VALID_VERSION("
+        f"OBJECT_ID('{CHANGE_TRACKING_TABLES[name]['table']}')) AS v{i}"
+        for i, name in enumerate(names)
+    )
+    sql = f"""
+        SELECT
+            CHANGE_TRACKING_CURRENT_VERSION() AS current_version,
+            {columns}
+    """
+    row = execute_query_one(sql)
+    return {
+        "current": row["current_version"],
+        "min_valid": {name: row[f"v{i}"] for i, name in enumerate(names)},
+    }
+
+
+def get_table_changes(name: str, since: int, limit: int) -> List[Dict]:
+    """
+    ردیف‌های تغییرکرده یک جدول بعد از نسخه since
+    (حداکثر limit ردیف، به ترتیب نسخه تغییر)
+
+    هر ردیف:
+        ChangeOperation → I / U / D
+        ChangeVersion   → نسخه آخرین تغییر
+        Key_<ستون>      → کلید (برای ردیف حذف‌شده فقط همین پر است)
+        بقیه ستون‌ها    → مقدار فعلی ردیف (حذف‌شده → None)
+
+    هر ردیف فقط یک بار می‌آید (آخرین وضعیت، نه همه تغییرات میانی).
+    """
+    table = CHANGE_TRACKING_TABLES[name]
+    keys = table["key"]
+
+    key_columns = ", ".join(f"CT.{col} AS Key_{col}" for col in keys)
+    join = " AND ".join(f"T.{col} = CT.{col}" for col in keys)
+
+    sql = f"""
+        SELECT TOP (:limit)
+            CT.SYS_CHANGE_OPERATION AS ChangeOperation,
+            CT.SYS_CHANGE_VERSION AS ChangeVersion,
+            {key_columns},
+            T.*
+        FROM CHANGETABLE(CHANGES {table["table"]}, :since) AS CT
+        LEFT JOIN {table["table"]} AS T ON {join}
+        ORDER BY CT.SYS_CHANGE_VERSION
+    """
+    return execute_query(sql, {"since": since, "limit": limit})
+
+
 # ======================================================
 # Stored Procedures (HR)
 # ======================================================
@@ -299,6 +855,40 @@ def sp_get_assessors_educators(
     )
 
 
+def sp_get_assessors_educators_all(
+    team_code: str,
+    info_id: int,
+    role_id_target: int,
+    level_id_target: int,
+    superior_target: int,
+    temporary: int,
+    type_: int
+) -> Dict[str, List[Dict]]:
+    """
+    اجرای SP:
+        HR_GetAssessorsAndEducators
+
+    همه Result Set های SP در یک رفت‌وبرگشت خوانده می‌شوند:
+        {
+            "assessors": [...],
+            "educators": [...]
+        }
+    """
+    return execute_sp_multi_result(
+        "dbo.HR_GetAssessorsAndEducators",
+        {
+            "TeamCode": team_code,
+            "InfoID": info_id,
+            "RoleIdTarget": role_id_target,
+            "LevelIdTarget": level_id_target,
+            "SuperiorTarget": superior_target,
+            "Temporary": temporary,
+            "Type": type_
+        },
+        names=("assessors", "educators")
+    )
+
+
 def sp_get_team_manager(role_id: int, team_code: str):
     """
     اجرای SP:
@@ -0,0 +1,297 @@
+# backend/app/modules/hr/role_graph.py
+
+"""
+گراف جابه‌جایی سمت‌ها (از V_HR_RoleTarget)
+
+مسئولیت این فایل:
+- ساخت گراف جهت‌دار درون‌حافظه‌ای:
+    گره → (RoleID, LevelID)
+    یال → (RoleTargetID, LevelIdTargetID) برای هر RequestType
+- جستجوها:
+    reachable     → همه سمت‌های قابل رسیدن از یک سمت (BFS، با فاصله)
+    shortest_path → کوتاه‌ترین مسیر ارتقا بین دو سمت
+    closure       → بستار متعدی (هر سمت → سمت‌های قابل رسیدن)
+
+نکات:
+- ردیفی که LevelID ندارد برای همه سطح‌های آن سمت اعمال می‌شود
+- request_type خالی → همه نوع‌ها با هم
+- گراف از Cache سطرهای View (hr.role_targets) ساخته می‌شود؛
+  با بارگذاری دوباره آن Cache، اگر محتوا تغییر کرده باشد گراف
+  دوباره ساخته و نتیجه‌های Memoize شده دور ریخته می‌شوند
+"""
+
+from collections import deque
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from app.core.logging import get_logger
+from app.modules.hr import service
+
+logger = get_logger(__name__)
+
+Node = Tuple[int, Optional[int]]        # (RoleID, LevelID)
+
+
+# ======================================================
+# ساخت گراف
+# ======================================================
+class _Graph:
+
+    def __init__(self, rows: List[Dict], version: int):
+        self.version = version
+
+        # edges[request_type][node] / wildcard[request_type][role]
+        # request_type = None → همه نوع‌ها
+        self.edges: Dict[Optional[int], Dict[Node, Set[Node]]] = {None: {}}
+        self.wildcard: Dict[Optional[int], Dict[int, Set[Node]]] = {None: {}}
+        self.nodes_by_role: Dict[int, Set[Node]] = {}
+
+        for row in rows:
+            source: Node = (row["RoleID"], row["LevelID"])
+            target: Node = (row["RoleTargetID"], row["LevelIdTargetID"])
+            request_type = row["RequestType"]
+
+            for node in (source, target):
+                self.nodes_by_role.setdefault(node[0], set()).add(node)
+
+            for key in (request_type, None):
+                if source[1] is None:
+                    self.wildcard.setdefault(key, {}).setdefault(
+                        source[0], set()
+                    ).add(target)
+                else:
+                    self.edges.setdefault(key, {}).setdefault(
+                        source, set()
+                    ).add(target)
+
+        self.request_types = sorted(
+            key for key in self.edges.keys() | self.wildcard.keys()
+            if key is not None
+        )
+
+    def neighbors(self, node: Node, request_type: Optional[int]):
+        edges = self.edges.get(request_type, {})
+        wildcard = self.wildcard.get(request_type, {})
+        yield from edges.get(node, ())
+        yield from wildcard.get(node[0], ())
+
+    def start_nodes(self, role_id: int, level_id: Optional[int]) -> List[Node]:
+        nodes = self.nodes_by_role.get(role_id, ())
+        if level_id is None:
+            return sorted(nodes, key=_node_key)
+        return [node for node in nodes if node[1] in (level_id, None)] or [
+            (role_id, level_id)
+        ]
+
+    def bfs(
+        self,
+        starts: List[Node],
+        request_type: Optional[int],
+        max_depth: Optional[int] = None
+    ) -> Dict[Node, Tuple[int, Optional[Node]]]:
+        """
+        خروجی: گره → (فاصله، گره قبلی)
+        """
+        seen: Dict[Node, Tuple[int, Optional[Node]]] = {
+            node: (0, None) for node in starts
+        }
+        queue = deque(starts)
+        while queue:
+            node = queue.popleft()
+            distance = seen[node][0]
+            if max_depth is not None and distance >= max_depth:
+                continue
+            for target in self.neighbors(node, request_type):
+                if target not in seen:
+                    seen[target] = (distance + 1, node)
+                    queue.append(target)
+        return seen
+
+
+def _node_key(node: Node):
+    # None (بدون سطح) قبل از سطح‌ها
+    return node[0], -1 if node[1] is None else node[1]
+
+
+_graph: Optional[_Graph] = None
+_source_rows: Optional[List[Dict]] = None
+_fingerprint: Optional[int] = None
+_graph_lock = Lock()
+
+
+def _rows_fingerprint(rows: List[Dict]) -> int:
+    return hash(frozenset(
+        (
+            row["RoleID"], row["LevelID"], row["RoleTargetID"],
+            row["LevelIdTargetID"], row["RequestType"]
+        )
+        for row in rows
+    ))
+
+
+def get_graph() -> _Graph:
+    """
+    گراف جاری (فقط وقتی محتوای View تغییر کرده باشد دوباره ساخته می‌شود)
+    """
+    global _graph, _source_rows, _fingerprint
+
+    rows = service.get_all_role_targets()
+    if rows is _source_rows and _graph is not None:
+        return _graph
+
+    with _graph_lock:
+        if rows is not _source_rows or _graph is None:
+            fingerprint = _rows_fingerprint(rows)
+            if fingerprint != _fingerprint or _graph is None:
+                version = _graph.version + 1 if _graph else 1
+                _graph = _Graph(rows, version)
+                _clear_memo()
+                logger.info(
+                    "Role graph built (version %s): %s rows, %s roles",
+                    version, len(rows), len(_graph.nodes_by_role)
+                )
+            _source_rows = rows
+            _fingerprint = fingerprint
+        return _graph
+
+
+# ======================================================
+# جستجوها (Memoize به ازای گراف؛ با ساخت گراف جدید پاک می‌شوند)
+# ======================================================
+def _role_names() -> Dict[int, str]:
+    return {
+        role["RoleId"]: role["RoleName"] for role in service.get_all_roles()
+    }
+
+
+def _describe(node: Node, names: Dict[int, str]) -> Dict:
+    return {
+        "RoleID": node[0],
+        "LevelID": node[1],
+        "RoleName": names.get(node[0]),
+    }
+
+
+@lru_cache(maxsize=4096)
+def _reachable(
+    graph: _Graph,
+    role_id: int,
+    level_id: Optional[int],
+    request_type: Optional[int],
+    max_depth: Optional[int]
+) -> Tuple[Tuple[Node, int], ...]:
+    starts = graph.start_nodes(role_id, level_id)
+    seen = graph.bfs(starts, request_type, max_depth)
+    start_set = set(starts)
+    return tuple(sorted(
+        (
+            (node, distance) for node, (distance, _) in seen.items()
+            if node not in start_set
+        ),
+        key=lambda item: (item[1], _node_key(item[0]))
+    ))
+
+
+@lru_cache(maxsize=4096)
+def _shortest_path(
+    graph: _Graph,
+    from_role: int,
+    from_level: Optional[int],
+    to_role: int,
+    to_level: Optional[int],
+    request_type: Optional[int]
+) -> Optional[Tuple[Node, ...]]:
+    starts = graph.start_nodes(from_role, from_level)
+    seen = graph.bfs(starts, request_type)
+
+    targets = [
+        node for node in seen
+        if node[0] == to_role and (to_level is None or node[1] == to_level)
+    ]
+    if not targets:
+        return None
+
+    node = min(targets, key=lambda n: (seen[n][0], _node_key(n)))
+    path = [node]
+    while seen[node][1] is not None:
+        node = seen[node][1]
+        path.append(node)
+    return tuple(reversed(path))
+
+
+@lru_cache(maxsize=64)
+def _closure(
+    graph: _Graph,
+    request_type: Optional[int]
+) -> Dict[int, FrozenSet[int]]:
+    closure = {}
+    for role_id, nodes in graph.nodes_by_role.items():
+        seen = graph.bfs(sorted(nodes, key=_node_key), request_type)
+        closure[role_id] = frozenset(
+            node[0] for node, (distance, _) in seen.items() if distance > 0
+        )
+    return closure
+
+
+def _clear_memo():
+    _reachable.cache_clear()
+    _shortest_path.cache_clear()
+    _closure.cache_clear()
+
+
+def reachable_roles(
+    role_id: int,
+    level_id: Optional[int] = None,
+    request_type: Optional[int] = None,
+    max_depth: Optional[int] = None
+) -> List[Dict]:
+    """
+    همه سمت/سطح‌های قابل رسیدن از یک سمت (به ترتیب فاصله)
+    """
+    graph = get_graph()
+    names = _role_names()
+    return [
+        {**_describe(node, names), "Distance": distance}
+        for node, distance in _reachable(
+            graph, role_id, level_id, request_type, max_depth
+        )
+    ]
+
+
+def shortest_path(
+    from_role: int,
+    to_role: int,
+    from_level: Optional[int] = None,
+    to_level: Optional[int] = None,
+    request_type: Optional[int] = None
+) -> Optional[List[Dict]]:
+    """
+    کوتاه‌ترین مسیر ارتقا (گام‌ها از سمت مبدأ تا مقصد)
+
+    None → مسیری وجود ندارد
+    """
+    graph = get_graph()
+    path = _shortest_path(
+        graph, from_role, from_level, to_role, to_level, request_type
+    )
+    if path is None:
+        return None
+    names = _role_names()
+    return [_describe(node, names) for node in path]
+
+
+def transitive_closure(
+    request_type: Optional[int] = None
+) -> Dict[int, List[int]]:
+    """
+    بستار متعدی در سطح سمت: RoleID → سمت‌های قابل رسیدن
+    """
+    graph = get_graph()
+    return {
+        role_id: sorted(targets)
+        for role_id, targets in sorted(
+            _closure(graph, request_type).items()
+        )
+    }
+
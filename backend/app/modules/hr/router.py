@@ -14,24 +14,51 @@ Router ماژول HR
 - HR/api.py (APIView ها)
 """
 
-from fastapi import APIRouter, Depends, Query, HTTPException
-from typing import List, Dict, Optional
+from datetime import date, timedelta
+
+from fastapi import (
+    APIRouter, Body, Depends, Header, Query, HTTPException, Request
+)
+from fastapi.responses import Response, StreamingResponse
+from typing import List, Dict, Optional, Literal, Union
 
 from app.core.auth import get_current_user, AuthenticatedUser
+from app.core import jobs
+from app.core.concurrency import (
+    bulkhead,
+    bulkhead_route,
+    export_slot_available,
+    iterate_export
+)
+from app.core.events import change_topics, event_stream, subscribe
 from app.core.logging import get_logger
-from app.modules.hr import service
+from app.modules.hr import hierarchy, importer, role_graph, service
+from app.modules.hr import jobs as hr_jobs  # noqa: F401 (ثبت Job ها)
+from app.modules.hr.repository import CHANGE_TRACKING_TABLES, EXPORT_VIEWS
 from app.modules.hr.schemas import (
     UserMinimal,
+    UserDatesOut,
     UserFull,
+    UserProfileOut,
     TeamOut,
-    RoleOut
+    RoleOut,
+    UserTeamRoleIn,
+    UserTeamRoleEndIn,
+    UserTeamRoleHistoryOut,
+    BulkWriteReport,
+    ChangesOut,
+    ImportReport,
+    JobOut,
+    RoleTargetFilter
 )
+from app.shared.utils import parse_jalali, today_jalali
 
 logger = get_logger(__name__)
 
 router = APIRouter(
     prefix="/api/hr",
-    tags=["HR"]
+    tags=["HR"],
+    route_class=bulkhead_route("directory")
 )
 
 # ======================================================
@@ -40,7 +67,7 @@ router = APIRouter(
 
 @router.get(
     "/users",
-    response_model=List[UserMinimal]
+    response_model=Union[List[UserMinimal], Dict[str, UserMinimal]]
 )
 def get_all_users(
     user: AuthenticatedUser = Depends(get_current_user),
@@ -52,7 +79,7 @@ def get_all_users(
     معادل:
         GET /api/all-users/
     """
-    logger.info(f"User [{user.username}] requested all users")
+    logger.info("User [%s] requested all users", user.username)
 
     users = service.get_all_users_minimal()
 
@@ -65,6 +92,75 @@ def get_all_users(
     return users
 
 
+@router.get(
+    "/users/contracts",
+    response_model=List[UserDatesOut]
+)
+def get_users_by_contract_date(
+    field: Literal["start", "end"] = Query("start"),
+    date_from: Optional[str] = Query(None, description="شمسی: 1402/01/01"),
+    date_to: Optional[str] = Query(None, description="شمسی: 1402/12/29"),
+    within_days: Optional[int] = Query(
+        None, ge=0, le=3650,
+        description="از امروز تا N روز بعد (به‌جای date_from / date_to)"
+    ),
+    active_only: bool = Query(True),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    کاربرانی که شروع (field=start) یا پایان (field=end) قراردادشان
+    در یک بازه تاریخ است
+
+    مثال (قراردادهایی که تا 30 روز آینده تمام می‌شوند):
+        GET /api/hr/users/contracts?field=end&within_days=30
+    """
+    if within_days is not None:
+        start = date.today()
+        end = start + timedelta(days=within_days)
+    else:
+        start = _parse_date_param("date_from", date_from)
+        end = _parse_date_param("date_to", date_to)
+
+    logger.info(
+        "User [%s] requested contract %s window %s..%s",
+        user.username, field, start, end
+    )
+    return service.get_users_by_contract_date(
+        field, start, end, active_only=active_only
+    )
+
+
+@router.get(
+    "/users/birthdays",
+    response_model=List[UserDatesOut]
+)
+def get_birthdays(
+    month: Optional[int] = Query(
+        None, ge=1, le=12, description="ماه شمسی (پیش‌فرض: ماه جاری)"
+    ),
+    active_only: bool = Query(True),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    تولدهای یک ماه شمسی (به ترتیب روز)
+    """
+    if month is None:
+        month = today_jalali()[1]
+    return service.get_birthdays(month, active_only=active_only)
+
+
+def _parse_date_param(name: str, value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    parsed = parse_jalali(value)
+    if parsed is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid Jalali date for {name}: {value}"
+        )
+    return parsed
+
+
 @router.get(
     "/users/{national_code}",
     response_model=UserFull
@@ -80,7 +176,7 @@ def get_user_by_national_code(
         GET /api/get-user/<national_code>/v2/
     """
     logger.info(
-        f"User [{user.username}] requested user [{national_code}]"
+        "User [%s] requested user [%s]", user.username, national_code
     )
 
     result = service.get_user_by_national_code(national_code)
@@ -94,6 +190,38 @@ def get_user_by_national_code(
     return result
 
 
+@router.get(
+    "/users/{national_code}/profile",
+    response_model=UserProfileOut
+)
+async def get_user_profile(
+    national_code: str,
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    دریافت پروفایل ترکیبی کاربر:
+        اطلاعات کاربر + RoleId ها + نقش‌های تیمی
+
+    جایگزین سه درخواست:
+        GET /users/{national_code}
+        GET /users/{national_code}/roles
+        GET /users/{national_code}/team-roles
+    """
+    logger.info(
+        "User [%s] requested profile [%s]", user.username, national_code
+    )
+
+    result = await service.get_user_profile(national_code)
+
+    if not result:
+        raise HTTPException(
+            status_code=404,
+            detail="کاربر یافت نشد"
+        )
+
+    return result
+
+
 # ======================================================
 # Teams
 # ======================================================
@@ -106,7 +234,7 @@ def get_user_by_national_code(
 
 @router.get(
     "/roles",
-    response_model=List[RoleOut]
+    response_model=Union[List[RoleOut], Dict[int, RoleOut]]
 )
 def get_all_roles(
     user: AuthenticatedUser = Depends(get_current_user),
@@ -146,6 +274,64 @@ def get_user_roles(
     return service.get_user_roles_by_national_code(national_code)
 
 
+# ======================================================
+# سلسله‌مراتب و زنجیره مدیریت
+# ======================================================
+
+@router.get(
+    "/users/{national_code}/management-chain"
+)
+def get_management_chain(
+    national_code: str,
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    زنجیره مدیریت کاربر در هر تیمش
+    (از مدیر مستقیم تا بالاترین مدیر)
+    """
+    return hierarchy.get_management_chain(national_code)
+
+
+@router.get(
+    "/users/{national_code}/subordinates",
+    response_model=List[UserTeamRoleHistoryOut]
+)
+def get_subordinates(
+    national_code: str,
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    همه زیرمجموعه‌های مستقیم و غیرمستقیم یک مدیر
+    """
+    return hierarchy.get_subordinates(national_code)
+
+
+@router.get(
+    "/org-chart"
+)
+def get_org_chart(
+    team_code: Optional[str] = Query(
+        None, description="فقط زیردرخت این تیم (خالی = کل سازمان)"
+    ),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    درخت سازمانی (تیم‌ها، مدیران، تعداد اعضا)
+
+    از Cache (hr.team_hierarchy) برگردانده می‌شود
+    """
+    if team_code is None:
+        return Response(
+            content=hierarchy.get_org_chart_json(),
+            media_type="application/json"
+        )
+
+    chart = hierarchy.get_org_chart(team_code)
+    if chart is None:
+        raise HTTPException(status_code=404, detail="Team not found")
+    return chart
+
+
 # ======================================================
 # UserTeamRole
 # ======================================================
@@ -166,6 +352,110 @@ def get_user_team_roles(
     return service.get_user_team_roles(national_code)
 
 
+@router.get(
+    "/users/{national_code}/role-history",
+    response_model=List[UserTeamRoleHistoryOut]
+)
+def get_user_role_history(
+    national_code: str,
+    date_from: Optional[str] = Query(None, description="شمسی: 1400/01/01"),
+    date_to: Optional[str] = Query(None, description="شمسی: 1402/12/29"),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    تاریخچه نقش‌های کاربر (فعال و پایان‌یافته) که با بازه
+    [date_from, date_to] هم‌پوشانی دارند، به ترتیب تاریخ شروع
+    """
+    return service.get_user_role_history(
+        national_code,
+        _parse_date_param("date_from", date_from),
+        _parse_date_param("date_to", date_to)
+    )
+
+
+@router.get(
+    "/team-roles/holders",
+    response_model=List[UserTeamRoleHistoryOut]
+)
+def get_role_holders(
+    team_code: str,
+    role_id: int,
+    on: Optional[str] = Query(None, description="شمسی (پیش‌فرض: امروز)"),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    چه کسانی در تاریخ on سمت role_id را در تیم team_code داشته‌اند
+    """
+    return service.get_role_holders(
+        team_code, role_id, _parse_date_param("on", on) or date.today()
+    )
+
+
+@router.get(
+    "/team-roles/roster",
+    response_model=List[UserTeamRoleHistoryOut]
+)
+def get_team_roster(
+    team_code: str,
+    on: Optional[str] = Query(None, description="شمسی (پیش‌فرض: امروز)"),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    اعضای تیم team_code و نقش‌هایشان در تاریخ on
+    """
+    return service.get_team_roster(
+        team_code, _parse_date_param("on", on) or date.today()
+    )
+
+
+@router.post(
+    "/team-roles/bulk",
+    response_model=BulkWriteReport
+)
+@bulkhead("write")
+def bulk_insert_user_team_roles(
+    rows: List[UserTeamRoleIn],
+    atomic: bool = Query(True),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    ثبت گروهی نقش کاربران در تیم‌ها
+
+    atomic:
+        True  → با اولین خطا هیچ رکوردی ثبت نمی‌شود
+        False → فقط دسته‌های خطادار ثبت نمی‌شوند
+    """
+    logger.info(
+        "User [%s] bulk inserted %s team roles", user.username, len(rows)
+    )
+    return service.bulk_insert_user_team_roles(
+        [row.model_dump() for row in rows],
+        atomic=atomic
+    )
+
+
+@router.post(
+    "/team-roles/bulk-end",
+    response_model=BulkWriteReport
+)
+@bulkhead("write")
+def bulk_end_user_team_roles(
+    rows: List[UserTeamRoleEndIn],
+    atomic: bool = Query(True),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    پایان دادن گروهی به نقش‌های فعلی کاربران (ثبت EndDate)
+    """
+    logger.info(
+        "User [%s] bulk ended %s team roles", user.username, len(rows)
+    )
+    return service.bulk_end_user_team_roles(
+        [row.model_dump() for row in rows],
+        atomic=atomic
+    )
+
+
 # ======================================================
 # Views (V_*)
 # ======================================================
@@ -174,19 +464,24 @@ def get_user_team_roles(
     "/view/role-target"
 )
 def get_view_role_target(
-    filters: Dict,
+    filters: RoleTargetFilter,
     user: AuthenticatedUser = Depends(get_current_user)
 ):
     """
-    دریافت اطلاعات ویو V_HR_RoleTarget با فیلتر داینامیک
+    دریافت اطلاعات ویو V_HR_RoleTarget با فیلتر
+
+    هر ستون: مقدار (=)، لیست (IN) یا بازه ({"gte": .., "lte": ..})
+    ستون‌های bit (Superior, Education, ...): true/false
 
     معادل:
         get-v-role-target
     """
     logger.info(
-        f"User [{user.username}] requested V_HR_RoleTarget"
+        "User [%s] requested V_HR_RoleTarget", user.username
+    )
+    return service.get_view_role_target(
+        filters.model_dump(exclude_none=True)
     )
-    return service.get_view_role_target(filters)
 
 
 @router.post(
@@ -206,6 +501,289 @@ def get_view_role_team(
     return service.get_view_role_team(role_ids, team_code)
 
 
+# ======================================================
+# گراف جابه‌جایی سمت‌ها (V_HR_RoleTarget)
+# ======================================================
+
+@router.get(
+    "/role-graph/reachable"
+)
+def get_reachable_roles(
+    role_id: int,
+    level_id: Optional[int] = None,
+    request_type: Optional[int] = Query(None, description="خالی = همه نوع‌ها"),
+    max_depth: Optional[int] = Query(None, ge=1, le=50),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    همه سمت/سطح‌هایی که از یک سمت قابل رسیدن هستند (به ترتیب فاصله)
+    """
+    return role_graph.reachable_roles(
+        role_id, level_id, request_type, max_depth
+    )
+
+
+@router.get(
+    "/role-graph/path"
+)
+def get_role_path(
+    from_role: int,
+    to_role: int,
+    from_level: Optional[int] = None,
+    to_level: Optional[int] = None,
+    request_type: Optional[int] = Query(None, description="خالی = همه نوع‌ها"),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    کوتاه‌ترین مسیر ارتقا بین دو سمت (کمترین تعداد جابه‌جایی)
+    """
+    path = role_graph.shortest_path(
+        from_role, to_role, from_level, to_level, request_type
+    )
+    if path is None:
+        raise HTTPException(status_code=404, detail="No path found")
+    return path
+
+
+@router.get(
+    "/role-graph/closure"
+)
+def get_role_closure(
+    request_type: Optional[int] = Query(None, description="خالی = همه نوع‌ها"),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    بستار متعدی: هر سمت → همه سمت‌های قابل رسیدن
+    """
+    return role_graph.transitive_closure(request_type)
+
+
+# ======================================================
+# Export
+# ======================================================
+
+@router.get(
+    "/export/{view_name}"
+)
+async def export_view(
+    view_name: str,
+    fmt: Literal["csv", "ndjson"] = Query("csv"),
+    gzip: bool = Query(False),
+    after: Optional[str] = Query(None),
+    until: Optional[str] = Query(None),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    Export حجیم یک View به‌صورت CSV یا NDJSON (Stream)
+
+    view_name:
+        users            → V_AllUserList   (key: NationalCode)
+        user-team-roles  → V_UserTeamRole  (key: id)
+
+    Resume:
+        رکوردها بر اساس key مرتب هستند؛ اگر دانلود قطع شد،
+        آخرین key دریافتی را در after بفرستید.
+
+    نکته:
+        Export روی Executor اختصاصی اجرا می‌شود
+        و Thread Pool درخواست‌های تعاملی را اشغال نمی‌کند.
+        حداکثر EXPORT_MAX_WORKERS Export همزمان (بیشتر → 503).
+    """
+    if view_name not in EXPORT_VIEWS:
+        raise HTTPException(
+            status_code=404,
+            detail="View برای Export تعریف نشده است"
+        )
+
+    if not export_slot_available():
+        raise HTTPException(
+            status_code=503,
+            detail="تعداد Export های همزمان به حداکثر رسیده است",
+            headers={"Retry-After": "10"}
+        )
+
+    logger.info(
+        "User [%s] exported [%s]", user.username, view_name
+    )
+
+    body = service.export_view(
+        view_name,
+        fmt=fmt,
+        compress=gzip,
+        after=after,
+        until=until
+    )
+
+    filename = f"{view_name}.{fmt}"
+    if gzip:
+        filename += ".gz"
+
+    return StreamingResponse(
+        iterate_export(body),
+        media_type="application/gzip" if gzip else service.EXPORT_FORMATS[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"'
+        }
+    )
+
+
+# ======================================================
+# Delta Sync
+# ======================================================
+
+@router.get(
+    "/changes",
+    response_model=ChangesOut
+)
+def get_changes(
+    since: Optional[str] = Query(None, description="token پاسخ قبلی"),
+    tables: Optional[str] = Query(
+        None,
+        description="users,teams,roles,user-team-roles (خالی = همه)"
+    ),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    تغییرات کاربران، تیم‌ها، سمت‌ها و نقش‌ها بعد از token
+    (برای سیستم‌هایی که کپی محلی از داده دارند)
+
+    - اولین بار بدون since → resync و token
+    - resync=True → داده را کامل دوباره بخوانید و با token جدید ادامه دهید
+    - ردیف‌ها را Upsert کنید (ممکن است یک ردیف دوباره بیاید)
+    """
+    selected = None
+    if tables:
+        selected = [name.strip() for name in tables.split(",") if name.strip()]
+        unknown = sorted(set(selected) - set(CHANGE_TRACKING_TABLES))
+        if unknown or not selected:
+            raise HTTPException(
+                status_code=400,
+                detail=f"جدول نامعتبر: {', '.join(unknown)}"
+            )
+
+    try:
+        return service.get_changes(since, selected)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except service.ChangeTrackingUnavailable as exc:
+        raise HTTPException(status_code=501, detail=str(exc))
+
+
+# ======================================================
+# Events (Server-Sent Events)
+# ======================================================
+
+@router.get(
+    "/events"
+)
+async def stream_events(
+    topics: Optional[str] = Query(
+        None,
+        description="users,teams,roles,user-team-roles (خالی = همه)"
+    ),
+    last_event_id: Optional[str] = Query(None),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    رویدادهای تغییر کاربران، تیم‌ها، سمت‌ها و نقش‌ها (text/event-stream)
+
+    هر رویداد:
+        id: <شناسه>
+        event: <topic>
+        data: {"action": "created|updated|deleted", "key": {...}, "row": {...}}
+
+    رویدادهای خاص:
+        reload   → تغییر گسترده؛ داده آن topic را دوباره بخوانید
+        resync   → رویدادهای از دست رفته در دسترس نیستند؛ همه را دوباره بخوانید
+        overflow → Client عقب افتاد؛ اتصال بسته می‌شود (ادامه با Last-Event-ID)
+
+    Resume:
+        EventSource هنگام اتصال دوباره هدر Last-Event-ID را خودش می‌فرستد؛
+        در غیر این صورت last_event_id را در Query بفرستید.
+    """
+    available = change_topics()
+    selected = (
+        [topic.strip() for topic in topics.split(",") if topic.strip()]
+        if topics else available
+    )
+    unknown = sorted(set(selected) - set(available))
+    if unknown or not selected:
+        raise HTTPException(
+            status_code=400,
+            detail=f"topic نامعتبر: {', '.join(unknown)} (مجاز: {', '.join(available)})"
+        )
+
+    subscriber = subscribe(selected, last_event_id_header or last_event_id)
+    if subscriber is None:
+        raise HTTPException(
+            status_code=503,
+            detail="تعداد اتصال‌های رویداد به حداکثر رسیده است",
+            headers={"Retry-After": "30"}
+        )
+
+    logger.info("User [%s] subscribed to events %s", user.username, selected)
+
+    return StreamingResponse(
+        event_stream(subscriber),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        }
+    )
+
+
+# ======================================================
+# Import (CSV)
+# ======================================================
+
+@router.post(
+    "/import/{kind}",
+    response_model=ImportReport
+)
+async def import_csv(
+    kind: str,
+    request: Request,
+    atomic: bool = Query(False),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    Import گروهی از فایل CSV
+
+    kind:
+        users       → ثبت کاربران جدید (ستون‌ها مطابق UserIn)
+        team-roles  → ثبت نقش کاربران در تیم‌ها (ستون‌ها مطابق UserTeamRoleIn)
+
+    Body:
+        متن خام فایل CSV (Content-Type: text/csv) با سطر اول سرستون‌ها
+
+    مثال:
+        curl -X POST --data-binary @roles.csv \
+             -H "Content-Type: text/csv" \
+             http://127.0.0.1:8000/api/hr/import/team-roles
+
+    atomic:
+        True  → با اولین خطای دیتابیس هیچ ردیفی ثبت نمی‌شود
+        False → فقط ردیف‌های خطادار ثبت نمی‌شوند
+    """
+    if kind not in importer.IMPORT_KINDS:
+        raise HTTPException(
+            status_code=404,
+            detail="نوع Import تعریف نشده است"
+        )
+
+    logger.info(
+        "User [%s] started import [%s]", user.username, kind
+    )
+
+    return await importer.import_csv_stream(
+        kind,
+        request.stream(),
+        atomic=atomic
+    )
+
+
 # ======================================================
 # Stored Procedures
 # ======================================================
@@ -213,6 +791,7 @@ def get_view_role_team(
 @router.post(
     "/sp/get-target-role"
 )
+@bulkhead("sp")
 def call_sp_get_target_role(
     info_id: int,
     request_type: int,
@@ -226,7 +805,7 @@ def call_sp_get_target_role(
         call-sp-get-target-role
     """
     logger.info(
-        f"User [{user.username}] called HR_GetTargetRole"
+        "User [%s] called HR_GetTargetRole", user.username
     )
     return service.sp_get_target_role(info_id, request_type)
 
@@ -234,6 +813,7 @@ def call_sp_get_target_role(
 @router.post(
     "/sp/get-assessors-educators"
 )
+@bulkhead("sp")
 def call_sp_get_assessors_educators(
     team_code: str,
     info_id: int,
@@ -259,6 +839,139 @@ def call_sp_get_assessors_educators(
     )
 
 
+@router.post(
+    "/sp/get-assessors-educators/all"
+)
+@bulkhead("sp")
+def call_sp_get_assessors_educators_all(
+    team_code: str,
+    info_id: int,
+    role_id_target: int,
+    level_id_target: int,
+    superior_target: int,
+    temporary: int = 0,
+    type_: int = 0,
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    اجرای SP:
+        HR_GetAssessorsAndEducators
+
+    خروجی همه Result Set ها در یک درخواست:
+        {"assessors": [...], "educators": [...]}
+    """
+    return service.sp_get_assessors_educators_all(
+        team_code=team_code,
+        info_id=info_id,
+        role_id_target=role_id_target,
+        level_id_target=level_id_target,
+        superior_target=superior_target,
+        temporary=temporary,
+        type_=type_
+    )
+
+
+# ======================================================
+# Background Jobs
+# ======================================================
+
+@router.post(
+    "/jobs/{kind}",
+    response_model=JobOut,
+    status_code=202
+)
+def submit_job(
+    kind: str,
+    params: Dict = Body(default={}),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    ثبت یک Job پس‌زمینه (برای SP های طولانی)
+
+    Body:
+        پارامترهای عملیات، مثلاً:
+            {"info_id": 10, "request_type": 1}
+
+    خروجی:
+        وضعیت Job (با id برای پیگیری)
+        اگر Job یکسان همین کاربر در صف یا در حال اجرا باشد،
+        همان برگردانده می‌شود.
+    """
+    if kind not in jobs.get_job_kinds():
+        raise HTTPException(
+            status_code=404,
+            detail="نوع Job تعریف نشده است"
+        )
+
+    try:
+        return jobs.submit_job(kind, params, submitted_by=user.username)
+    except jobs.JobError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=JobOut
+)
+def get_job(
+    job_id: str,
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    دریافت وضعیت Job
+    """
+    job = jobs.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job یافت نشد")
+    return job
+
+
+@router.get(
+    "/jobs/{job_id}/result"
+)
+def get_job_result(
+    job_id: str,
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    دریافت نتیجه Job
+
+    - 404 → Job وجود ندارد
+    - 409 → Job هنوز موفق تمام نشده است
+    """
+    job = jobs.get_job(job_id, with_result=True)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job یافت نشد")
+
+    if job["status"] != jobs.SUCCEEDED:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Job در وضعیت {job['status']} است"
+        )
+
+    return job["result"]
+
+
+@router.delete(
+    "/jobs/{job_id}",
+    response_model=JobOut
+)
+def cancel_job(
+    job_id: str,
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    لغو Job
+    """
+    logger.info(
+        "User [%s] cancelled job [%s]", user.username, job_id
+    )
+    job = jobs.cancel_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job یافت نشد")
+    return job
+
+
 @router.get("/me")
 def get_current_user_info(
     user: AuthenticatedUser = Depends(get_current_user)
@@ -12,8 +12,8 @@ Schemas ماژول HR
 - serializers.py (DRF)
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Annotated, Optional, List, Dict, Union
 
 
 # ======================================================
@@ -111,6 +111,81 @@ class UserFull(HRBaseSchema):
         }
 
 
+class UserDatesOut(HRBaseSchema):
+    """
+    کاربر با تاریخ‌های شمسی
+    استفاده در:
+        - فیلتر بازه قرارداد
+        - تولدهای ماه
+    """
+    NationalCode: str = Field(..., description="کد ملی")
+    FirstName: str = Field(..., description="نام")
+    LastName: str = Field(..., description="نام خانوادگی")
+    IsActive: Optional[bool] = None
+    BirthDate: Optional[str] = Field(None, description="تاریخ تولد (شمسی)")
+    ContractDate: Optional[str] = Field(
+        None,
+        description="تاریخ شروع همکاری (شمسی)"
+    )
+    ContractEndDate: Optional[str] = Field(
+        None,
+        description="تاریخ پایان قرارداد (شمسی)"
+    )
+
+
+class UserIn(HRBaseSchema):
+    """
+    ورودی ثبت کاربر جدید
+    استفاده در:
+        - Import گروهی کاربران (CSV)
+    """
+    NationalCode: str = Field(..., description="کد ملی")
+    UserName: str = Field(..., description="نام کاربری")
+    FirstName: str = Field(..., description="نام")
+    LastName: str = Field(..., description="نام خانوادگی")
+
+    FirstNameEnglish: Optional[str] = None
+    LastNameEnglish: Optional[str] = None
+    FatherName: Optional[str] = None
+
+    Gender: bool = Field(..., description="جنسیت")
+    BirthDate: Optional[str] = None
+    BirthDateMiladi: Optional[str] = None
+
+    ContractDate: Optional[str] = None
+    ContractDateMiladi: Optional[str] = None
+    ContractEndDate: Optional[str] = None
+    ContractEndDateMiladi: Optional[str] = None
+
+    IsActive: bool = True
+    About: Optional[str] = None
+
+    DegreeType: Optional[int] = None
+    MarriageStatus: Optional[int] = None
+    MilitaryStatus: Optional[int] = None
+    Religion: Optional[int] = None
+    ContractType: Optional[int] = None
+    UserStatus: Optional[int] = None
+
+    BirthCity: Optional[int] = None
+    IdentityCity: Optional[int] = None
+    LivingAddress: Optional[int] = None
+
+
+class UserProfileOut(HRBaseSchema):
+    """
+    پروفایل ترکیبی کاربر
+    استفاده در:
+        - صفحه پروفایل (به جای سه درخواست جداگانه)
+    """
+    user: UserFull = Field(..., description="اطلاعات کامل کاربر")
+    roles: List[int] = Field(..., description="RoleId های کاربر")
+    team_roles: List[Dict] = Field(
+        ...,
+        description="نقش‌های فعلی کاربر در تیم‌ها"
+    )
+
+
 # ======================================================
 # Team Schemas
 # ======================================================
@@ -186,6 +261,162 @@ class UserTeamRoleOut(HRBaseSchema):
     )
 
 
+class UserTeamRoleHistoryOut(UserTeamRoleOut):
+    """
+    نقش کاربر در تیم همراه با نام‌ها (از V_UserTeamRole)
+    استفاده در:
+        - تاریخچه نقش‌ها
+        - جستجوی زمانی (چه کسی در تاریخ D ...)
+    """
+    FirstName: Optional[str] = None
+    LastName: Optional[str] = None
+    TeamName: Optional[str] = None
+    RoleName: Optional[str] = None
+
+
+class UserTeamRoleIn(HRBaseSchema):
+    """
+    ورودی ثبت نقش کاربر در تیم
+    استفاده در:
+        - ثبت گروهی (Bulk)
+    """
+    NationalCode: str = Field(..., description="کد ملی")
+    TeamCode: str = Field(..., description="کد تیم")
+    RoleId: int = Field(..., description="کد سمت")
+    LevelId: Optional[int] = Field(None, description="سطح سمت")
+    Superior: bool = Field(False, description="آیا ارشد است؟")
+    StartDate: Optional[str] = Field(None, description="تاریخ شروع")
+    EndDate: Optional[str] = Field(None, description="تاریخ پایان")
+
+
+class UserTeamRoleEndIn(HRBaseSchema):
+    """
+    ورودی پایان دادن به نقش فعلی کاربر در تیم
+    """
+    NationalCode: str = Field(..., description="کد ملی")
+    TeamCode: str = Field(..., description="کد تیم")
+    RoleId: int = Field(..., description="کد سمت")
+    EndDate: str = Field(..., description="تاریخ پایان")
+
+
+# ======================================================
+# Bulk Write Schemas
+# ======================================================
+
+class BulkRowError(HRBaseSchema):
+    """
+    خطای یک رکورد در نوشتن گروهی
+    """
+    row_index: int = Field(..., description="شماره رکورد در ورودی (از صفر)")
+    error: str
+
+
+class BulkChunkReport(HRBaseSchema):
+    """
+    گزارش اجرای یک دسته (Chunk)
+    """
+    index: int
+    rows: int
+    success: bool
+    elapsed_sec: float
+    error: Optional[str] = None
+    row_errors: List[BulkRowError] = []
+
+
+class BulkWriteReport(HRBaseSchema):
+    """
+    گزارش نوشتن گروهی
+    """
+    total_rows: int
+    written_rows: int
+    failed_rows: int
+    committed: bool
+    elapsed_sec: float
+    rows_per_sec: float
+    chunks: List[BulkChunkReport]
+
+
+class ImportRowError(HRBaseSchema):
+    """
+    خطای یک ردیف فایل Import
+    """
+    line: int = Field(..., description="شماره خط در فایل CSV")
+    errors: List[str]
+
+
+class ImportReport(HRBaseSchema):
+    """
+    گزارش Import فایل CSV
+    """
+    kind: str
+    total_rows: int
+    valid_rows: int
+    invalid_rows: int
+    written_rows: int
+    failed_rows: int
+    committed: bool
+    elapsed_sec: float
+    rows_per_sec: float
+    errors: List[ImportRowError]
+    errors_truncated: bool
+    chunks: List[BulkChunkReport]
+
+
+# ======================================================
+# Job Schemas
+# ======================================================
+
+class JobOut(HRBaseSchema):
+    """
+    وضعیت یک Job پس‌زمینه
+    """
+    id: str = Field(..., description="شناسه Job")
+    kind: str = Field(..., description="نوع Job")
+    params: Dict = Field(..., description="پارامترهای Job")
+    status: str = Field(
+        ...,
+        description="pending | running | succeeded | failed | "
+                    "cancelling | cancelled"
+    )
+    submitted_by: Optional[str] = None
+    submitted_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    error: Optional[str] = None
+
+
+# ======================================================
+# Delta Sync (/changes)
+# ======================================================
+
+class TableChangesOut(HRBaseSchema):
+    """
+    تغییرات یک جدول بعد از token
+    """
+    inserted: List[Dict] = Field(default_factory=list, description="ردیف‌های جدید")
+    updated: List[Dict] = Field(default_factory=list, description="ردیف‌های تغییرکرده")
+    deleted: List[Dict] = Field(
+        default_factory=list,
+        description="کلید ردیف‌های حذف‌شده"
+    )
+
+
+class ChangesOut(HRBaseSchema):
+    """
+    پاسخ /changes
+    """
+    token: str = Field(..., description="token برای درخواست بعدی (since)")
+    resync: bool = Field(
+        False,
+        description="True → داده را کامل دوباره بخوانید، سپس با token ادامه دهید"
+    )
+    reason: Optional[str] = Field(
+        None,
+        description="دلیل resync: no_token | token_expired | too_many_changes"
+    )
+    tables: Dict[str, TableChangesOut] = Field(default_factory=dict)
+
+
 # ======================================================
 # View Schemas (V_*)
 # ======================================================
@@ -213,6 +444,80 @@ class ViewRoleTargetOut(HRBaseSchema):
     RequestType: int
 
 
+class RangeFilter(HRBaseSchema):
+    """
+    فیلتر بازه (هر دو سر شامل)
+
+    مثال:
+        {"gte": 2, "lte": 4}
+    """
+    gte: Optional[int] = Field(None, description="بزرگ‌تر یا مساوی")
+    lte: Optional[int] = Field(None, description="کوچک‌تر یا مساوی")
+
+    class Config:
+        extra = "forbid"
+
+    @model_validator(mode="after")
+    def check_bounds(self):
+        if self.gte is None and self.lte is None:
+            raise ValueError("gte یا lte لازم است")
+        return self
+
+
+"""
+مقدار هر ستون فیلتر:
+    12              → ستون = 12
+    [1, 2, 3]       → ستون IN (...)  (حداکثر 256 مقدار)
+    {"gte": 2}      → بازه
+
+ستون‌های bit (Superior, Education, ...) فقط true/false (مساوی)
+"""
+FilterValue = Union[
+    int,
+    Annotated[List[int], Field(min_length=1, max_length=256)],
+    RangeFilter,
+]
+
+
+class RoleTargetFilter(HRBaseSchema):
+    """
+    فیلتر View:
+        V_HR_RoleTarget
+
+    فقط همین ستون‌ها مجاز هستند (کلید ناشناخته → 422)
+    """
+    RoleID: Optional[FilterValue] = None
+    RoleTargetID: Optional[FilterValue] = None
+    LevelID: Optional[FilterValue] = None
+    LevelIdTargetID: Optional[FilterValue] = None
+    RequestType: Optional[FilterValue] = None
+
+    Superior: Optional[bool] = None
+    SuperiorTarget: Optional[bool] = None
+
+    Education: Optional[bool] = None
+    Evaluation: Optional[bool] = None
+    PmChange: Optional[bool] = None
+    ITChange: Optional[bool] = None
+
+    class Config:
+        extra = "forbid"
+        schema_extra = {
+            "example": {
+                "RoleID": 12,
+                "RequestType": [1, 2],
+                "LevelID": {"gte": 2},
+                "Superior": True
+            }
+        }
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def empty_to_none(cls, value):
+        # سازگاری با Client های قبلی: "" یعنی بدون فیلتر
+        return None if value == "" else value
+
+
 # ======================================================
 # Generic Response Schemas
 # ======================================================
@@ -15,10 +15,27 @@ Service Layer ماژول HR
 - بخشی از api.py
 """
 
-from typing import List, Dict, Optional
-
+import asyncio
+import csv
+import io
+import json
+import zlib
+from datetime import date
+from typing import List, Dict, Optional, Iterator, Tuple
+
+from app.core.cache import cached
+from app.core.concurrency import run_in_bulkhead
+from app.core.config import settings
+from app.core.events import register_change_source
 from app.core.logging import get_logger
+from app.core.warmup import register_warmup_task
 from app.modules.hr import repository
+from app.shared.intervals import IntervalTree
+from app.shared.utils import (
+    SortedIndex,
+    gregorian_to_jalali,
+    parse_jalali_column
+)
 
 logger = get_logger(__name__)
 
@@ -27,11 +44,12 @@ logger = get_logger(__name__)
 # Users
 # ======================================================
 
+@cached("hr.users_minimal", tables=("Users",))
 def get_all_users_minimal() -> List[Dict]:
     """
-    دریافت اطلاعات حداقلی همه کاربران
+    دریافت اطلاعات حداقلی همه کاربران (فهرست کاربران)
 
-    این متد فقط نقش هماهنگ‌کننده دارد
+    خروجی Cache می‌شود (CACHE_TTL_SEC)
     """
     logger.info("Fetching minimal users list")
     return repository.get_all_users_minimal()
@@ -47,12 +65,12 @@ def get_user_by_national_code(national_code: str) -> Optional[Dict]:
     - محاسبات اضافی
     انجام داد
     """
-    logger.info(f"Fetching user by national code: {national_code}")
+    logger.info("Fetching user by national code: %s", national_code)
 
     user = repository.get_user_by_national_code(national_code)
 
     if not user:
-        logger.warning(f"User not found: {national_code}")
+        logger.warning("User not found: %s", national_code)
         return None
 
     return user
@@ -62,17 +80,135 @@ def get_user_by_username(username: str) -> Optional[Dict]:
     """
     دریافت اطلاعات کاربر بر اساس نام کاربری
     """
-    logger.info(f"Fetching user by username: {username}")
+    logger.info("Fetching user by username: %s", username)
     return repository.get_user_by_username(username)
 
 
+async def get_user_profile(national_code: str) -> Optional[Dict]:
+    """
+    دریافت پروفایل ترکیبی کاربر در یک درخواست
+
+    شامل:
+    - اطلاعات کامل کاربر
+    - RoleId های کاربر
+    - نقش‌های فعلی کاربر در تیم‌ها
+
+    سه Query به‌صورت همزمان (هر کدام روی Connection جدا) اجرا می‌شوند،
+    بنابراین زمان پاسخ تقریباً برابر کندترین Query است نه مجموع آن‌ها.
+    """
+    logger.info("Fetching profile for user %s", national_code)
+
+    user, roles, team_roles = await asyncio.gather(
+        run_in_bulkhead(
+            "directory", repository.get_user_by_national_code, national_code
+        ),
+        run_in_bulkhead(
+            "directory",
+            repository.get_user_roles_by_national_code,
+            national_code
+        ),
+        run_in_bulkhead(
+            "directory", repository.get_user_team_roles, national_code
+        ),
+    )
+
+    if not user:
+        logger.warning("User not found: %s", national_code)
+        return None
+
+    return {
+        "user": user,
+        "roles": roles,
+        "team_roles": team_roles,
+    }
+
+
+# ======================================================
+# User Dates (فیلتر بازه‌ای تاریخ)
+# ======================================================
+"""
+تاریخ‌های شمسی یک بار (در بارگذاری Cache) به میلادی تبدیل و
+در ایندکس مرتب نگه داشته می‌شوند؛ هر فیلتر بازه‌ای فقط یک bisect است.
+
+اگر تاریخ شمسی خالی/نامعتبر باشد از نسخه *Miladi استفاده می‌شود.
+"""
+
+CONTRACT_DATE_FIELDS = {
+    "start": ("ContractDate", "ContractDateMiladi"),
+    "end": ("ContractEndDate", "ContractEndDateMiladi"),
+}
+
+
+@cached("hr.user_dates", tables=("Users",))
+def get_user_date_index() -> Dict[str, SortedIndex]:
+    """
+    ایندکس تاریخ‌های کاربران
+
+    contract_start / contract_end → کلید: date میلادی
+    birthday                      → کلید: (ماه شمسی، روز شمسی)
+
+    خروجی Cache می‌شود (CACHE_TTL_SEC)
+    """
+    logger.info("Building user date index")
+    rows = repository.get_user_dates()
+
+    index = {}
+    for field, (jalali, miladi) in CONTRACT_DATE_FIELDS.items():
+        dates = parse_jalali_column(
+            (row[jalali] for row in rows),
+            fallback=[row[miladi] for row in rows]
+        )
+        index[f"contract_{field}"] = SortedIndex(zip(dates, rows))
+
+    births = parse_jalali_column(
+        (row["BirthDate"] for row in rows),
+        fallback=[row["BirthDateMiladi"] for row in rows]
+    )
+    index["birthday"] = SortedIndex(
+        (gregorian_to_jalali(birth)[1:] if birth else None, row)
+        for birth, row in zip(births, rows)
+    )
+    return index
+
+
+def get_users_by_contract_date(
+    field: str,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    active_only: bool = True
+) -> List[Dict]:
+    """
+    کاربرانی که تاریخ شروع (start) یا پایان (end) قراردادشان
+    در بازه [date_from, date_to] است (به ترتیب تاریخ)
+    """
+    users = get_user_date_index()[f"contract_{field}"].between(
+        date_from, date_to
+    )
+    if active_only:
+        users = [user for user in users if user["IsActive"]]
+    return users
+
+
+def get_birthdays(month: int, active_only: bool = True) -> List[Dict]:
+    """
+    کاربرانی که تولدشان در ماه شمسی month است (به ترتیب روز)
+    """
+    users = get_user_date_index()["birthday"].between((month, 1), (month, 31))
+    if active_only:
+        users = [user for user in users if user["IsActive"]]
+    return users
+
+
 # ======================================================
 # Teams
 # ======================================================
 
+@cached("hr.teams")
 def get_all_teams() -> List[Dict]:
     """
     دریافت همه تیم‌ها
+
+    خروجی Cache می‌شود (CACHE_TTL_SEC)
     """
     logger.info("Fetching all teams")
     return repository.get_all_teams()
@@ -98,9 +234,12 @@ def get_active_evaluation_teams() -> List[Dict]:
 # Roles
 # ======================================================
 
+@cached("hr.roles")
 def get_all_roles() -> List[Dict]:
     """
     دریافت همه سمت‌ها
+
+    خروجی Cache می‌شود (CACHE_TTL_SEC)
     """
     logger.info("Fetching all roles")
     return repository.get_all_roles()
@@ -110,7 +249,7 @@ def get_user_roles_by_national_code(national_code: str) -> List[int]:
     """
     دریافت RoleId های یک کاربر
     """
-    logger.info(f"Fetching roles for user {national_code}")
+    logger.info("Fetching roles for user %s", national_code)
     return repository.get_user_roles_by_national_code(national_code)
 
 
@@ -122,7 +261,7 @@ def get_user_team_roles(national_code: str) -> List[Dict]:
     """
     دریافت نقش‌های فعلی کاربر در تیم‌ها
     """
-    logger.info(f"Fetching team roles for user {national_code}")
+    logger.info("Fetching team roles for user %s", national_code)
     return repository.get_user_team_roles(national_code)
 
 
@@ -134,6 +273,166 @@ def get_all_user_team_roles() -> List[Dict]:
     return repository.get_all_user_team_roles()
 
 
+# ======================================================
+# تاریخچه نقش‌ها (جستجوی زمانی)
+# ======================================================
+"""
+بازه [StartDate, EndDate] هر ردیف V_UserTeamRole در درخت بازه نگه داشته
+می‌شود (هر دو سر شامل؛ EndDate خالی یعنی هنوز فعال است).
+
+سه گروه‌بندی:
+    team_role → (TeamCode, RoleId)
+    team      → TeamCode
+    user      → NationalCode
+
+جستجوی «چه کسی در تاریخ D ...» → O(log n + k) به‌جای پیمایش View
+"""
+
+
+@cached(
+    "hr.team_role_history",
+    tables=("UserTeamRole", "Users", "Team", "Role")
+)
+def get_team_role_index() -> Dict[str, Dict[object, IntervalTree]]:
+    """
+    ساخت درخت‌های بازه از V_UserTeamRole
+
+    خروجی Cache می‌شود (CACHE_TTL_SEC)؛
+    نوشتن در جدول‌های View (UserTeamRole، Users، Team، Role) آن را باطل می‌کند.
+
+    ردیفی که تاریخ شروع یا پایانش قابل Parse نیست کنار گذاشته می‌شود
+    (وگرنه یک سابقه بسته‌شده همیشه فعال دیده می‌شد).
+    """
+    logger.info("Building team role history index")
+    rows = repository.get_all_user_team_roles()
+
+    starts = parse_jalali_column(row["StartDate"] for row in rows)
+    ends = parse_jalali_column(row["EndDate"] for row in rows)
+
+    groups: Dict[str, Dict[object, List[Tuple]]] = {
+        "team_role": {},
+        "team": {},
+        "user": {},
+    }
+    invalid = 0
+
+    for row, start, end in zip(rows, starts, ends):
+        if (start is None and row["StartDate"]) or (
+            end is None and row["EndDate"]
+        ):
+            invalid += 1
+            continue
+        interval = (start or date.min, end or date.max, (start, row))
+
+        groups["team_role"].setdefault(
+            (row["TeamCode"], row["RoleId"]), []
+        ).append(interval)
+        groups["team"].setdefault(row["TeamCode"], []).append(interval)
+        groups["user"].setdefault(row["NationalCode"], []).append(interval)
+
+    if invalid:
+        logger.warning(
+            "Team role history: %s rows with invalid dates skipped",
+            invalid
+        )
+
+    return {
+        name: {key: IntervalTree(items) for key, items in group.items()}
+        for name, group in groups.items()
+    }
+
+
+def _sorted_rows(items: List[Tuple]) -> List[Dict]:
+    # (start, row) → ردیف‌ها به ترتیب تاریخ شروع
+    items.sort(key=lambda item: item[0] or date.min)
+    return [row for _, row in items]
+
+
+def get_role_holders(team_code: str, role_id: int, on: date) -> List[Dict]:
+    """
+    چه کسانی در تاریخ on سمت role_id را در تیم team_code داشته‌اند
+    """
+    tree = get_team_role_index()["team_role"].get((team_code, role_id))
+    return _sorted_rows(tree.stab(on)) if tree else []
+
+
+def get_team_roster(team_code: str, on: date) -> List[Dict]:
+    """
+    همه نقش‌های فعال تیم team_code در تاریخ on
+    """
+    tree = get_team_role_index()["team"].get(team_code)
+    return _sorted_rows(tree.stab(on)) if tree else []
+
+
+def get_user_role_history(
+    national_code: str,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None
+) -> List[Dict]:
+    """
+    نقش‌های کاربر که با بازه [date_from, date_to] هم‌پوشانی دارند
+    (بدون بازه → کل تاریخچه)
+    """
+    tree = get_team_role_index()["user"].get(national_code)
+    if tree is None:
+        return []
+    return _sorted_rows(
+        tree.overlap(date_from or date.min, date_to or date.max)
+    )
+
+
+def bulk_insert_user_team_roles(
+    rows: List[Dict],
+    atomic: bool = True
+) -> Dict:
+    """
+    ثبت گروهی نقش کاربران در تیم‌ها
+    """
+    logger.info("Bulk inserting %s user team roles", len(rows))
+
+    report = repository.bulk_insert_user_team_roles(
+        rows,
+        chunk_size=settings.BULK_CHUNK_SIZE,
+        atomic=atomic
+    )
+    _log_bulk_report("UserTeamRole insert", report)
+    return report
+
+
+def bulk_end_user_team_roles(
+    rows: List[Dict],
+    atomic: bool = True
+) -> Dict:
+    """
+    پایان دادن گروهی به نقش‌های فعلی کاربران
+    """
+    logger.info("Bulk ending %s user team roles", len(rows))
+
+    report = repository.bulk_end_user_team_roles(
+        rows,
+        chunk_size=settings.BULK_CHUNK_SIZE,
+        atomic=atomic
+    )
+    _log_bulk_report("UserTeamRole end", report)
+    return report
+
+
+def _log_bulk_report(operation: str, report: Dict):
+    """
+    ثبت خلاصه گزارش نوشتن گروهی در لاگ
+    """
+    logger.info(
+        "%s: written=%s, failed=%s, committed=%s, elapsed=%ss, "
+        "rate=%s rows/s",
+        operation,
+        report["written_rows"],
+        report["failed_rows"],
+        report["committed"],
+        report["elapsed_sec"],
+        report["rows_per_sec"]
+    )
+
+
 # ======================================================
 # Views (V_*)
 # ======================================================
@@ -143,25 +442,263 @@ def get_view_role_target(filters: Dict) -> List[Dict]:
     دریافت داده‌های View:
         V_HR_RoleTarget
 
-    اینجا می‌توان:
-    - اعتبارسنجی فیلترها
-    - حذف فیلترهای غیرمجاز
-    را انجام داد
+    filters از قبل با RoleTargetFilter اعتبارسنجی شده است
+    (فقط ستون‌ها و عملگرهای مجاز)
     """
-    logger.info(f"Fetching V_HR_RoleTarget with filters: {filters}")
+    logger.info("Fetching V_HR_RoleTarget with filters: %s", filters)
     return repository.get_view_role_target(filters)
 
 
+@cached("hr.role_targets")
+def get_all_role_targets() -> List[Dict]:
+    """
+    دریافت همه رکوردهای View:
+        V_HR_RoleTarget
+
+    خروجی Cache می‌شود (CACHE_TTL_SEC)
+    """
+    logger.info("Fetching all V_HR_RoleTarget rows")
+    return repository.get_view_role_target({})
+
+
 def get_view_role_team(role_ids: List[int], team_code: str) -> List[int]:
     """
     بررسی نقش‌های موجود در یک تیم
     """
     logger.info(
-        f"Fetching V_RoleTeam for team={team_code}, roles={role_ids}"
+        "Fetching V_RoleTeam for team=%s, roles=%s", team_code, role_ids
     )
     return repository.get_view_role_team(role_ids, team_code)
 
 
+# ======================================================
+# Export (CSV / NDJSON)
+# ======================================================
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _csv_chunks(chunks: Iterator[List[Dict]]) -> Iterator[str]:
+    """
+    تبدیل تکه‌های رکورد به متن CSV
+
+    ردیف اول سرستون‌هاست (از کلیدهای اولین رکورد)
+    """
+    writer = None
+    buffer = io.StringIO()
+
+    for rows in chunks:
+        if not rows:
+            continue
+
+        if writer is None:
+            # BOM برای نمایش درست متن فارسی در Excel
+            buffer.write("\ufeff")
+            writer = csv.writer(buffer)
+            writer.writerow(rows[0].keys())
+
+        writer.writerows(row.values() for row in rows)
+
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+
+def _ndjson_chunks(chunks: Iterator[List[Dict]]) -> Iterator[str]:
+    """
+    تبدیل تکه‌های رکورد به NDJSON (هر رکورد یک خط JSON)
+    """
+    for rows in chunks:
+        if not rows:
+            continue
+
+        yield "".join(
+            json.dumps(dict(row), ensure_ascii=False, default=str) + "\n"
+            for row in rows
+        )
+
+
+def _gzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """
+    فشرده‌سازی gzip به‌صورت لحظه‌ای (بدون نگه‌داشتن کل فایل در حافظه)
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+
+    yield compressor.flush()
+
+
+def export_view(
+    name: str,
+    fmt: str = "csv",
+    compress: bool = False,
+    after: Optional[str] = None,
+    until: Optional[str] = None
+) -> Iterator[bytes]:
+    """
+    Export یک View به‌صورت Stream
+
+    - داده‌ها تکه‌تکه از دیتابیس خوانده می‌شوند
+      (حافظه مصرفی به اندازه یک Chunk است، نه کل View)
+    - رکوردها بر اساس key مرتب هستند؛ برای ادامه Export قطع‌شده
+      کافی است آخرین key دریافتی به‌عنوان after ارسال شود
+
+    خروجی:
+        Generator از bytes (آماده برای StreamingResponse)
+    """
+    logger.info(
+        "Exporting view %s (format=%s, gzip=%s, after=%s, until=%s)",
+        name, fmt, compress, after, until
+    )
+
+    chunks = repository.stream_export_view(
+        name,
+        after=after,
+        until=until,
+        chunk_size=settings.EXPORT_CHUNK_SIZE
+    )
+
+    if fmt == "csv":
+        text_chunks = _csv_chunks(chunks)
+    else:
+        text_chunks = _ndjson_chunks(chunks)
+
+    body = (chunk.encode("utf-8") for chunk in text_chunks)
+
+    if compress:
+        return _gzip_chunks(body)
+
+    return body
+
+
+# ======================================================
+# Delta Sync (Change Tracking)
+# ======================================================
+
+class ChangeTrackingUnavailable(Exception):
+    """
+    Change Tracking روی دیتابیس (یا یکی از جدول‌ها) فعال نیست
+    """
+
+
+_TOKEN_PREFIX = "ct."
+
+
+def _format_change_token(version: int) -> str:
+    return f"{_TOKEN_PREFIX}{version}"
+
+
+def _parse_change_token(token: str) -> int:
+    """
+    token → نسخه Change Tracking (نامعتبر → ValueError)
+    """
+    if not token.startswith(_TOKEN_PREFIX):
+        raise ValueError("token نامعتبر است")
+    version = token[len(_TOKEN_PREFIX):]
+    if not version.isdigit():
+        raise ValueError("token نامعتبر است")
+    return int(version)
+
+
+def get_changes(
+    since: Optional[str],
+    tables: Optional[List[str]] = None
+) -> Dict:
+    """
+    ردیف‌های جدید، تغییرکرده و حذف‌شده بعد از token (SQL Server Change Tracking)
+
+    روند Client:
+        1. بدون since → resync + token
+        2. خواندن کامل داده (مثلاً /export)، سپس ادامه با since = token
+        3. هر بار token جدید پاسخ برای درخواست بعدی ذخیره شود
+
+    resync (بدون ردیف، با token فعلی):
+        no_token          → since ارسال نشده
+        token_expired     → تغییرات قدیمی‌تر از token پاک شده‌اند
+                            (CHANGE_RETENTION دیتابیس)
+        too_many_changes  → بیش از CHANGES_MAX_ROWS ردیف در یک جدول
+
+    نکته:
+        نسخه فعلی قبل از خواندن تغییرات گرفته می‌شود؛ ردیفی که همزمان
+        تغییر کند ممکن است در پاسخ بعدی دوباره بیاید
+        (Client باید ردیف‌ها را Upsert کند).
+    """
+    names = tables or list(repository.CHANGE_TRACKING_TABLES)
+
+    if not repository.change_tracking_supported():
+        raise ChangeTrackingUnavailable(
+            "Change Tracking فقط روی SQL Server پشتیبانی می‌شود"
+        )
+
+    since_version = _parse_change_token(since) if since else None
+
+    versions = repository.get_change_tracking_versions(names)
+    disabled = [
+        name for name, version in versions["min_valid"].items()
+        if version is None
+    ]
+    if versions["current"] is None or disabled:
+        raise ChangeTrackingUnavailable(
+            "Change Tracking برای این جدول‌ها فعال نیست: "
+            + ", ".join(disabled or names)
+        )
+
+    token = _format_change_token(versions["current"])
+
+    def resync(reason: str) -> Dict:
+        logger.info("Delta sync: resync (%s, since=%s)", reason, since)
+        return {"token": token, "resync": True, "reason": reason, "tables": {}}
+
+    if since_version is None:
+        return resync("no_token")
+    if since_version > versions["current"] or any(
+        since_version < version for version in versions["min_valid"].values()
+    ):
+        return resync("token_expired")
+
+    result: Dict[str, Dict] = {}
+    limit = settings.CHANGES_MAX_ROWS
+    for name in names:
+        rows = repository.get_table_changes(name, since_version, limit + 1)
+        if len(rows) > limit:
+            return resync("too_many_changes")
+
+        keys = repository.CHANGE_TRACKING_TABLES[name]["key"]
+        changes = {"inserted": [], "updated": [], "deleted": []}
+        for row in rows:
+            # RowMapping تغییرناپذیر است → کپی dict
+            row = dict(row)
+            operation = row.pop("ChangeOperation")
+            row.pop("ChangeVersion")
+            key = {col: row.pop(f"Key_{col}") for col in keys}
+
+            if operation == "D" or row.get(keys[0]) is None:
+                # حذف‌شده (یا همزمان با خواندن حذف شده)
+                changes["deleted"].append(key)
+            elif operation == "I":
+                changes["inserted"].append(row)
+            else:
+                changes["updated"].append(row)
+        result[name] = changes
+
+    logger.info(
+        "Delta sync since %s: %s",
+        since_version,
+        ", ".join(
+            f"{name}={sum(len(v) for v in changes.values())}"
+            for name, changes in result.items()
+        )
+    )
+    return {"token": token, "resync": False, "reason": None, "tables": result}
+
+
 # ======================================================
 # Stored Procedures
 # ======================================================
@@ -172,7 +709,8 @@ def sp_get_target_role(info_id: int, request_type: int):
         HR_GetTargetRole
     """
     logger.info(
-        f"Calling SP HR_GetTargetRole (info_id={info_id}, type={request_type})"
+        "Calling SP HR_GetTargetRole (info_id=%s, type=%s)",
+        info_id, request_type
     )
     return repository.sp_get_target_role(info_id, request_type)
 
@@ -191,8 +729,8 @@ def sp_get_assessors_educators(
         HR_GetAssessorsAndEducators
     """
     logger.info(
-        "Calling SP HR_GetAssessorsAndEducators "
-        f"(team={team_code}, role={role_id_target})"
+        "Calling SP HR_GetAssessorsAndEducators (team=%s, role=%s)",
+        team_code, role_id_target
     )
 
     return repository.sp_get_assessors_educators(
@@ -206,12 +744,100 @@ def sp_get_assessors_educators(
     )
 
 
+def sp_get_assessors_educators_all(
+    team_code: str,
+    info_id: int,
+    role_id_target: int,
+    level_id_target: int,
+    superior_target: int,
+    temporary: int,
+    type_: int
+) -> Dict[str, List[Dict]]:
+    """
+    اجرای Stored Procedure:
+        HR_GetAssessorsAndEducators
+
+    با همه Result Set ها (ارزیاب‌ها + آموزش‌دهنده‌ها) در یک فراخوانی
+    """
+    logger.info(
+        "Calling SP HR_GetAssessorsAndEducators (all result sets) "
+        "(team=%s, role=%s)",
+        team_code, role_id_target
+    )
+
+    return repository.sp_get_assessors_educators_all(
+        team_code=team_code,
+        info_id=info_id,
+        role_id_target=role_id_target,
+        level_id_target=level_id_target,
+        superior_target=superior_target,
+        temporary=temporary,
+        type_=type_
+    )
+
+
 def sp_get_team_manager(role_id: int, team_code: str):
     """
     اجرای Stored Procedure:
         HR_GetTeamManager
     """
     logger.info(
-        f"Calling SP HR_GetTeamManager (role={role_id}, team={team_code})"
+        "Calling SP HR_GetTeamManager (role=%s, team=%s)", role_id, team_code
     )
     return repository.sp_get_team_manager(role_id, team_code)
+
+
+# ======================================================
+# Warm-up
+# ======================================================
+"""
+Cache های پراستفاده بعد از Startup به‌صورت همزمان بارگذاری می‌شوند
+(app.core.warmup)
+"""
+
+register_warmup_task("hr.roles", get_all_roles)
+register_warmup_task("hr.teams", get_all_teams)
+register_warmup_task("hr.users_minimal", get_all_users_minimal)
+register_warmup_task("hr.user_dates", get_user_date_index)
+register_warmup_task("hr.role_targets", get_all_role_targets)
+
+
+# ======================================================
+# تشخیص تغییر (رویدادهای /events)
+# ======================================================
+"""
+topic های قابل Subscribe در /api/hr/events (app.core.events)
+fields → ستون‌هایی که در رویداد فرستاده می‌شوند (نه همه اطلاعات شخصی)
+"""
+
+register_change_source(
+    "users",
+    repository.get_all_user_rows,
+    key=("NationalCode",),
+    fields=("NationalCode", "UserName", "FirstName", "LastName", "IsActive"),
+    tables=("Users",)
+)
+register_change_source(
+    "teams",
+    repository.get_all_team_rows,
+    key=("TeamCode",),
+    fields=("TeamCode", "TeamName", "ActiveInService", "ActiveInEvaluation"),
+    tables=("Team",)
+)
+register_change_source(
+    "roles",
+    repository.get_all_role_rows,
+    key=("RoleId",),
+    fields=("RoleId", "RoleName", "HasLevel", "HasSuperior"),
+    tables=("Role",)
+)
+register_change_source(
+    "user-team-roles",
+    repository.get_all_team_role_rows,
+    key=("id",),
+    fields=(
+        "id", "NationalCode", "TeamCode", "RoleId", "LevelId",
+        "Superior", "StartDate", "EndDate"
+    ),
+    tables=("UserTeamRole",)
+)
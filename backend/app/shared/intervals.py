@@ -0,0 +1,157 @@
+# backend/app/shared/intervals.py
+
+"""
+درخت بازه (Centered Interval Tree) فقط‌خواندنی
+
+مسئولیت این فایل:
+- پیدا کردن بازه‌هایی که یک نقطه را شامل می‌شوند (stab)
+- پیدا کردن بازه‌هایی که با یک بازه هم‌پوشانی دارند (overlap)
+
+هزینه:
+    ساخت  → O(n log n)
+    جستجو → O(log n + k)   (k = تعداد نتیجه)
+
+هر بازه [start, end] بسته است (هر دو سر شامل).
+کلیدها باید قابل مقایسه باشند (مثلاً date)؛
+بازه باز را با مقدار حدی (مثل date.max) نشان دهید.
+
+مثال:
+    tree = IntervalTree(
+        (row["start"], row["end"], row) for row in rows
+    )
+    tree.stab(date(2024, 1, 1))
+    tree.overlap(date(2023, 1, 1), date(2023, 12, 31))
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, List, Optional, Tuple
+
+Interval = Tuple[Any, Any, Any]     # (start, end, item)
+
+
+class _Node:
+    """
+    یک گره: بازه‌هایی که center را شامل می‌شوند
+
+    starts / by_start → مرتب بر اساس start (صعودی)
+    ends / by_end     → مرتب بر اساس end (صعودی)
+    """
+
+    __slots__ = (
+        "center", "starts", "by_start", "ends", "by_end", "left", "right"
+    )
+
+    def __init__(self, center, intervals: List[Interval]):
+        self.center = center
+
+        ordered = sorted(intervals, key=lambda interval: interval[0])
+        self.starts = [interval[0] for interval in ordered]
+        self.by_start = [interval[2] for interval in ordered]
+
+        ordered = sorted(intervals, key=lambda interval: interval[1])
+        self.ends = [interval[1] for interval in ordered]
+        self.by_end = [interval[2] for interval in ordered]
+
+        self.left: Optional[_Node] = None
+        self.right: Optional[_Node] = None
+
+
+def _build(intervals: List[Interval]) -> Optional[_Node]:
+    if not intervals:
+        return None
+
+    # میانه نقاط ابتدا و انتها → درخت متوازن
+    points = sorted(
+        [interval[0] for interval in intervals]
+        + [interval[1] for interval in intervals]
+    )
+    center = points[len(points) // 2]
+
+    left, here, right = [], [], []
+    for interval in intervals:
+        if interval[1] < center:
+            left.append(interval)
+        elif interval[0] > center:
+            right.append(interval)
+        else:
+            here.append(interval)
+
+    node = _Node(center, here)
+    node.left = _build(left)
+    node.right = _build(right)
+    return node
+
+
+class IntervalTree:
+    """
+    درخت بازه فقط‌خواندنی (بعد از ساخت تغییر نمی‌کند)
+
+    نتیجه‌ها به ترتیب خاصی نیستند؛
+    اگر ترتیب لازم است، خروجی را مرتب کنید.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, intervals: Iterable[Interval]):
+        intervals = [
+            interval for interval in intervals
+            if interval[0] <= interval[1]
+        ]
+        self._size = len(intervals)
+        self._root = _build(intervals)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def stab(self, point) -> List[Any]:
+        """
+        آیتم‌هایی که start ≤ point ≤ end
+        """
+        result: List[Any] = []
+        node = self._root
+
+        while node is not None:
+            if point < node.center:
+                # همه بازه‌های گره end ≥ center > point دارند
+                result.extend(
+                    node.by_start[:bisect_right(node.starts, point)]
+                )
+                node = node.left
+            elif point > node.center:
+                # همه بازه‌های گره start ≤ center < point دارند
+                result.extend(node.by_end[bisect_left(node.ends, point):])
+                node = node.right
+            else:
+                result.extend(node.by_start)
+                break
+
+        return result
+
+    def overlap(self, low, high) -> List[Any]:
+        """
+        آیتم‌هایی که با [low, high] هم‌پوشانی دارند
+        (start ≤ high و end ≥ low)
+        """
+        result: List[Any] = []
+        stack = [self._root]
+
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+
+            if high < node.center:
+                result.extend(
+                    node.by_start[:bisect_right(node.starts, high)]
+                )
+                stack.append(node.left)
+            elif low > node.center:
+                result.extend(node.by_end[bisect_left(node.ends, low):])
+                stack.append(node.right)
+            else:
+                # center داخل [low, high] است → همه بازه‌های گره
+                result.extend(node.by_start)
+                stack.append(node.left)
+                stack.append(node.right)
+
+        return result
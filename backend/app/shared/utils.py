@@ -0,0 +1,287 @@
+# backend/app/shared/utils.py
+
+"""
+ابزارهای مشترک (بدون وابستگی به دیتابیس یا FastAPI)
+
+مسئولیت این فایل:
+- تبدیل تاریخ شمسی (جلالی) ↔ میلادی
+- Parse رشته‌های تاریخ (شمسی و میلادی، با ارقام فارسی/عربی)
+- تبدیل یک ستون کامل (لیست رشته‌ها) در یک فراخوانی
+- ایندکس مرتب برای جستجوی بازه‌ای (bisect)
+
+نکته:
+    تاریخ‌ها در دیتابیس به‌صورت رشته شمسی (مثل "1402/01/15") و
+    نسخه میلادی (*Miladi) ذخیره شده‌اند؛ بیشتر رشته‌ها تکراری هستند،
+    بنابراین Parse ها Memoize می‌شوند.
+
+الگوریتم تقویم:
+    همان الگوریتم jalaali-js (نقاط شکست چرخه‌های کبیسه)،
+    معتبر برای سال‌های شمسی -61 تا 3177
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple
+
+# ======================================================
+# تقویم جلالی
+# ======================================================
+_BREAKS = (
+    -61, 9, 38, 199, 426, 686, 756, 818, 1111, 1181, 1210,
+    1635, 2060, 2097, 2192, 2262, 2324, 2394, 2456, 3178
+)
+
+
+def _div(a: int, b: int) -> int:
+    # تقسیم با گرد کردن به سمت صفر (مثل JavaScript)
+    return int(a / b)
+
+
+def _mod(a: int, b: int) -> int:
+    return a - _div(a, b) * b
+
+
+@lru_cache(maxsize=4096)
+def _jal_cal(jy: int) -> Tuple[int, int, int]:
+    """
+    اطلاعات یک سال شمسی
+
+    خروجی: (leap, gy, march)
+        leap  → 0 یعنی سال کبیسه است
+        gy    → سال میلادی شروع سال شمسی
+        march → روز مارس (میلادی) که 1 فروردین در آن است
+    """
+    if jy < _BREAKS[0] or jy >= _BREAKS[-1]:
+        raise ValueError(f"Invalid Jalali year {jy}")
+
+    gy = jy + 621
+    leap_j = -14
+    jp = _BREAKS[0]
+    jump = 0
+
+    for jm in _BREAKS[1:]:
+        jump = jm - jp
+        if jy < jm:
+            break
+        leap_j += _div(jump, 33) * 8 + _div(_mod(jump, 33), 4)
+        jp = jm
+
+    n = jy - jp
+    leap_j += _div(n, 33) * 8 + _div(_mod(n, 33) + 3, 4)
+    if _mod(jump, 33) == 4 and jump - n == 4:
+        leap_j += 1
+
+    leap_g = _div(gy, 4) - _div((_div(gy, 100) + 1) * 3, 4) - 150
+    march = 20 + leap_j - leap_g
+
+    if jump - n < 6:
+        n = n - jump + _div(jump + 4, 33) * 33
+    leap = _mod(_mod(n + 1, 33) - 1, 4)
+    if leap == -1:
+        leap = 4
+
+    return leap, gy, march
+
+
+def is_jalali_leap(jy: int) -> bool:
+    return _jal_cal(jy)[0] == 0
+
+
+def jalali_month_length(jy: int, jm: int) -> int:
+    if jm <= 6:
+        return 31
+    if jm <= 11:
+        return 30
+    return 30 if is_jalali_leap(jy) else 29
+
+
+@lru_cache(maxsize=65536)
+def jalali_to_gregorian(jy: int, jm: int, jd: int) -> date:
+    """
+    تبدیل تاریخ شمسی به میلادی
+
+    مثال:
+        jalali_to_gregorian(1402, 1, 1) → date(2023, 3, 21)
+    """
+    if not 1 <= jm <= 12 or not 1 <= jd <= jalali_month_length(jy, jm):
+        raise ValueError(f"Invalid Jalali date {jy}/{jm}/{jd}")
+
+    _, gy, march = _jal_cal(jy)
+    ordinal = (
+        date(gy, 3, march).toordinal()
+        + (jm - 1) * 31 - _div(jm, 7) * (jm - 7)
+        + jd - 1
+    )
+    return date.fromordinal(ordinal)
+
+
+@lru_cache(maxsize=65536)
+def gregorian_to_jalali(value: date) -> Tuple[int, int, int]:
+    """
+    تبدیل تاریخ میلادی به شمسی
+
+    مثال:
+        gregorian_to_jalali(date(2023, 3, 21)) → (1402, 1, 1)
+    """
+    jy = value.year - 621
+    leap, gy, march = _jal_cal(jy)
+    k = value.toordinal() - date(gy, 3, march).toordinal()
+
+    if k >= 0:
+        if k <= 185:
+            return jy, 1 + _div(k, 31), _mod(k, 31) + 1
+        k -= 186
+    else:
+        jy -= 1
+        k += 179
+        if leap == 1:
+            k += 1
+
+    return jy, 7 + _div(k, 30), _mod(k, 30) + 1
+
+
+def today_jalali() -> Tuple[int, int, int]:
+    return gregorian_to_jalali(date.today())
+
+
+def jalali_month_range(jy: int, jm: int) -> Tuple[date, date]:
+    """
+    اولین و آخرین روز (میلادی) یک ماه شمسی
+    """
+    return (
+        jalali_to_gregorian(jy, jm, 1),
+        jalali_to_gregorian(jy, jm, jalali_month_length(jy, jm))
+    )
+
+
+def format_jalali(value: Optional[date]) -> Optional[str]:
+    """
+    date میلادی → رشته شمسی "YYYY/MM/DD"
+    """
+    if value is None:
+        return None
+    jy, jm, jd = gregorian_to_jalali(value)
+    return f"{jy:04d}/{jm:02d}/{jd:02d}"
+
+
+# ======================================================
+# Parse رشته‌ها
+# ======================================================
+_DIGITS = str.maketrans("۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩", "01234567890123456789")
+
+# سال/ماه/روز با جداکننده / - . (زمان بعد از تاریخ نادیده گرفته می‌شود)
+_DATE_RE = re.compile(r"^\s*(\d{4})[/\-.](\d{1,2})[/\-.](\d{1,2})(?:[\sT].*)?$")
+
+
+def _split_date(value) -> Optional[Tuple[int, int, int]]:
+    match = _DATE_RE.match(str(value).translate(_DIGITS))
+    if match is None:
+        return None
+    return int(match[1]), int(match[2]), int(match[3])
+
+
+@lru_cache(maxsize=65536)
+def _parse_jalali(value: str) -> Optional[date]:
+    parts = _split_date(value)
+    if parts is None:
+        return None
+    try:
+        return jalali_to_gregorian(*parts)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=65536)
+def _parse_gregorian(value: str) -> Optional[date]:
+    parts = _split_date(value)
+    if parts is None:
+        return None
+    try:
+        return date(*parts)
+    except ValueError:
+        return None
+
+
+def parse_jalali(value: Any) -> Optional[date]:
+    """
+    رشته شمسی → date میلادی (نامعتبر یا خالی → None)
+
+    ورودی‌های قابل قبول:
+        "1402/01/15"، "1402-1-15"، "۱۴۰۲/۰۱/۱۵"، "1402/01/15 10:30"
+    """
+    if value is None or value == "":
+        return None
+    return _parse_jalali(str(value))
+
+
+def parse_gregorian(value: Any) -> Optional[date]:
+    """
+    مقدار میلادی (date / datetime / رشته "2023-04-04") → date
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return _parse_gregorian(str(value))
+
+
+def parse_jalali_column(
+    values: Iterable[Any],
+    fallback: Optional[Iterable[Any]] = None
+) -> List[Optional[date]]:
+    """
+    تبدیل یک ستون کامل تاریخ شمسی به date میلادی
+
+    fallback:
+        ستون میلادی هم‌طول (مثل *Miladi) برای ردیف‌هایی که
+        تاریخ شمسی ندارند یا نامعتبر است
+    """
+    dates = [parse_jalali(value) for value in values]
+    if fallback is not None:
+        dates = [
+            parsed if parsed is not None else parse_gregorian(other)
+            for parsed, other in zip(dates, fallback)
+        ]
+    return dates
+
+
+# ======================================================
+# ایندکس مرتب (جستجوی بازه‌ای)
+# ======================================================
+class SortedIndex:
+    """
+    ایندکس فقط‌خواندنی: کلید مرتب‌شده → آیتم
+
+    ساخت: O(n log n)، جستجوی بازه: O(log n + k)
+
+    مثال:
+        index = SortedIndex((row_date, row) for row in rows)
+        index.between(date(2024, 1, 1), date(2024, 3, 31))
+    """
+
+    __slots__ = ("_keys", "_items")
+
+    def __init__(self, pairs: Iterable[Tuple[Any, Any]]):
+        ordered = sorted(
+            (pair for pair in pairs if pair[0] is not None),
+            key=lambda pair: pair[0]
+        )
+        self._keys = [key for key, _ in ordered]
+        self._items = [item for _, item in ordered]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def between(self, low: Any = None, high: Any = None) -> List[Any]:
+        """
+        آیتم‌هایی با low ≤ کلید ≤ high (به ترتیب کلید)
+
+        low / high = None → بدون محدودیت از آن سمت
+        """
+        start = 0 if low is None else bisect_left(self._keys, low)
+        end = len(self._keys) if high is None else bisect_right(self._keys, high)
+        return self._items[start:end]
@@ -0,0 +1,19 @@
+# backend/benchmarks/__init__.py
+
+"""
+Benchmark endpoint های ماژول HR
+
+اجرای برنامه در همان Process روی یک دیتابیس SQLite جایگزین (Stand-in)
+با سازمان مصنوعی (1 هزار تا 200 هزار نفر)، بدون نیاز به SQL Server.
+
+گزارش هر سناریو:
+    RPS، صدک‌های زمان پاسخ (p50 / p90 / p99 / max)، تعداد خطا
+    و Peak حافظه هر درخواست (tracemalloc، در یک اجرای جداگانه)
+
+اجرا (از پوشه backend):
+    python -m benchmarks --size 10000 --duration 5 --concurrency 8
+    python -m benchmarks --scenarios users,profile --save-baseline main
+    python -m benchmarks --compare main
+
+Baseline ها در benchmarks/baselines/<name>.json ذخیره می‌شوند.
+"""
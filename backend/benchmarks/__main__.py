@@ -0,0 +1,341 @@
+# backend/benchmarks/__main__.py
+
+"""
+اجرای Benchmark از خط فرمان
+
+نحوه اجرا (از پوشه backend):
+    python -m benchmarks --size 10000 --duration 5 --concurrency 8
+    python -m benchmarks --scenarios users,profile,sp-target-role
+    python -m benchmarks --save-baseline main
+    python -m benchmarks --compare main --threshold 15
+    python -m benchmarks --snapshot      → خواندن از Snapshot محلی (SQLite)
+
+مراحل:
+    1. ساخت دیتابیس SQLite موقت و سازمان مصنوعی
+    2. اجرای هر سناریو با concurrency Client به مدت duration ثانیه
+    3. اجرای جداگانه با tracemalloc (ترتیبی) برای Peak حافظه هر درخواست
+    4. گزارش / ذخیره Baseline / مقایسه با Baseline
+
+خروجی --compare در صورت افت بیشتر از threshold درصد، کد خروج 1 دارد.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+
+def _prepare_environment(workdir: str, snapshot: bool):
+    """
+    تنظیمات برنامه قبل از import شدن app (Settings تنبل است)
+    """
+    os.environ.update({
+        "SNAPSHOT_ENABLED": str(snapshot),
+        "SNAPSHOT_DB_PATH": os.path.join(workdir, "snapshot.sqlite3"),
+        "ENVIRONMENT": "DEV",
+        "DEBUG": "False",
+        "DEV_USER": "bench@eit",
+        "LOG_LEVEL": "WARNING",
+        "LOG_PATH": os.path.join(workdir, "app.log"),
+        "JOBS_DB_PATH": os.path.join(workdir, "jobs.sqlite3"),
+        "WARMUP_ENABLED": "False",
+        "MEMORY_TRACKING_ENABLED": "False",
+        "PROFILER_ENABLED": "False",
+    })
+    for key, value in {
+        "SECRET_KEY": "benchmark",
+        "DB_NAME": "bench",
+        "DB_USER": "bench",
+        "DB_PASSWORD": "bench",
+        "DB_HOST": "localhost",
+        "DB_PORT": "1433",
+        # سناریوهای Export توان عملیاتی را می‌سنجند، نه رد شدن (503)
+        # وقتی concurrency از سقف Export همزمان بیشتر است
+        "EXPORT_MAX_WORKERS": "8",
+    }.items():
+        os.environ.setdefault(key, value)
+
+
+# ======================================================
+# آمار
+# ======================================================
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """
+    صدک دقیق (Nearest Rank) روی مقادیر مرتب‌شده
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(percent / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def _summarize(latencies: List[float], errors: int, elapsed: float) -> Dict:
+    values = sorted(latencies)
+    count = len(values)
+    return {
+        "requests": count,
+        "errors": errors,
+        "rps": round(count / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(sum(values) / count * 1000, 3) if count else 0.0,
+        "p50_ms": round(_percentile(values, 50) * 1000, 3),
+        "p90_ms": round(_percentile(values, 90) * 1000, 3),
+        "p99_ms": round(_percentile(values, 99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3) if count else 0.0,
+    }
+
+
+async def _memory_pass(call, requests: int) -> Dict:
+    """
+    Peak حافظه هر درخواست (اجرای ترتیبی تا درخواست‌ها روی هم اثر نگذارند)
+    """
+    peaks = []
+    for _ in range(requests):
+        tracemalloc.reset_peak()
+        started, _ = tracemalloc.get_traced_memory()
+        await call()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(max(peak - started, 0))
+
+    peaks.sort()
+    return {
+        "mem_peak_p50_kb": round(_percentile(peaks, 50) / 1024, 1),
+        "mem_peak_max_kb": round(peaks[-1] / 1024, 1) if peaks else 0.0,
+    }
+
+
+# ======================================================
+# اجرا
+# ======================================================
+async def _run(args, org: Dict) -> Dict[str, Dict]:
+    from app.core.memory import _max_rss_bytes, start_tracing, stop_tracing
+    from app.main import app
+    from benchmarks import scenarios
+    from benchmarks.driver import ASGIDriver, run_load
+
+    selected = scenarios.select(
+        [name for name in args.scenarios.split(",") if name]
+    )
+    driver = ASGIDriver(app)
+    await driver.startup()
+
+    if args.snapshot:
+        from app.core.snapshot import sync_all
+        sync_all(force=True)
+
+    results: Dict[str, Dict] = {}
+    try:
+        for name, func in selected.items():
+            ctx = scenarios.Context(org, seed=args.seed)
+
+            async def call():
+                return await func(driver, ctx)
+
+            # گرم کردن (Cache ها، اولین اتصال)
+            for _ in range(args.warmup):
+                await call()
+
+            latencies, errors, elapsed = await run_load(
+                call, args.duration, args.concurrency
+            )
+            result = _summarize(latencies, errors, elapsed)
+
+            if args.memory_requests:
+                start_tracing()
+                try:
+                    result.update(
+                        await _memory_pass(call, args.memory_requests)
+                    )
+                finally:
+                    stop_tracing()
+
+            results[name] = result
+            _print_row(name, result)
+    finally:
+        await driver.shutdown()
+
+    print(f"\nmax RSS: {(_max_rss_bytes() or 0) / 1024 / 1024:.1f} MB")
+    return results
+
+
+_COLUMNS = (
+    ("rps", 9), ("p50_ms", 9), ("p90_ms", 9), ("p99_ms", 9),
+    ("max_ms", 9), ("errors", 7), ("mem_peak_p50_kb", 16),
+)
+
+
+def _print_header():
+    print(
+        f"{'scenario':28}"
+        + "".join(f"{column:>{width}}" for column, width in _COLUMNS)
+    )
+
+
+def _print_row(name: str, result: Dict):
+    print(
+        f"{name:28}"
+        + "".join(
+            f"{result.get(column, '-'):>{width}}" for column, width in _COLUMNS
+        )
+    )
+
+
+# ======================================================
+# Baseline
+# ======================================================
+def _save_baseline(name: str, report: Dict) -> Path:
+    BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+    path = BASELINE_DIR / f"{name}.json"
+    path.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    return path
+
+
+def _load_baseline(name: str) -> Optional[Dict]:
+    path = BASELINE_DIR / f"{name}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def _delta(current: float, base: float) -> Optional[float]:
+    if not base:
+        return None
+    return round((current - base) / base * 100, 1)
+
+
+def _compare(report: Dict, baseline: Dict, threshold: float) -> bool:
+    """
+    مقایسه با Baseline (درصد تغییر)؛ True اگر افت بیشتر از threshold باشد
+
+    افت یعنی: کاهش rps یا افزایش p50 / p99 / حافظه
+    """
+    if baseline["org"]["people"] != report["org"]["people"]:
+        print(
+            f"warning: baseline size {baseline['org']['people']} "
+            f"!= current size {report['org']['people']}"
+        )
+
+    regressed = False
+    print(f"\n{'scenario':28}{'rps %':>9}{'p50 %':>9}{'p99 %':>9}{'mem %':>9}")
+    for name, current in report["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:28}{'new':>9}")
+            continue
+
+        deltas = {
+            "rps": _delta(current["rps"], base["rps"]),
+            "p50_ms": _delta(current["p50_ms"], base["p50_ms"]),
+            "p99_ms": _delta(current["p99_ms"], base["p99_ms"]),
+            "mem_peak_p50_kb": _delta(
+                current.get("mem_peak_p50_kb", 0),
+                base.get("mem_peak_p50_kb", 0)
+            ),
+        }
+        worse = [
+            key for key, value in deltas.items()
+            if value is not None
+            and (-value if key == "rps" else value) > threshold
+        ]
+        regressed = regressed or bool(worse)
+
+        print(
+            f"{name:28}"
+            + "".join(
+                f"{'-' if value is None else f'{value:+.1f}':>9}"
+                for value in deltas.values()
+            )
+            + (f"   REGRESSED ({', '.join(worse)})" if worse else "")
+        )
+
+    return regressed
+
+
+# ======================================================
+# CLI
+# ======================================================
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--size", type=int, default=10000,
+                        help="تعداد افراد سازمان مصنوعی (1000 تا 200000)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=5.0,
+                        help="مدت اجرای هر سناریو (ثانیه)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=3,
+                        help="تعداد درخواست گرم کردن هر سناریو")
+    parser.add_argument("--memory-requests", type=int, default=20,
+                        help="تعداد درخواست اجرای حافظه (0 = بدون اندازه‌گیری)")
+    parser.add_argument("--scenarios", default="",
+                        help="نام سناریوها با کاما (خالی = همه)")
+    parser.add_argument("--snapshot", action="store_true",
+                        help="خواندن از Snapshot محلی (SNAPSHOT_ENABLED)")
+    parser.add_argument("--db", default=None,
+                        help="مسیر فایل SQLite (پیش‌فرض: پوشه موقت)")
+    parser.add_argument("--save-baseline", metavar="NAME")
+    parser.add_argument("--compare", metavar="NAME")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="درصد افت مجاز در مقایسه با Baseline")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        baseline = _load_baseline(args.compare)
+        if baseline is None:
+            parser.error(f"baseline not found: {args.compare}")
+
+    workdir = tempfile.mkdtemp(prefix="hr-bench-")
+    _prepare_environment(workdir, args.snapshot)
+
+    from benchmarks import dataset, standin
+
+    db_path = args.db or os.path.join(workdir, "standin.sqlite3")
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+    engine = standin.init_standin_engine(db_path)
+    standin.create_schema(engine)
+    org = dataset.generate(engine, args.size, seed=args.seed)
+    standin.install_stored_procedures()
+    print(
+        f"org: {org['people']} people, {org['teams']} teams, "
+        f"{org['roles']} roles, {org['user_team_roles']} assignments "
+        f"({org['generate_sec']}s)\n"
+    )
+
+    _print_header()
+    results = asyncio.run(_run(args, org))
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": {
+            "duration": args.duration,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "snapshot": args.snapshot,
+        },
+        "org": org,
+        "results": results,
+    }
+
+    if args.save_baseline:
+        path = _save_baseline(args.save_baseline, report)
+        print(f"baseline saved: {path}")
+
+    if baseline is not None:
+        return 1 if _compare(report, baseline, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
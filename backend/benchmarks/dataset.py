@@ -0,0 +1,273 @@
+# backend/benchmarks/dataset.py
+
+"""
+تولید سازمان مصنوعی (Synthetic Organization) برای Benchmark
+
+مسئولیت این فایل:
+- ساخت کاربران، تیم‌ها (درختی)، سمت‌ها، سوابق سمت در تیم
+  و جدول سمت‌های مقصد (V_HR_RoleTarget) با اندازه دلخواه
+- نتیجه با seed ثابت تکرارپذیر است
+
+اندازه‌ها (people = تعداد کاربران):
+    تیم‌ها      ≈ people / 25   (درخت با حداکثر 6 زیرتیم)
+    سمت‌ها      ≈ 20 + people / 2000
+    سوابق سمت   ≈ 1 تا 3 رکورد برای هر نفر (فقط یکی فعال)
+"""
+
+import random
+import time
+from typing import Dict, Iterator, List
+
+from sqlalchemy.engine import Engine
+
+FIRST_NAMES = (
+    "علی", "محمد", "حسین", "رضا", "مهدی", "زهرا", "فاطمه", "مریم",
+    "سارا", "نرگس", "امیر", "حمید", "لیلا", "مینا", "کاوه", "پریسا",
+)
+LAST_NAMES = (
+    "احمدی", "محمدی", "حسینی", "رضایی", "کریمی", "موسوی", "جعفری",
+    "صادقی", "رحیمی", "نوری", "سپهرکار", "کاظمی", "قاسمی", "طاهری",
+)
+ROLE_NAMES = (
+    "کارشناس", "کارشناس ارشد", "تحلیل‌گر", "برنامه‌نویس", "طراح",
+    "تستر", "پشتیبان", "سرپرست", "مدیر", "مشاور",
+)
+
+MANAGER_ROLE_ID = 1
+REQUEST_TYPES = (1, 2, 3)
+
+
+def _jalali(rng: random.Random, first_year: int, last_year: int) -> str:
+    return (
+        f"{rng.randint(first_year, last_year)}/"
+        f"{rng.randint(1, 12):02d}/{rng.randint(1, 29):02d}"
+    )
+
+
+def _national_code(index: int) -> str:
+    return f"{index + 1000000000:010d}"
+
+
+def _insert(engine: Engine, table: str, rows: List[Dict]):
+    if not rows:
+        return
+    columns = list(rows[0])
+    sql = (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)})"
+    )
+    raw = engine.raw_connection()
+    try:
+        raw.driver_connection.executemany(
+            sql, [tuple(row[c] for c in columns) for row in rows]
+        )
+        raw.commit()
+    finally:
+        raw.close()
+
+
+def _batched(rows: Iterator[Dict], size: int = 20000) -> Iterator[List[Dict]]:
+    batch: List[Dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# ======================================================
+# اجزای سازمان
+# ======================================================
+def _roles(role_count: int) -> List[Dict]:
+    roles = [{
+        "RoleId": MANAGER_ROLE_ID,
+        "RoleName": "مدیر تیم",
+        "HasLevel": 0,
+        "HasSuperior": 1,
+    }]
+    for role_id in range(2, role_count + 1):
+        roles.append({
+            "RoleId": role_id,
+            "RoleName": f"{ROLE_NAMES[role_id % len(ROLE_NAMES)]} {role_id}",
+            "HasLevel": int(role_id % 3 == 0),
+            "HasSuperior": int(role_id % 5 == 0),
+        })
+    return roles
+
+
+def _teams(rng: random.Random, team_count: int) -> List[Dict]:
+    """
+    تیم‌ها به صورت درخت: والد هر تیم یکی از تیم‌های قبلی است
+    """
+    teams = []
+    children: Dict[int, int] = {}
+    for index in range(team_count):
+        parent = None
+        if index:
+            # والد از میان تیم‌های قبلی که کمتر از 6 زیرتیم دارند
+            while True:
+                candidate = rng.randint(max(0, index - 50), index - 1)
+                if children.get(candidate, 0) < 6:
+                    break
+            children[candidate] = children.get(candidate, 0) + 1
+            parent = f"T{candidate:05d}"
+
+        teams.append({
+            "TeamCode": f"T{index:05d}",
+            "TeamName": f"تیم {index}",
+            "ActiveInService": int(rng.random() < 0.8),
+            "ActiveInEvaluation": int(rng.random() < 0.6),
+            "ParentTeamCode": parent,
+        })
+    return teams
+
+
+def _users(rng: random.Random, people: int) -> Iterator[Dict]:
+    for index in range(people):
+        contract = _jalali(rng, 1385, 1403)
+        yield {
+            "NationalCode": _national_code(index),
+            "UserName": f"u{index}@eit",
+            "FirstName": rng.choice(FIRST_NAMES),
+            "LastName": rng.choice(LAST_NAMES),
+            "FirstNameEnglish": None,
+            "LastNameEnglish": None,
+            "FatherName": rng.choice(FIRST_NAMES),
+            "Gender": rng.randint(0, 1),
+            "BirthDate": _jalali(rng, 1340, 1382),
+            "BirthDateMiladi": None,
+            "ContractDate": contract,
+            "ContractDateMiladi": None,
+            "ContractEndDate": (
+                _jalali(rng, 1403, 1406) if rng.random() < 0.4 else None
+            ),
+            "ContractEndDateMiladi": None,
+            "IsActive": int(rng.random() < 0.95),
+            "About": None,
+            "DegreeType": rng.randint(1, 6),
+            "MarriageStatus": rng.randint(0, 1),
+            "MilitaryStatus": rng.randint(0, 3),
+            "Religion": 1,
+            "ContractType": rng.randint(1, 4),
+            "UserStatus": 1,
+            "BirthCity": rng.randint(1, 400),
+            "IdentityCity": rng.randint(1, 400),
+            "LivingAddress": None,
+        }
+
+
+def _user_team_roles(
+    rng: random.Random,
+    people: int,
+    team_count: int,
+    role_count: int
+) -> Iterator[Dict]:
+    """
+    هر نفر: یک سمت فعال و 0 تا 2 سابقه قبلی
+    نفر i ام از ابتدای لیست، مدیر تیم i ام است
+    """
+    for index in range(people):
+        national_code = _national_code(index)
+        is_manager = index < team_count
+        team = index if is_manager else rng.randrange(team_count)
+
+        year = rng.randint(1385, 1395)
+        for _ in range(rng.randint(0, 2)):
+            end_year = year + rng.randint(1, 3)
+            yield {
+                "NationalCode": national_code,
+                "TeamCode": f"T{rng.randrange(team_count):05d}",
+                "RoleId": rng.randint(2, role_count),
+                "LevelId": rng.randint(1, 4),
+                "Superior": 0,
+                "StartDate": f"{year}/01/01",
+                "EndDate": f"{end_year}/01/01",
+            }
+            year = end_year
+
+        yield {
+            "NationalCode": national_code,
+            "TeamCode": f"T{team:05d}",
+            "RoleId": (
+                MANAGER_ROLE_ID if is_manager
+                else rng.randint(2, role_count)
+            ),
+            "LevelId": rng.randint(1, 4),
+            "Superior": int(is_manager),
+            "StartDate": f"{year}/01/01",
+            "EndDate": None,
+        }
+
+
+def _role_targets(rng: random.Random, role_count: int) -> Iterator[Dict]:
+    for role_id in range(1, role_count + 1):
+        for request_type in REQUEST_TYPES:
+            for _ in range(rng.randint(1, 4)):
+                yield {
+                    "RoleID": role_id,
+                    "LevelID": rng.randint(1, 4),
+                    "TargetRoleID": rng.randint(1, role_count),
+                    "TargetLevelID": rng.randint(1, 4),
+                    "RequestType": request_type,
+                    "Superior": rng.random() < 0.2,
+                    "SuperiorTarget": rng.random() < 0.2,
+                    "Education": rng.random() < 0.5,
+                    "Evaluation": rng.random() < 0.5,
+                    "PmChange": rng.random() < 0.3,
+                    "ITChange": rng.random() < 0.3,
+                }
+
+
+# ======================================================
+# تولید کامل
+# ======================================================
+def generate(engine: Engine, people: int, seed: int = 1) -> Dict:
+    """
+    پر کردن دیتابیس Stand-in با یک سازمان مصنوعی
+
+    خروجی: اندازه‌های سازمان (برای سناریوهای Benchmark)
+    """
+    started = time.perf_counter()
+    rng = random.Random(seed)
+
+    team_count = max(people // 25, 2)
+    role_count = 20 + people // 2000
+
+    _insert(engine, "Role", _roles(role_count))
+
+    teams = _teams(rng, team_count)
+    _insert(engine, "Team", [
+        {key: value for key, value in team.items() if key != "ParentTeamCode"}
+        for team in teams
+    ])
+    _insert(engine, "BenchTeamParent", [
+        {"TeamCode": t["TeamCode"], "ParentTeamCode": t["ParentTeamCode"]}
+        for t in teams
+    ])
+
+    for batch in _batched(_users(rng, people)):
+        _insert(engine, "Users", batch)
+
+    assignments = 0
+    for batch in _batched(
+        _user_team_roles(rng, people, team_count, role_count)
+    ):
+        _insert(engine, "UserTeamRole", batch)
+        assignments += len(batch)
+
+    targets = 0
+    for batch in _batched(_role_targets(rng, role_count)):
+        _insert(engine, "HR_RoleTarget", batch)
+        targets += len(batch)
+
+    return {
+        "people": people,
+        "teams": team_count,
+        "roles": role_count,
+        "user_team_roles": assignments,
+        "role_targets": targets,
+        "seed": seed,
+        "generate_sec": round(time.perf_counter() - started, 2),
+    }
@@ -0,0 +1,196 @@
+# backend/benchmarks/driver.py
+
+"""
+اجرای درخواست‌ها روی برنامه ASGI در همان Process (بدون Socket)
+
+مسئولیت این فایل:
+- ارسال درخواست HTTP مستقیم به app (مثل یک سرور ASGI ساده)
+- اجرای رویدادهای lifespan (startup / shutdown)
+- اجرای همزمان چند Client با asyncio
+
+چرا httpx/TestClient نه؟
+- وابستگی جدید لازم نیست
+- سربار Client کمتر است و زمان اندازه‌گیری‌شده به برنامه نزدیک‌تر است
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+
+class Response:
+
+    __slots__ = ("status", "headers", "body")
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class ASGIDriver:
+    """
+    Client درون‌برنامه‌ای برای یک برنامه ASGI
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._lifespan_task: Optional[asyncio.Task] = None
+        self._lifespan_send: Optional[asyncio.Queue] = None
+        self._lifespan_receive: Optional[asyncio.Queue] = None
+
+    # --------------------------------------------------
+    # lifespan
+    # --------------------------------------------------
+    async def startup(self):
+        self._lifespan_send = asyncio.Queue()
+        self._lifespan_receive = asyncio.Queue()
+
+        async def receive():
+            return await self._lifespan_send.get()
+
+        async def send(message):
+            await self._lifespan_receive.put(message)
+
+        scope = {"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}
+        self._lifespan_task = asyncio.ensure_future(
+            self.app(scope, receive, send)
+        )
+
+        await self._lifespan_send.put({"type": "lifespan.startup"})
+        message = await self._lifespan_receive.get()
+        if message["type"] != "lifespan.startup.complete":
+            raise RuntimeError(f"Startup failed: {message}")
+
+    async def shutdown(self):
+        if self._lifespan_task is None:
+            return
+        await self._lifespan_send.put({"type": "lifespan.shutdown"})
+        await self._lifespan_receive.get()
+        await self._lifespan_task
+        self._lifespan_task = None
+
+    # --------------------------------------------------
+    # http
+    # --------------------------------------------------
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict] = None,
+        json_body=None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Response:
+        raw_headers: List[Tuple[bytes, bytes]] = [
+            (key.lower().encode("latin-1"), value.encode("latin-1"))
+            for key, value in (headers or {}).items()
+        ]
+
+        if json_body is not None:
+            content = json.dumps(json_body).encode("utf-8")
+            raw_headers.append((b"content-type", b"application/json"))
+        body = content or b""
+        raw_headers.append((b"content-length", str(len(body)).encode()))
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method.upper(),
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode("utf-8"),
+            "query_string": urlencode(params or {}, doseq=True).encode(),
+            "root_path": "",
+            "headers": raw_headers,
+            "client": ("127.0.0.1", 50000),
+            "server": ("bench", 80),
+            "state": {},
+        }
+
+        request_sent = False
+        disconnected = asyncio.Event()
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        status = 0
+        response_headers: Dict[str, str] = {}
+        chunks: List[bytes] = []
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                for key, value in message.get("headers", ()):
+                    response_headers[key.decode("latin-1")] = value.decode("latin-1")
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        try:
+            await self.app(scope, receive, send)
+        except Exception:
+            # مثل سرور: خطای برنامه → 500 (اگر پاسخی شروع نشده باشد)
+            if not status:
+                status = 500
+        finally:
+            disconnected.set()
+
+        return Response(status, response_headers, b"".join(chunks))
+
+
+# ======================================================
+# اجرای همزمان
+# ======================================================
+async def run_load(
+    call,
+    duration: float,
+    concurrency: int,
+    max_requests: Optional[int] = None
+) -> Tuple[List[float], int, float]:
+    """
+    اجرای call توسط concurrency Client تا پایان duration ثانیه
+
+    call: تابع async که یک درخواست می‌فرستد و Response برمی‌گرداند
+
+    خروجی: (زمان هر درخواست موفق به ثانیه، تعداد خطا، زمان کل)
+    """
+    latencies: List[float] = []
+    errors = 0
+    sent = 0
+    started = time.perf_counter()
+    deadline = started + duration
+
+    async def client():
+        nonlocal errors, sent
+        while time.perf_counter() < deadline:
+            if max_requests is not None and sent >= max_requests:
+                return
+            sent += 1
+
+            request_started = time.perf_counter()
+            try:
+                response = await call()
+                ok = response.status < 400
+            except Exception:
+                ok = False
+            elapsed = time.perf_counter() - request_started
+
+            if ok:
+                latencies.append(elapsed)
+            else:
+                errors += 1
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
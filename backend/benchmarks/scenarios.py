@@ -0,0 +1,418 @@
+# backend/benchmarks/scenarios.py
+
+"""
+سناریوهای Benchmark (یک سناریو برای هر endpoint در /api/hr)
+
+هر سناریو یک تابع است که با (driver, ctx) یک درخواست async می‌سازد.
+ctx اطلاعات سازمان مصنوعی (اندازه‌ها) و یک Random با seed ثابت دارد.
+
+سناریوهای نوشتنی (bulk / import) در هر اجرا داده جدید اضافه می‌کنند؛
+برای مقایسه دقیق با Baseline، Benchmark روی دیتابیس تازه اجرا می‌شود.
+"""
+
+import itertools
+import random
+from typing import Callable, Dict, List
+
+from benchmarks.dataset import MANAGER_ROLE_ID, REQUEST_TYPES
+from benchmarks.driver import ASGIDriver, Response
+
+PREFIX = "/api/hr"
+
+
+class Context:
+    """
+    اطلاعات مشترک سناریوها
+    """
+
+    def __init__(self, org: Dict, seed: int = 1):
+        self.people = org["people"]
+        self.teams = org["teams"]
+        self.roles = org["roles"]
+        self.rng = random.Random(seed)
+        self.sequence = itertools.count()
+
+    def national_code(self) -> str:
+        return f"{self.rng.randrange(self.people) + 1000000000:010d}"
+
+    def team_code(self) -> str:
+        return f"T{self.rng.randrange(self.teams):05d}"
+
+    def manager_code(self) -> str:
+        # نفر i ام مدیر تیم i ام است (dataset)
+        return f"{self.rng.randrange(self.teams) + 1000000000:010d}"
+
+    def role_id(self) -> int:
+        return self.rng.randint(1, self.roles)
+
+    def new_national_code(self) -> str:
+        # بعد از محدوده کاربران مصنوعی (بدون تداخل)
+        return f"{next(self.sequence) + 5000000000:010d}"
+
+
+SCENARIOS: Dict[str, Callable] = {}
+
+
+def scenario(name: str):
+    def register(func):
+        SCENARIOS[name] = func
+        return func
+    return register
+
+
+# ======================================================
+# Users / Roles
+# ======================================================
+@scenario("users")
+async def users(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request("GET", f"{PREFIX}/users")
+
+
+@scenario("users-dict")
+async def users_dict(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "GET", f"{PREFIX}/users", params={"return_dict": "true"}
+    )
+
+
+@scenario("user")
+async def user(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "GET", f"{PREFIX}/users/{ctx.national_code()}"
+    )
+
+
+@scenario("profile")
+async def profile(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "GET", f"{PREFIX}/users/{ctx.national_code()}/profile"
+    )
+
+
+@scenario("roles")
+async def roles(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request("GET", f"{PREFIX}/roles")
+
+
+@scenario("user-roles")
+async def user_roles(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "GET", f"{PREFIX}/users/{ctx.national_code()}/roles"
+    )
+
+
+@scenario("user-team-roles")
+async def user_team_roles(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "GET", f"{PREFIX}/users/{ctx.national_code()}/team-roles"
+    )
+
+
+@scenario("user-role-history")
+async def user_role_history(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "GET",
+        f"{PREFIX}/users/{ctx.national_code()}/role-history",
+        params={"date_from": "1395/01/01", "date_to": "1400/12/29"}
+    )
+
+
+@scenario("role-holders")
+async def role_holders(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "GET",
+        f"{PREFIX}/team-roles/holders",
+        params={
+            "team_code": ctx.team_code(),
+            "role_id": ctx.role_id(),
+            "on": f"{ctx.rng.randint(1390, 1403)}/06/01",
+        }
+    )
+
+
+@scenario("team-roster")
+async def team_roster(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "GET",
+        f"{PREFIX}/team-roles/roster",
+        params={"team_code": ctx.team_code()}
+    )
+
+
+@scenario("management-chain")
+async def management_chain(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "GET", f"{PREFIX}/users/{ctx.national_code()}/management-chain"
+    )
+
+
+@scenario("subordinates")
+async def subordinates(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "GET", f"{PREFIX}/users/{ctx.manager_code()}/subordinates"
+    )
+
+
+@scenario("org-chart")
+async def org_chart(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request("GET", f"{PREFIX}/org-chart")
+
+
+@scenario("me")
+async def me(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request("GET", f"{PREFIX}/me")
+
+
+# ======================================================
+# نوشتن گروهی
+# ======================================================
+@scenario("team-roles-bulk")
+async def team_roles_bulk(driver: ASGIDriver, ctx: Context) -> Response:
+    rows = [
+        {
+            "NationalCode": ctx.national_code(),
+            "TeamCode": ctx.team_code(),
+            "RoleId": ctx.role_id(),
+            "LevelId": 1,
+            "Superior": False,
+            "StartDate": "1404/01/01",
+        }
+        for _ in range(50)
+    ]
+    return await driver.request(
+        "POST", f"{PREFIX}/team-roles/bulk", json_body=rows
+    )
+
+
+@scenario("team-roles-bulk-end")
+async def team_roles_bulk_end(driver: ASGIDriver, ctx: Context) -> Response:
+    rows = [
+        {
+            "NationalCode": ctx.national_code(),
+            "TeamCode": ctx.team_code(),
+            "RoleId": ctx.role_id(),
+            "EndDate": "1404/06/01",
+        }
+        for _ in range(50)
+    ]
+    return await driver.request(
+        "POST", f"{PREFIX}/team-roles/bulk-end", json_body=rows
+    )
+
+
+_USER_COLUMNS = (
+    "NationalCode", "UserName", "FirstName", "LastName", "Gender",
+    "BirthDate", "ContractDate", "IsActive",
+)
+
+
+@scenario("import-users")
+async def import_users(driver: ASGIDriver, ctx: Context) -> Response:
+    lines = [",".join(_USER_COLUMNS)]
+    for _ in range(200):
+        national_code = ctx.new_national_code()
+        lines.append(
+            f"{national_code},n{national_code}@eit,نام,نام خانوادگی,1,"
+            f"1370/01/01,1400/01/01,1"
+        )
+    return await driver.request(
+        "POST",
+        f"{PREFIX}/import/users",
+        content="\n".join(lines).encode("utf-8"),
+        headers={"Content-Type": "text/csv"}
+    )
+
+
+@scenario("contracts-ending")
+async def contracts_ending(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "GET",
+        f"{PREFIX}/users/contracts",
+        params={"field": "end", "within_days": ctx.rng.choice((30, 90, 365))}
+    )
+
+
+@scenario("contracts-started")
+async def contracts_started(driver: ASGIDriver, ctx: Context) -> Response:
+    year = ctx.rng.randint(1390, 1402)
+    return await driver.request(
+        "GET",
+        f"{PREFIX}/users/contracts",
+        params={"date_from": f"{year}/01/01", "date_to": f"{year}/06/31"}
+    )
+
+
+@scenario("birthdays")
+async def birthdays(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "GET",
+        f"{PREFIX}/users/birthdays",
+        params={"month": ctx.rng.randint(1, 12)}
+    )
+
+
+# ======================================================
+# Views
+# ======================================================
+@scenario("view-role-target")
+async def view_role_target(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "POST",
+        f"{PREFIX}/view/role-target",
+        json_body={
+            "RoleID": ctx.role_id(),
+            "RequestType": ctx.rng.choice(REQUEST_TYPES),
+        }
+    )
+
+
+@scenario("view-role-target-in")
+async def view_role_target_in(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "POST",
+        f"{PREFIX}/view/role-target",
+        json_body={
+            "RequestType": ctx.rng.choice(REQUEST_TYPES),
+            "RoleID": [ctx.role_id() for _ in range(ctx.rng.randint(2, 12))],
+            "LevelID": {"gte": 1, "lte": 3},
+        }
+    )
+
+
+@scenario("view-role-team")
+async def view_role_team(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "POST",
+        f"{PREFIX}/view/role-team",
+        params={"team_code": ctx.team_code()},
+        json_body=[ctx.role_id() for _ in range(5)]
+    )
+
+
+@scenario("role-graph-reachable")
+async def role_graph_reachable(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "GET",
+        f"{PREFIX}/role-graph/reachable",
+        params={
+            "role_id": ctx.role_id(),
+            "request_type": ctx.rng.choice(REQUEST_TYPES),
+        }
+    )
+
+
+@scenario("role-graph-path")
+async def role_graph_path(driver: ASGIDriver, ctx: Context) -> Response:
+    response = await driver.request(
+        "GET",
+        f"{PREFIX}/role-graph/path",
+        params={"from_role": ctx.role_id(), "to_role": ctx.role_id()}
+    )
+    # مسیر نداشتن (404) خطا حساب نمی‌شود
+    if response.status == 404:
+        response.status = 200
+    return response
+
+
+@scenario("role-graph-closure")
+async def role_graph_closure(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "GET",
+        f"{PREFIX}/role-graph/closure",
+        params={"request_type": ctx.rng.choice(REQUEST_TYPES)}
+    )
+
+
+@scenario("export-users")
+async def export_users(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request("GET", f"{PREFIX}/export/users")
+
+
+@scenario("export-user-team-roles")
+async def export_user_team_roles(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "GET", f"{PREFIX}/export/user-team-roles",
+        params={"fmt": "ndjson", "gzip": "true"}
+    )
+
+
+# ======================================================
+# Stored Procedures
+# ======================================================
+@scenario("sp-target-role")
+async def sp_target_role(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "POST",
+        f"{PREFIX}/sp/get-target-role",
+        params={
+            "info_id": ctx.rng.randrange(100000),
+            "request_type": ctx.rng.choice(REQUEST_TYPES),
+        }
+    )
+
+
+def _assessors_params(ctx: Context) -> Dict:
+    return {
+        "team_code": ctx.team_code(),
+        "info_id": ctx.rng.randrange(100000),
+        "role_id_target": ctx.role_id(),
+        "level_id_target": 1,
+        "superior_target": 0,
+    }
+
+
+@scenario("sp-assessors-educators")
+async def sp_assessors(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "POST",
+        f"{PREFIX}/sp/get-assessors-educators",
+        params=_assessors_params(ctx)
+    )
+
+
+@scenario("sp-assessors-educators-all")
+async def sp_assessors_all(driver: ASGIDriver, ctx: Context) -> Response:
+    return await driver.request(
+        "POST",
+        f"{PREFIX}/sp/get-assessors-educators/all",
+        params=_assessors_params(ctx)
+    )
+
+
+# ======================================================
+# Background Jobs (ثبت → وضعیت → نتیجه / لغو)
+# ======================================================
+@scenario("jobs")
+async def jobs_flow(driver: ASGIDriver, ctx: Context) -> Response:
+    submitted = await driver.request(
+        "POST",
+        f"{PREFIX}/jobs/sp-get-team-manager",
+        json_body={"role_id": MANAGER_ROLE_ID, "team_code": ctx.team_code()}
+    )
+    if submitted.status >= 400:
+        return submitted
+
+    job_id = submitted.json()["id"]
+    response = await driver.request("GET", f"{PREFIX}/jobs/{job_id}")
+    if response.status >= 400:
+        return response
+
+    if response.json()["status"] == "succeeded":
+        return await driver.request("GET", f"{PREFIX}/jobs/{job_id}/result")
+    return await driver.request("DELETE", f"{PREFIX}/jobs/{job_id}")
+
+
+def select(names: List[str]) -> Dict[str, Callable]:
+    """
+    انتخاب سناریوها با نام (خالی = همه)
+    """
+    if not names:
+        return dict(SCENARIOS)
+
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise KeyError(
+            f"Unknown scenarios: {', '.join(unknown)} "
+            f"(available: {', '.join(SCENARIOS)})"
+        )
+    return {name: SCENARIOS[name] for name in names}
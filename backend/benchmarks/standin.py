@@ -0,0 +1,310 @@
+# backend/benchmarks/standin.py
+
+"""
+دیتابیس جایگزین (Stand-in) SQLite برای Benchmark
+
+مسئولیت این فایل:
+- ساخت جدول‌ها و View های HR با همان نام و ستون‌هایی که Repository می‌خواند
+    Users, Team, HR_Team, Role, UserTeamRole,
+    V_AllUserList, V_UserTeamRole, V_HR_RoleTarget, V_RoleTeam
+- پیاده‌سازی Python برای Stored Procedure های HR
+    HR_GetTargetRole, HR_GetAssessorsAndEducators, HR_GetTeamManager
+- جایگزین کردن اجرای SP در app.modules.hr.repository با این پیاده‌سازی‌ها
+
+نکته:
+    جدول BenchTeamParent فقط برای شبیه‌سازی SP ها (ساختار درختی تیم‌ها) است
+    و در دیتابیس اصلی وجود ندارد.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core import database
+from app.modules.hr import repository
+
+
+# ======================================================
+# Schema
+# ======================================================
+SCHEMA = """
+CREATE TABLE Users (
+    NationalCode TEXT PRIMARY KEY,
+    UserName TEXT,
+    FirstName TEXT,
+    LastName TEXT,
+    FirstNameEnglish TEXT,
+    LastNameEnglish TEXT,
+    FatherName TEXT,
+    Gender INTEGER,
+    BirthDate TEXT,
+    BirthDateMiladi TEXT,
+    ContractDate TEXT,
+    ContractDateMiladi TEXT,
+    ContractEndDate TEXT,
+    ContractEndDateMiladi TEXT,
+    IsActive INTEGER,
+    About TEXT,
+    DegreeType INTEGER,
+    MarriageStatus INTEGER,
+    MilitaryStatus INTEGER,
+    Religion INTEGER,
+    ContractType INTEGER,
+    UserStatus INTEGER,
+    BirthCity INTEGER,
+    IdentityCity INTEGER,
+    LivingAddress INTEGER
+);
+CREATE UNIQUE INDEX IX_Users_UserName ON Users (UserName);
+
+CREATE TABLE Team (
+    TeamCode TEXT PRIMARY KEY,
+    TeamName TEXT,
+    ActiveInService INTEGER,
+    ActiveInEvaluation INTEGER
+);
+
+CREATE TABLE BenchTeamParent (
+    TeamCode TEXT PRIMARY KEY,
+    ParentTeamCode TEXT
+);
+
+CREATE TABLE Role (
+    RoleId INTEGER PRIMARY KEY,
+    RoleName TEXT,
+    HasLevel INTEGER,
+    HasSuperior INTEGER
+);
+
+CREATE TABLE UserTeamRole (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    NationalCode TEXT,
+    TeamCode TEXT,
+    RoleId INTEGER,
+    LevelId INTEGER,
+    Superior INTEGER,
+    StartDate TEXT,
+    EndDate TEXT
+);
+CREATE INDEX IX_UserTeamRole_NationalCode ON UserTeamRole (NationalCode);
+CREATE INDEX IX_UserTeamRole_TeamCode ON UserTeamRole (TeamCode, EndDate);
+
+CREATE TABLE HR_RoleTarget (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    RoleID INTEGER,
+    LevelID INTEGER,
+    TargetRoleID INTEGER,
+    TargetLevelID INTEGER,
+    RequestType INTEGER,
+    Superior INTEGER NOT NULL DEFAULT 0,
+    SuperiorTarget INTEGER NOT NULL DEFAULT 0,
+    Education INTEGER NOT NULL DEFAULT 0,
+    Evaluation INTEGER NOT NULL DEFAULT 0,
+    PmChange INTEGER NOT NULL DEFAULT 0,
+    ITChange INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IX_HR_RoleTarget_RoleID ON HR_RoleTarget (RoleID, RequestType);
+
+CREATE VIEW HR_Team AS
+    SELECT * FROM Team;
+
+CREATE VIEW V_AllUserList AS
+    SELECT NationalCode, UserName, FirstName, LastName, Gender,
+           ContractDate, ContractEndDate, BirthDate, IsActive
+    FROM Users;
+
+CREATE VIEW V_UserTeamRole AS
+    SELECT utr.id, utr.NationalCode, u.FirstName, u.LastName,
+           utr.TeamCode, t.TeamName, utr.RoleId, r.RoleName,
+           utr.LevelId, utr.Superior, utr.StartDate, utr.EndDate
+    FROM UserTeamRole utr
+    JOIN Users u ON u.NationalCode = utr.NationalCode
+    JOIN Team t ON t.TeamCode = utr.TeamCode
+    JOIN Role r ON r.RoleId = utr.RoleId;
+
+CREATE VIEW V_HR_RoleTarget AS
+    SELECT rt.id, rt.RoleID, r.RoleName, rt.LevelID,
+           rt.TargetRoleID AS RoleTargetID, tr.RoleName AS RoleTargetName,
+           rt.TargetLevelID AS LevelIdTargetID,
+           rt.Superior, rt.SuperiorTarget, rt.Education, rt.Evaluation,
+           rt.PmChange, rt.ITChange, rt.RequestType
+    FROM HR_RoleTarget rt
+    JOIN Role r ON r.RoleId = rt.RoleID
+    JOIN Role tr ON tr.RoleId = rt.TargetRoleID;
+
+CREATE VIEW V_RoleTeam AS
+    SELECT DISTINCT TeamCode, RoleId AS RoleID
+    FROM UserTeamRole
+    WHERE EndDate IS NULL;
+"""
+
+
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+
+
+def init_standin_engine(path: str) -> Engine:
+    """
+    ساخت Engine برنامه روی فایل SQLite (به جای SQL Server)
+    """
+    engine = database.init_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+        pool_pre_ping=False,
+    )
+    event.listen(engine, "connect", _sqlite_pragmas)
+    return engine
+
+
+def create_schema(engine: Engine):
+    """
+    ساخت جدول‌ها و View ها
+    """
+    raw = engine.raw_connection()
+    try:
+        raw.driver_connection.executescript(SCHEMA)
+        raw.commit()
+    finally:
+        raw.close()
+
+
+# ======================================================
+# Stored Procedure ها (پیاده‌سازی Python)
+# ======================================================
+_CURRENT_MEMBER = """
+    SELECT u.NationalCode, u.FirstName, u.LastName,
+           utr.TeamCode, utr.RoleId, utr.LevelId, utr.Superior
+    FROM UserTeamRole utr
+    JOIN Users u ON u.NationalCode = utr.NationalCode
+    WHERE utr.EndDate IS NULL
+"""
+
+
+def hr_get_target_role(ID: int, Type: int) -> List[Dict]:
+    """
+    HR_GetTargetRole: سمت‌های مقصد مجاز برای سمت درخواست‌دهنده
+
+    ID شناسه درخواست است؛ اینجا سمت درخواست از روی آن انتخاب می‌شود.
+    """
+    role_count = database.execute_query_one(
+        "SELECT COUNT(*) AS n FROM Role"
+    )["n"] or 1
+    return database.execute_query(
+        """
+        SELECT *
+        FROM V_HR_RoleTarget
+        WHERE RoleID = :role_id AND RequestType = :request_type
+        """,
+        {"role_id": ID % role_count + 1, "request_type": Type}
+    )
+
+
+def _team_manager(team_code: Optional[str]) -> List[Dict]:
+    if team_code is None:
+        return []
+    return database.execute_query(
+        _CURRENT_MEMBER + " AND utr.TeamCode = :team AND utr.Superior = 1",
+        {"team": team_code}
+    )
+
+
+def _parent_team(team_code: str) -> Optional[str]:
+    row = database.execute_query_one(
+        "SELECT ParentTeamCode FROM BenchTeamParent WHERE TeamCode = :team",
+        {"team": team_code}
+    )
+    return row["ParentTeamCode"] if row else None
+
+
+def hr_get_assessors_educators(
+    TeamCode: str,
+    InfoID: int,
+    RoleIdTarget: int,
+    LevelIdTarget: int,
+    SuperiorTarget: int,
+    Temporary: int,
+    Type: int
+) -> List[List[Dict]]:
+    """
+    HR_GetAssessorsAndEducators (دو Result Set)
+
+    - ارزیاب‌ها: مدیر تیم و مدیر تیم بالاتر
+    - آموزش‌دهنده‌ها: اعضای فعلی تیم با سمت مقصد
+    """
+    assessors = _team_manager(TeamCode) + _team_manager(
+        _parent_team(TeamCode)
+    )
+    educators = database.execute_query(
+        _CURRENT_MEMBER + " AND utr.TeamCode = :team AND utr.RoleId = :role",
+        {"team": TeamCode, "role": RoleIdTarget}
+    )
+    return [assessors, educators]
+
+
+def hr_get_team_manager(RoleId: int, TeamCode: str) -> List[Dict]:
+    """
+    HR_GetTeamManager: مدیر یک سمت در یک تیم
+
+    اگر خود سمت، سمت مدیر تیم باشد، مدیر تیم بالاتر برگردانده می‌شود.
+    """
+    managers = _team_manager(TeamCode)
+    if any(row["RoleId"] == RoleId for row in managers):
+        return _team_manager(_parent_team(TeamCode))
+    return managers
+
+
+STORED_PROCEDURES = {
+    "dbo.HR_GetTargetRole": hr_get_target_role,
+    "dbo.HR_GetAssessorsAndEducators": hr_get_assessors_educators,
+    "dbo.HR_GetTeamManager": hr_get_team_manager,
+}
+
+
+def _result_sets(sp_name: str, params: Optional[Dict]) -> List[List[Dict]]:
+    try:
+        procedure = STORED_PROCEDURES[sp_name]
+    except KeyError:
+        raise NotImplementedError(f"No stand-in for {sp_name}") from None
+
+    result = procedure(**(params or {}))
+    if result and isinstance(result[0], list):
+        return result
+    return [result]
+
+
+def fake_execute_sp_with_result(sp_name: str, params: Optional[Dict] = None):
+    """
+    جایگزین execute_sp_with_result (فقط اولین Result Set)
+    """
+    return _result_sets(sp_name, params)[0]
+
+
+def fake_execute_sp_multi_result(
+    sp_name: str,
+    params: Optional[Dict] = None,
+    names: Optional[Sequence[str]] = None
+):
+    """
+    جایگزین execute_sp_multi_result
+    """
+    result_sets = _result_sets(sp_name, params)
+    if names is None:
+        return result_sets
+
+    named: Dict[str, List[Dict]] = {name: [] for name in names}
+    for index, rows in enumerate(result_sets):
+        named[names[index] if index < len(names) else str(index)] = rows
+    return named
+
+
+def install_stored_procedures():
+    """
+    جایگزینی اجرای SP در Repository ماژول HR
+    """
+    repository.execute_sp_with_result = fake_execute_sp_with_result
+    repository.execute_sp_multi_result = fake_execute_sp_multi_result
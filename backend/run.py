@@ -6,55 +6,142 @@
 مسئولیت این فایل:
 - اجرای برنامه FastAPI با Uvicorn
 - تشخیص محیط DEV / PRODUCTION
-- تعیین Host و Port
+- تعیین Host و Port و تنظیمات Production از روی Settings
 - جایگزین manage.py در Django
 
 نحوه اجرا:
     python run.py
+    python run.py --print-config     → فقط نمایش تنظیمات نهایی سرور
+
+تنظیمات Production (در فایل env):
+    SERVER_WORKERS=0                  → یک Worker به ازای هر هسته CPU
+    SERVER_LOOP=uvloop                → (اگر نصب باشد)
+    SERVER_HTTP=httptools             → (اگر نصب باشد)
+    SERVER_LIMIT_CONCURRENCY=200
+    SERVER_LIMIT_MAX_REQUESTS=50000   → بازیابی دوره‌ای Worker ها
+
+نکته:
+    هر Worker یک Process جداست با Pool دیتابیس، Cache و Warm-up خودش؛
+    حداکثر اتصال به دیتابیس = Workers × (DB_POOL_SIZE + DB_MAX_OVERFLOW)
 """
 
+import importlib.util
+import os
+import sys
+
 import uvicorn
 from app.core.config import settings
 
 
-def main():
+def _available(module_name: str) -> bool:
     """
-    نقطه شروع اجرای برنامه
+    آیا یک پکیج اختیاری (uvloop / httptools) نصب است؟
+    """
+    return importlib.util.find_spec(module_name) is not None
+
+
+def _worker_count() -> int:
+    """
+    تعداد Worker ها
+
+    - SERVER_WORKERS=0 → تعداد هسته‌های CPU
+    - روی ویندوز (پشت IIS) یک Worker (پایدارتر)
+    """
+    if sys.platform == "win32":
+        return 1
+
+    if settings.SERVER_WORKERS > 0:
+        return settings.SERVER_WORKERS
+
+    return os.cpu_count() or 1
+
+
+def _implementation(name: str, value: str, optional_module: str) -> str:
+    """
+    اگر پیاده‌سازی اختیاری خواسته شده ولی نصب نیست، auto استفاده می‌شود
+    """
+    if value == optional_module and not _available(optional_module):
+        print(f"{name}={value} requested but not installed; using auto")
+        return "auto"
+    return value
+
+
+def server_options() -> dict:
+    """
+    تنظیمات نهایی Uvicorn
     """
 
     # ===============================
-    # تنظیمات اجرای سرور
+    # تنظیمات مشترک
     # ===============================
 
     # در DEV معمولاً روی localhost
-    # در PROD روی 127.0.0.1 پشت IIS
-    host = "127.0.0.1"
-    port = 8000
+    # در PROD روی 127.0.0.1 پشت Reverse Proxy (IIS / Nginx)
+    options = {
+        "host": settings.SERVER_HOST,
+        "port": settings.SERVER_PORT,
+        "log_level": settings.LOG_LEVEL.lower(),
+    }
 
     # در محیط توسعه:
     # - reload فعال
     # - یک worker
     if settings.ENVIRONMENT == "DEV":
-        reload = True
-        workers = 1
-    else:
-        # در Production:
-        # - reload خاموش
-        # - workers = 1 (روی ویندوز پایدارتر)
-        reload = False
-        workers = 1
+        options.update(reload=True, workers=1)
+        return options
+
+    # در Production:
+    # - reload خاموش
+    # - چند Worker و تنظیمات صف/اتصال از Settings
+    options.update(
+        reload=False,
+        workers=_worker_count(),
+        loop=_implementation("SERVER_LOOP", settings.SERVER_LOOP, "uvloop"),
+        http=_implementation(
+            "SERVER_HTTP", settings.SERVER_HTTP, "httptools"
+        ),
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_SEC,
+        limit_concurrency=settings.SERVER_LIMIT_CONCURRENCY,
+        limit_max_requests=settings.SERVER_LIMIT_MAX_REQUESTS,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT_SEC,
+        proxy_headers=settings.SERVER_PROXY_HEADERS,
+        forwarded_allow_ips=settings.SERVER_FORWARDED_ALLOW_IPS,
+        access_log=settings.DEBUG,
+    )
+    return options
+
+
+def main():
+    """
+    نقطه شروع اجرای برنامه
+    """
+    options = server_options()
+
+    workers = options["workers"]
+    max_db_connections = workers * (
+        settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    )
+    print(
+        f"HR server: {settings.ENVIRONMENT} | workers={workers} | "
+        f"max DB connections={max_db_connections}"
+    )
+
+    if "--print-config" in sys.argv:
+        for key, value in options.items():
+            print(f"  {key:<26}: {value}")
+        return
+
+    # Worker ها Settings را دوباره از محیط می‌خوانند؛
+    # تعداد واقعی Worker ها (مثلاً برای انتخاب Handler فایل لاگ) به آن‌ها می‌رسد
+    os.environ["SERVER_WORKERS"] = str(workers)
 
     # ===============================
     # اجرای Uvicorn
     # ===============================
-    uvicorn.run(
-        "app.main:app",
-        host=host,
-        port=port,
-        reload=reload,
-        workers=workers,
-        log_level="info"
-    )
+    # با limit_max_requests، Worker بعد از تعداد مشخصی درخواست خارج می‌شود
+    # و Process اصلی Uvicorn یک Worker تازه جایگزین آن می‌کند.
+    uvicorn.run("app.main:app", **options)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,89 @@
+# backend/tests/test_changes.py
+
+"""
+تست get_changes (Delta Sync با Change Tracking) بدون SQL Server
+
+توابع repository جایگزین می‌شوند؛ ردیف‌ها مثل execute_query از نوع
+RowMapping (تغییرناپذیر) هستند.
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.modules.hr import repository, service
+
+
+def _row_mappings(rows):
+    """
+    ساخت RowMapping واقعی (مثل خروجی execute_query)
+    """
+    engine = create_engine("sqlite://")
+    columns = list(rows[0])
+    select = " UNION ALL ".join(
+        "SELECT " + ", ".join(f":{col}_{i} AS {col}" for col in columns)
+        for i in range(len(rows))
+    )
+    params = {
+        f"{col}_{i}": row[col] for i, row in enumerate(rows) for col in columns
+    }
+    with engine.connect() as conn:
+        return conn.execute(text(select), params).mappings().all()
+
+
+USER_CHANGES = [
+    {"ChangeOperation": "I", "ChangeVersion": 11, "Key_NationalCode": "1",
+     "NationalCode": "1", "UserName": "new"},
+    {"ChangeOperation": "U", "ChangeVersion": 12, "Key_NationalCode": "2",
+     "NationalCode": "2", "UserName": "changed"},
+    {"ChangeOperation": "D", "ChangeVersion": 13, "Key_NationalCode": "3",
+     "NationalCode": None, "UserName": None},
+    # تغییر کرده ولی همزمان حذف شده (LEFT JOIN خالی)
+    {"ChangeOperation": "U", "ChangeVersion": 14, "Key_NationalCode": "4",
+     "NationalCode": None, "UserName": None},
+]
+
+
+@pytest.fixture
+def change_tracking(monkeypatch):
+    monkeypatch.setattr(repository, "change_tracking_supported", lambda: True)
+    monkeypatch.setattr(
+        repository, "get_change_tracking_versions",
+        lambda names: {
+            "current": 20,
+            "min_valid": {name: 5 for name in names},
+        }
+    )
+    monkeypatch.setattr(
+        repository, "get_table_changes",
+        lambda name, since, limit: _row_mappings(USER_CHANGES)
+    )
+
+
+def test_split_and_keys(change_tracking):
+    result = service.get_changes("ct.10", ["users"])
+
+    assert result["token"] == "ct.20"
+    assert result["resync"] is False
+    assert result["tables"]["users"] == {
+        "inserted": [{"NationalCode": "1", "UserName": "new"}],
+        "updated": [{"NationalCode": "2", "UserName": "changed"}],
+        "deleted": [{"NationalCode": "3"}, {"NationalCode": "4"}],
+    }
+
+
+@pytest.mark.parametrize("since, reason", [
+    (None, "no_token"),
+    ("ct.4", "token_expired"),
+    ("ct.21", "token_expired"),
+])
+def test_resync(change_tracking, since, reason):
+    result = service.get_changes(since, ["users"])
+
+    assert result == {
+        "token": "ct.20", "resync": True, "reason": reason, "tables": {}
+    }
+
+
+def test_invalid_token(change_tracking):
+    with pytest.raises(ValueError):
+        service.get_changes("ct.x", ["users"])
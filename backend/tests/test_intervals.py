@@ -0,0 +1,78 @@
+# backend/tests/test_intervals.py
+
+"""
+تست درخت بازه (app.shared.intervals) در مقایسه با جستجوی ساده (Brute Force)
+"""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from app.shared.intervals import IntervalTree
+
+
+def _random_intervals(rng: random.Random, count: int, span: int):
+    intervals = []
+    for item in range(count):
+        start = rng.randint(0, span)
+        end = start + rng.choice((0, 1, rng.randint(0, span // 4), span))
+        intervals.append((start, end, item))
+    return intervals
+
+
+def _stab(intervals, point):
+    return sorted(item for start, end, item in intervals if start <= point <= end)
+
+
+def _overlap(intervals, low, high):
+    return sorted(
+        item for start, end, item in intervals if start <= high and end >= low
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_stab_matches_brute_force(seed):
+    rng = random.Random(seed)
+    intervals = _random_intervals(rng, 300, 200)
+    tree = IntervalTree(intervals)
+
+    assert len(tree) == len(intervals)
+    for point in range(-5, 260):
+        assert sorted(tree.stab(point)) == _stab(intervals, point)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_overlap_matches_brute_force(seed):
+    rng = random.Random(seed)
+    intervals = _random_intervals(rng, 300, 200)
+    tree = IntervalTree(intervals)
+
+    for _ in range(500):
+        low = rng.randint(-10, 260)
+        high = low + rng.randint(0, 60)
+        assert sorted(tree.overlap(low, high)) == _overlap(intervals, low, high)
+
+
+def test_closed_bounds_and_open_end():
+    start = date(2023, 3, 21)
+    tree = IntervalTree([
+        (start, start + timedelta(days=10), "a"),
+        (start + timedelta(days=10), date.max, "b"),
+    ])
+
+    assert tree.stab(start) == ["a"]
+    assert sorted(tree.stab(start + timedelta(days=10))) == ["a", "b"]
+    assert tree.stab(date(2100, 1, 1)) == ["b"]
+    assert tree.stab(start - timedelta(days=1)) == []
+    assert tree.overlap(date(2000, 1, 1), start - timedelta(days=1)) == []
+
+
+def test_invalid_and_empty_intervals():
+    tree = IntervalTree([(5, 1, "reversed"), (3, 3, "point")])
+
+    assert len(tree) == 1
+    assert tree.stab(3) == ["point"]
+    assert tree.stab(4) == []
+    assert IntervalTree([]).stab(1) == []
+    assert IntervalTree([]).overlap(0, 10) == []
@@ -0,0 +1,105 @@
+# backend/tests/test_jalali.py
+
+"""
+تست تبدیل تاریخ شمسی ↔ میلادی (app.shared.utils)
+
+- سال‌های کبیسه شناخته‌شده
+- آخر ماه‌ها (31 / 30 / 29 یا 30 اسفند)
+- رفت‌وبرگشت همه روزها در یک بازه طولانی
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.shared.utils import (
+    format_jalali,
+    gregorian_to_jalali,
+    is_jalali_leap,
+    jalali_month_length,
+    jalali_month_range,
+    jalali_to_gregorian,
+    parse_jalali,
+)
+
+# نوروز (1 فروردین) سال‌های شمسی
+NOWRUZ = {
+    1395: date(2016, 3, 20),
+    1399: date(2020, 3, 20),
+    1400: date(2021, 3, 21),
+    1402: date(2023, 3, 21),
+    1403: date(2024, 3, 20),
+    1404: date(2025, 3, 21),
+    1405: date(2026, 3, 21),
+}
+
+
+@pytest.mark.parametrize("jy", [1370, 1375, 1379, 1383, 1387, 1391, 1395, 1399, 1403, 1408])
+def test_known_leap_years(jy):
+    assert is_jalali_leap(jy)
+    assert jalali_month_length(jy, 12) == 30
+
+
+@pytest.mark.parametrize("jy", [1398, 1400, 1401, 1402, 1404, 1405, 1406, 1407])
+def test_known_common_years(jy):
+    assert not is_jalali_leap(jy)
+    assert jalali_month_length(jy, 12) == 29
+    with pytest.raises(ValueError):
+        jalali_to_gregorian(jy, 12, 30)
+
+
+@pytest.mark.parametrize("jy, nowruz", sorted(NOWRUZ.items()))
+def test_nowruz(jy, nowruz):
+    assert jalali_to_gregorian(jy, 1, 1) == nowruz
+    assert gregorian_to_jalali(nowruz) == (jy, 1, 1)
+    # روز قبل → آخرین روز اسفند سال قبل
+    last_day = 30 if is_jalali_leap(jy - 1) else 29
+    assert gregorian_to_jalali(nowruz - timedelta(days=1)) == (jy - 1, 12, last_day)
+
+
+@pytest.mark.parametrize("jalali, gregorian", [
+    ((1402, 6, 31), date(2023, 9, 22)),
+    ((1402, 7, 1), date(2023, 9, 23)),
+    ((1402, 11, 30), date(2024, 2, 19)),
+    ((1402, 12, 29), date(2024, 3, 19)),
+    ((1403, 12, 30), date(2025, 3, 20)),
+    ((1399, 12, 30), date(2021, 3, 20)),
+])
+def test_month_ends(jalali, gregorian):
+    assert jalali_to_gregorian(*jalali) == gregorian
+    assert gregorian_to_jalali(gregorian) == jalali
+
+
+@pytest.mark.parametrize("jm, length", [(1, 31), (6, 31), (7, 30), (11, 30)])
+def test_month_lengths(jm, length):
+    assert jalali_month_length(1402, jm) == length
+    first, last = jalali_month_range(1402, jm)
+    assert (last - first).days + 1 == length
+
+
+@pytest.mark.parametrize("jalali", [(1402, 0, 1), (1402, 13, 1), (1402, 7, 31), (1402, 1, 0)])
+def test_invalid_dates(jalali):
+    with pytest.raises(ValueError):
+        jalali_to_gregorian(*jalali)
+
+
+def test_round_trip_every_day():
+    day = date(1950, 1, 1)
+    previous = gregorian_to_jalali(day - timedelta(days=1))
+
+    while day <= date(2060, 12, 31):
+        jalali = gregorian_to_jalali(day)
+        assert jalali_to_gregorian(*jalali) == day
+        assert jalali > previous
+        assert 1 <= jalali[2] <= jalali_month_length(jalali[0], jalali[1])
+        previous = jalali
+        day += timedelta(days=1)
+
+
+def test_parse_and_format():
+    assert parse_jalali("1402/01/15") == date(2023, 4, 4)
+    assert parse_jalali("۱۴۰۲/۰۱/۱۵") == date(2023, 4, 4)
+    assert parse_jalali("1402-1-15 10:30") == date(2023, 4, 4)
+    assert parse_jalali("1402/12/30") is None
+    assert parse_jalali("") is None
+    assert format_jalali(date(2023, 4, 4)) == "1402/01/15"
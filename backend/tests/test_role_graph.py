@@ -0,0 +1,103 @@
+# backend/tests/test_role_graph.py
+
+"""
+تست گراف جابه‌جایی سمت‌ها (app.modules.hr.role_graph) روی یک گراف کوچک
+
+گراف (RoleID, LevelID):
+    (1,1) → (2,1) → (3,1) → (4,1)     RequestType 1
+    (1,1) → (3,2)                      RequestType 2
+    (2, بدون سطح) → (5,1)              RequestType 1 (برای همه سطح‌های سمت 2)
+    (6,1) → (7,1) → (6,1)              حلقه
+"""
+
+from app.modules.hr.role_graph import (
+    _closure,
+    _Graph,
+    _reachable,
+    _shortest_path,
+)
+
+
+def _row(role, level, target, target_level, request_type):
+    return {
+        "RoleID": role,
+        "LevelID": level,
+        "RoleTargetID": target,
+        "LevelIdTargetID": target_level,
+        "RequestType": request_type,
+    }
+
+
+ROWS = [
+    _row(1, 1, 2, 1, 1),
+    _row(2, 1, 3, 1, 1),
+    _row(3, 1, 4, 1, 1),
+    _row(1, 1, 3, 2, 2),
+    _row(2, None, 5, 1, 1),
+    _row(6, 1, 7, 1, 1),
+    _row(7, 1, 6, 1, 1),
+]
+
+
+def _graph():
+    return _Graph(ROWS, 1)
+
+
+def test_bfs_distances_and_parents():
+    seen = _graph().bfs([(1, 1)], request_type=1)
+
+    assert seen[(1, 1)] == (0, None)
+    assert seen[(2, 1)] == (1, (1, 1))
+    assert seen[(3, 1)] == (2, (2, 1))
+    assert seen[(5, 1)] == (2, (2, 1))      # یال بدون سطح سمت 2
+    assert seen[(4, 1)] == (3, (3, 1))
+    assert (3, 2) not in seen               # فقط RequestType 2
+
+
+def test_bfs_max_depth():
+    seen = _graph().bfs([(1, 1)], request_type=None, max_depth=1)
+    assert set(seen) == {(1, 1), (2, 1), (3, 2)}
+
+
+def test_reachable_sorted_by_distance():
+    result = _reachable(_graph(), 1, 1, None, None)
+
+    assert result == (
+        ((2, 1), 1),
+        ((3, 2), 1),
+        ((3, 1), 2),
+        ((5, 1), 2),
+        ((4, 1), 3),
+    )
+
+
+def test_shortest_path():
+    graph = _graph()
+
+    assert _shortest_path(graph, 1, 1, 4, 1, None) == ((1, 1), (2, 1), (3, 1), (4, 1))
+    # هر سطحی از سمت 3 → نزدیک‌ترین (3,2) با RequestType 2
+    assert _shortest_path(graph, 1, 1, 3, None, None) == ((1, 1), (3, 2))
+    assert _shortest_path(graph, 1, 1, 3, None, 1) == ((1, 1), (2, 1), (3, 1))
+    assert _shortest_path(graph, 4, 1, 1, None, None) is None
+
+
+def test_closure():
+    closure = _closure(_graph(), 1)
+
+    assert closure[1] == {2, 3, 4, 5}
+    assert closure[2] == {3, 4, 5}
+    assert closure[4] == frozenset()
+    # حلقه: گره شروع جزو نتیجه نیست
+    assert closure[6] == {7}
+    assert closure[7] == {6}
+
+
+def test_closure_matches_reachable():
+    graph = _graph()
+    closure = _closure(graph, None)
+
+    for role_id in graph.nodes_by_role:
+        reachable = {
+            node[0] for node, _ in _reachable(graph, role_id, None, None, None)
+        }
+        assert reachable == closure[role_id]